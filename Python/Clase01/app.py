@@ -9,6 +9,10 @@ Autor: [Tu nombre]
 Fecha: Agosto 2025
 """
 
+import time
+# Inicio del proceso: el tiempo de arranque incluye importar los módulos
+_INICIO_PROCESO = time.perf_counter()
+
 import sys
 import os
 
@@ -17,7 +21,10 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.ui.menu_app_usuario import MenuAppUsuario
 from src.database.conexion import Conexion
+from src.utils.contrasenas import Contrasenas
 from src.utils.logger_base import LoggerBase
+from src.utils.metricas import ServidorMetricas
+from config.database_config import DatabaseConfig
 from colorama import init, Fore, Style
 
 # Inicializar colorama para Windows
@@ -25,9 +32,11 @@ init()
 
 def main():
     """Función principal de la aplicación"""
+    inicio = time.perf_counter()
     try:
-        # Configurar logger
+        # Configurar logger (crea los handlers de consola y archivos)
         logger = LoggerBase().logger
+        duracion_logging = time.perf_counter() - inicio
         logger.info("=== INICIANDO APLICACIÓN DE GESTIÓN DE USUARIOS ===")
         
         print(f"{Fore.CYAN}{'='*70}")
@@ -38,11 +47,27 @@ def main():
         print(f"✅ Pool de conexiones configurado")
         print(f"✅ Sistema de logging activo{Style.RESET_ALL}\n")
         
-        # Probar conexión a BD antes de iniciar menú
-        logger.info("Verificando conexión a base de datos...")
-        pool = Conexion.obtenerPool()
-        if pool:
-            logger.info("✅ Conexión a base de datos exitosa")
+        # Exponer métricas para un scraper local (DB_METRICS_PORT > 0)
+        if DatabaseConfig.METRICS_PORT > 0:
+            ServidorMetricas.iniciar()
+        
+        # Abrir el pool según DB_POOL_STARTUP: eager conecta ahora (en
+        # paralelo), lazy deja la primera conexión para la primera consulta
+        logger.info("Preparando pool de conexiones (modo %s)...", DatabaseConfig.POOL_STARTUP)
+        inicio_pool = time.perf_counter()
+        modo_pool = Conexion.iniciar_pool()
+        if modo_pool:
+            duracion_pool = time.perf_counter() - inicio_pool
+            if modo_pool == 'eager':
+                logger.info("✅ Conexión a base de datos exitosa")
+            Conexion.iniciar_muestreo()
+            
+            total = time.perf_counter() - _INICIO_PROCESO
+            logger.info("⏱️  Arranque en %.1f ms (imports %.1f ms, logging %.1f ms, pool %s %.1f ms)",
+                        total * 1000, (inicio - _INICIO_PROCESO) * 1000, duracion_logging * 1000,
+                        modo_pool, duracion_pool * 1000)
+            print(f"{Fore.CYAN}⏱️  Arranque: {total * 1000:.1f} ms "
+                  f"(pool {modo_pool}: {duracion_pool * 1000:.1f} ms){Style.RESET_ALL}\n")
             
             # Crear instancia del menú y mostrar
             menu = MenuAppUsuario()
@@ -61,9 +86,13 @@ def main():
         # Cerrar conexiones al finalizar
         try:
             Conexion.cerrarConexiones()
+            Contrasenas.cerrar()
             logger.info("=== APLICACIÓN FINALIZADA ===")
         except Exception as e:
             logger.error(f"Error al cerrar conexiones: {e}")
+        finally:
+            # Vacía la cola de logs si la escritura es asíncrona
+            LoggerBase().log_shutdown_info()
 
 if __name__ == "__main__":
     main()
@@ -27,6 +27,58 @@ class DatabaseConfig:
     MIN_CONNECTIONS: int = int(os.getenv('DB_MIN_CONN', '1'))
     MAX_CONNECTIONS: int = int(os.getenv('DB_MAX_CONN', '5'))
     
+    # Modo del pool: 'seguro' (thread-safe, con espera) o 'simple' (SimpleConnectionPool)
+    POOL_MODE: str = os.getenv('DB_POOL_MODE', 'seguro')
+    POOL_TIMEOUT: float = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+    POOL_MAX_LIFETIME: float = float(os.getenv('DB_POOL_MAX_LIFETIME', '3600'))
+    POOL_IDLE_CHECK: float = float(os.getenv('DB_POOL_IDLE_CHECK', '30'))
+    # Arranque del pool: 'eager' (abre conexiones al iniciar) o 'lazy' (la primera al primer uso)
+    POOL_STARTUP: str = os.getenv('DB_POOL_STARTUP', 'eager')
+    # Conexiones abiertas en paralelo al iniciar en modo eager (0 = MIN_CONNECTIONS)
+    POOL_WARMUP: int = int(os.getenv('DB_POOL_WARMUP', '0'))
+    # Hilos que abren esas conexiones (0 = uno por conexión, 1 = de a una)
+    POOL_WARMUP_THREADS: int = int(os.getenv('DB_POOL_WARMUP_THREADS', '0'))
+    # Segundos entre muestras de estadísticas del pool en el log (0 = sin muestreo)
+    POOL_STATS_INTERVAL: float = float(os.getenv('DB_POOL_STATS_INTERVAL', '0'))
+    
+    # Réplicas de lectura: 'host:puerto' separados por coma (vacío = todo va al primario)
+    REPLICA_HOSTS: str = os.getenv('DB_REPLICA_HOSTS', '')
+    # Elección de réplica: 'round_robin' o 'menos_ocupada' (menos conexiones en uso)
+    REPLICA_STRATEGY: str = os.getenv('DB_REPLICA_STRATEGY', 'round_robin')
+    # Segundos tras una escritura en los que ese hilo/tarea sigue leyendo del primario (0 = desactivado)
+    READ_YOUR_WRITES_SECONDS: float = float(os.getenv('DB_READ_YOUR_WRITES_SECONDS', '5'))
+    
+    # Reintentos de operaciones idempotentes ante errores transitorios (1 = sin reintentos)
+    RETRY_ATTEMPTS: int = int(os.getenv('DB_RETRY_ATTEMPTS', '3'))
+    # Espera exponencial con jitter: tope de la primera espera y de todas (segundos)
+    RETRY_BASE_SECONDS: float = float(os.getenv('DB_RETRY_BASE_SECONDS', '0.1'))
+    RETRY_MAX_SECONDS: float = float(os.getenv('DB_RETRY_MAX_SECONDS', '2'))
+    # Disyuntor: fallos de conexión seguidos que lo abren (0 = desactivado) y segundos abierto
+    CIRCUIT_FAILURES: int = int(os.getenv('DB_CIRCUIT_FAILURES', '5'))
+    CIRCUIT_OPEN_SECONDS: float = float(os.getenv('DB_CIRCUIT_OPEN_SECONDS', '30'))
+    
+    # Sentencias preparadas por conexión (PREPARE una vez, luego EXECUTE)
+    PREPARED_STATEMENTS: bool = os.getenv('DB_PREPARED_STATEMENTS', 'false').lower() == 'true'
+    
+    # Cache en memoria para lecturas del DAO (seleccionar_por_id, contar_usuarios)
+    CACHE_ENABLED: bool = os.getenv('DB_CACHE_ENABLED', 'false').lower() == 'true'
+    CACHE_MAX_SIZE: int = int(os.getenv('DB_CACHE_MAX_SIZE', '1024'))
+    CACHE_TTL: float = float(os.getenv('DB_CACHE_TTL', '60'))
+    
+    # Conteo por defecto de contar_usuarios(): 'exacto' (COUNT(*)), 'estimado'
+    # (pg_class.reltuples) o 'contador' (tabla usuario_conteo mantenida por triggers)
+    COUNT_STRATEGY: str = os.getenv('DB_COUNT_STRATEGY', 'exacto')
+    
+    # Consultas lentas: umbral en ms (0 = desactivado) y captura del plan con EXPLAIN
+    SLOW_QUERY_MS: float = float(os.getenv('DB_SLOW_QUERY_MS', '500'))
+    SLOW_QUERY_EXPLAIN: bool = os.getenv('DB_SLOW_QUERY_EXPLAIN', 'true').lower() == 'true'
+    SLOW_QUERY_EXPLAIN_INTERVAL: float = float(os.getenv('DB_SLOW_QUERY_EXPLAIN_INTERVAL', '60'))
+    
+    # Métricas de latencia y contadores (RegistroMetricas); puerto 0 = sin servidor HTTP
+    METRICS_ENABLED: bool = os.getenv('DB_METRICS_ENABLED', 'true').lower() == 'true'
+    METRICS_PORT: int = int(os.getenv('DB_METRICS_PORT', '0'))
+    METRICS_HOST: str = os.getenv('DB_METRICS_HOST', '127.0.0.1')
+    
     @classmethod
     def get_connection_string(cls) -> str:
         """Retorna el string de conexión para PostgreSQL"""
@@ -0,0 +1,46 @@
+"""
+Configuración de Logging
+========================
+
+Centraliza la configuración del sistema de logging
+"""
+
+import os
+from dataclasses import dataclass
+from dotenv import load_dotenv
+
+# Cargar variables del archivo .env
+load_dotenv()
+
+@dataclass
+class LoggingConfig:
+    """Configuración del sistema de logging"""
+
+    # Nivel mínimo del logger principal (los registros por debajo ni se crean)
+    LEVEL: str = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+    # Registros DEBUG por consulta del DAO, cursores y pool (false = desactivados)
+    DAO_DEBUG: bool = os.getenv('LOG_DAO_DEBUG', 'false').lower() == 'true'
+
+    # Formato de los archivos de log: 'text' o 'json' (un objeto por línea)
+    FORMAT: str = os.getenv('LOG_FORMAT', 'text').lower()
+
+    # Escritura asíncrona: los handlers de consola y archivo corren en un hilo aparte
+    ASYNC: bool = os.getenv('LOG_ASYNC', 'false').lower() == 'true'
+
+    # Máximo de registros pendientes en la cola (0 = sin límite)
+    QUEUE_SIZE: int = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+
+    # Cola llena: 'drop' descarta DEBUG/INFO sin esperar, 'block' espera lugar
+    QUEUE_POLICY: str = os.getenv('LOG_QUEUE_POLICY', 'drop').lower()
+
+    # Rotación por tamaño (MB, 0 = sin límite) y por tiempo ('midnight', 'H', 'D', ...)
+    MAX_MB: float = float(os.getenv('LOG_MAX_MB', '10'))
+    ROTATION_WHEN: str = os.getenv('LOG_ROTATION_WHEN', 'midnight')
+
+    # Retención de archivos rotados (0 = sin límite)
+    BACKUP_COUNT: int = int(os.getenv('LOG_BACKUP_COUNT', '14'))
+    RETENTION_DAYS: int = int(os.getenv('LOG_RETENTION_DAYS', '30'))
+
+    # Comprimir con gzip los archivos rotados
+    COMPRESS: bool = os.getenv('LOG_COMPRESS', 'true').lower() == 'true'
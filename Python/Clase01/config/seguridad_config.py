@@ -0,0 +1,31 @@
+"""
+Configuración de Seguridad
+==========================
+
+Centraliza los parámetros del hash de contraseñas
+"""
+
+import os
+from dataclasses import dataclass
+from dotenv import load_dotenv
+
+# Cargar variables del archivo .env
+load_dotenv()
+
+@dataclass
+class SeguridadConfig:
+    """Configuración del hash de contraseñas (KDF)"""
+
+    # Algoritmo para hashes nuevos: 'scrypt' o 'pbkdf2_sha256'
+    PASSWORD_ALGORITHM: str = os.getenv('PASSWORD_ALGORITHM', 'scrypt').lower()
+
+    # Costo de scrypt: N (potencia de 2), r y p; N=16384, r=8 usa 16 MB por hash
+    SCRYPT_N: int = int(os.getenv('PASSWORD_SCRYPT_N', '16384'))
+    SCRYPT_R: int = int(os.getenv('PASSWORD_SCRYPT_R', '8'))
+    SCRYPT_P: int = int(os.getenv('PASSWORD_SCRYPT_P', '1'))
+
+    # Iteraciones de PBKDF2-HMAC-SHA256
+    PBKDF2_ITERATIONS: int = int(os.getenv('PASSWORD_PBKDF2_ITERATIONS', '600000'))
+
+    # Hilos del pool que calcula los hashes (0 = uno por núcleo)
+    HASH_WORKERS: int = int(os.getenv('PASSWORD_HASH_WORKERS', '0'))
@@ -0,0 +1,79 @@
+"""
+Benchmark de Hash de Contraseñas
+================================
+
+Mide el costo del KDF configurado (PASSWORD_ALGORITHM y sus parámetros)
+sin necesitar base de datos:
+  1. Milisegundos por hash y hashes por segundo en un solo núcleo
+  2. Throughput del pool de Contrasenas con 1..N hilos (hashear_lote),
+     que escala con los núcleos porque hashlib libera el GIL
+
+Sirve para elegir el costo: cada login paga un hash completo, y una
+importación de N usuarios paga N hashes repartidos entre los núcleos.
+
+Uso:
+    python scripts/benchmark_contrasenas.py [hashes] [hilos_max]
+"""
+
+import sys
+import os
+import time
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.contrasenas import Contrasenas
+from colorama import init, Fore, Style
+
+init()
+
+HASHES_POR_DEFECTO = 32
+
+
+def medir_un_nucleo(cantidad: int) -> float:
+    """Segundos por hash calculando en el hilo actual"""
+    inicio = time.perf_counter()
+    for i in range(cantidad):
+        Contrasenas.calcular_hash(f'clave_{i}')
+    return (time.perf_counter() - inicio) / cantidad
+
+
+def medir_pool(cantidad: int, hilos: int) -> float:
+    """Hashes por segundo de hashear_lote() con `hilos` hilos"""
+    Contrasenas.configurar(trabajadores=hilos)
+    Contrasenas.hashear_lote(['calentamiento'] * hilos)
+    inicio = time.perf_counter()
+    Contrasenas.hashear_lote([f'clave_{i}' for i in range(cantidad)])
+    return cantidad / (time.perf_counter() - inicio)
+
+
+def main():
+    """Ejecuta el benchmark del KDF"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else HASHES_POR_DEFECTO
+    nucleos = os.cpu_count() or 1
+    hilos_max = int(sys.argv[2]) if len(sys.argv) > 2 else nucleos
+    parametros = Contrasenas.parametros[Contrasenas.algoritmo]
+
+    print(f"{Fore.CYAN}⏱️  BENCHMARK DE HASH DE CONTRASEÑAS ({Contrasenas.algoritmo} {parametros}, "
+          f"{nucleos} núcleos){Style.RESET_ALL}")
+
+    segundos = medir_un_nucleo(cantidad)
+    print(f"\n{Fore.CYAN}📊 Un núcleo{Style.RESET_ALL}")
+    print(f"   • {segundos * 1000:.1f} ms por hash")
+    print(f"   • {1 / segundos:.1f} hashes/s por núcleo")
+
+    print(f"\n{Fore.CYAN}📊 Pool de hilos (hashear_lote){Style.RESET_ALL}")
+    base = None
+    try:
+        for hilos in sorted({1, *range(2, hilos_max + 1, max(hilos_max // 4, 1)), hilos_max}):
+            por_segundo = medir_pool(cantidad, hilos)
+            base = base or por_segundo
+            print(f"   • {hilos:3d} hilos: {por_segundo:8.1f} hashes/s "
+                  f"({Fore.GREEN}{por_segundo / base:.1f}x{Style.RESET_ALL}, "
+                  f"{por_segundo / min(hilos, nucleos):.1f}/s por núcleo)")
+    finally:
+        Contrasenas.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark de Lecturas de Solo Lectura
+=====================================
+
+Mide la latencia por lectura de la consulta de seleccionar_por_id()
+contra la base de datos configurada (requiere PostgreSQL):
+
+  1. Transaccional: BEGIN + SELECT + COMMIT (tres viajes al servidor),
+     como hacía CursorDelPool con todas las lecturas
+  2. Solo lectura: la conexión en autocommit, solo el SELECT (un viaje)
+
+Ambos modos usan el primario y el mismo pool, así la diferencia es solo
+el costo de abrir y cerrar la transacción. Con la base en otra máquina
+la diferencia crece con la latencia de red.
+
+Uso:
+    python scripts/benchmark_lecturas.py [lecturas]
+"""
+
+import sys
+import os
+import statistics
+import time
+from typing import List
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.dao.usuario_dao import UsuarioDao
+from src.database.conexion import Conexion
+from src.database.cursor_del_pool import CursorDelPool
+from colorama import init, Fore, Style
+
+init()
+
+LECTURAS_POR_DEFECTO = 2000
+
+
+def medir(lecturas: int, id_usuario: int, solo_lectura: bool) -> List[float]:
+    """Milisegundos de cada lectura con el modo indicado"""
+    tiempos = []
+    for _ in range(lecturas):
+        inicio = time.perf_counter()
+        with CursorDelPool(solo_lectura=solo_lectura) as cursor:
+            cursor.execute(UsuarioDao._SELECCIONAR_POR_ID, (id_usuario,))
+            cursor.fetchone()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return tiempos
+
+
+def resumen(nombre: str, tiempos: List[float]) -> float:
+    """Imprime promedio, p50 y p95; retorna el promedio"""
+    percentiles = statistics.quantiles(tiempos, n=20)
+    promedio = statistics.fmean(tiempos)
+    print(f"   • {nombre:14s}: {promedio:6.3f} ms promedio  "
+          f"p50 {percentiles[9]:6.3f} ms  p95 {percentiles[18]:6.3f} ms")
+    return promedio
+
+
+def main() -> int:
+    """Ejecuta el benchmark de lecturas"""
+    lecturas = int(sys.argv[1]) if len(sys.argv) > 1 else LECTURAS_POR_DEFECTO
+    print(f"{Fore.CYAN}⏱️  BENCHMARK DE LECTURAS ({lecturas} por modo){Style.RESET_ALL}")
+
+    try:
+        if Conexion.obtenerPool() is None:
+            print(f"{Fore.RED}❌ No se pudo conectar a la base de datos{Style.RESET_ALL}")
+            return 1
+
+        with CursorDelPool(solo_lectura=True) as cursor:
+            cursor.execute("SELECT COALESCE(MIN(id_usuario), 0) FROM usuario")
+            id_usuario = cursor.fetchone()[0]
+
+        # Calentamiento: conexiones abiertas y planes en cache en ambos modos
+        medir(min(lecturas, 100), id_usuario, False)
+        medir(min(lecturas, 100), id_usuario, True)
+
+        print(f"\n{Fore.CYAN}📊 SELECT por id_usuario={id_usuario}{Style.RESET_ALL}")
+        transaccional = resumen('Transaccional', medir(lecturas, id_usuario, False))
+        solo_lectura = resumen('Solo lectura', medir(lecturas, id_usuario, True))
+        print(f"   • Ahorro: {Fore.GREEN}{transaccional - solo_lectura:.3f} ms "
+              f"({1 - solo_lectura / transaccional:.0%}){Style.RESET_ALL} por lectura")
+        return 0
+    finally:
+        Conexion.cerrarConexiones()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Benchmark del Costo de Logging
+==============================
+
+Mide cuánto agrega el logging al camino caliente del DAO sin necesitar
+base de datos: las lecturas se sirven desde el cache de UsuarioDao.
+
+Compara:
+  1. seleccionar_por_id() con DEBUG por consulta activado y desactivado
+  2. El patrón anterior (LoggerBase().logger + f-string) contra el
+     logger de módulo con argumentos diferidos ('%s', valor)
+
+Uso:
+    python scripts/benchmark_logging.py [iteraciones]
+"""
+
+import sys
+import os
+import time
+from typing import Callable
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from config.logging_config import LoggingConfig
+from src.dao.usuario_dao import UsuarioDao
+from src.models.usuario import Usuario
+from src.utils.logger_base import LoggerBase
+from colorama import init, Fore, Style
+
+init()
+
+ITERACIONES_POR_DEFECTO = 20000
+
+
+def medir(funcion: Callable[[], None], iteraciones: int) -> float:
+    """Retorna los microsegundos promedio por llamada"""
+    inicio = time.perf_counter()
+    for _ in range(iteraciones):
+        funcion()
+    return (time.perf_counter() - inicio) / iteraciones * 1e6
+
+
+def preparar_cache() -> None:
+    """Siembra el cache del DAO para que las lecturas no toquen la BD"""
+    UsuarioDao.configurar_cache(max_size=16, ttl=3600)
+    usuario = Usuario(id_usuario=1, username='benchmark', password='secreta', email='bench@test.com')
+    UsuarioDao._cache.guardar(('usuario', 1), usuario.to_dict())
+
+
+def benchmark_dao(iteraciones: int) -> None:
+    """Compara seleccionar_por_id() con y sin DEBUG por consulta"""
+    print(f"\n{Fore.CYAN}📊 seleccionar_por_id() desde cache ({iteraciones} llamadas){Style.RESET_ALL}")
+    preparar_cache()
+    consulta = lambda: UsuarioDao.seleccionar_por_id(1)
+
+    # Con debug el logger principal también acepta DEBUG (LOG_LEVEL=DEBUG)
+    logger_principal = LoggerBase().logger
+    nivel_original = logger_principal.level
+    try:
+        logger_principal.setLevel('DEBUG')
+        LoggerBase.configurar_debug_consultas(True)
+        con_debug = medir(consulta, iteraciones)
+        LoggerBase.configurar_debug_consultas(False)
+        sin_debug = medir(consulta, iteraciones)
+    finally:
+        logger_principal.setLevel(nivel_original)
+
+    print(f"   • LOG_DAO_DEBUG=true : {con_debug:8.2f} µs/llamada")
+    print(f"   • LOG_DAO_DEBUG=false: {sin_debug:8.2f} µs/llamada")
+    print(f"   • Ahorro             : {Fore.GREEN}{con_debug / sin_debug:.1f}x{Style.RESET_ALL}")
+    UsuarioDao.desactivar_cache()
+
+
+def benchmark_patrones(iteraciones: int) -> None:
+    """Compara el patrón de logging anterior con el diferido, con DEBUG filtrado"""
+    print(f"\n{Fore.CYAN}📊 logger.debug() descartado por nivel ({iteraciones} llamadas){Style.RESET_ALL}")
+    LoggerBase.configurar_debug_consultas(False)
+    logger_modulo = LoggerBase.get_logger('dao')
+    usuario = Usuario(id_usuario=1, username='benchmark', password='secreta', email='bench@test.com')
+
+    def patron_anterior():
+        logger = LoggerBase().logger
+        logger.debug(f'🔍 Buscando usuario: {usuario}')
+
+    def patron_diferido():
+        logger_modulo.debug('🔍 Buscando usuario: %s', usuario)
+
+    # En el patrón anterior el logger principal acepta DEBUG: se mide con él en INFO
+    # para que ambos casos descarten el registro y solo cambie el costo de llegar ahí
+    logger_principal = LoggerBase().logger
+    nivel_original = logger_principal.level
+    logger_principal.setLevel('INFO')
+    try:
+        anterior = medir(patron_anterior, iteraciones)
+        diferido = medir(patron_diferido, iteraciones)
+    finally:
+        logger_principal.setLevel(nivel_original)
+
+    print(f"   • LoggerBase().logger + f-string: {anterior:8.2f} µs/llamada")
+    print(f"   • Logger de módulo + '%s'       : {diferido:8.2f} µs/llamada")
+    print(f"   • Ahorro                        : {Fore.GREEN}{anterior / diferido:.1f}x{Style.RESET_ALL}")
+
+
+def main():
+    """Ejecuta los benchmarks de logging"""
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else ITERACIONES_POR_DEFECTO
+    print(f"{Fore.CYAN}⏱️  BENCHMARK DE LOGGING{Style.RESET_ALL}")
+    LoggerBase()
+
+    try:
+        benchmark_dao(iteraciones)
+        benchmark_patrones(iteraciones)
+    finally:
+        LoggerBase.configurar_debug_consultas(LoggingConfig.DAO_DEBUG)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark de Materialización de Usuarios
+========================================
+
+Mide el tiempo y la memoria de convertir N filas en objetos Usuario sin
+necesitar base de datos (las filas se generan en memoria).
+
+Compara:
+  1. El camino anterior: Usuario con __dict__ por instancia, construido
+     con argumentos con nombre dentro de un try/except por fila
+  2. El camino actual: Usuario con __slots__ construido con argumentos
+     posicionales (lo que hace CursorUsuarios.fetchall())
+
+Uso:
+    python scripts/benchmark_usuario.py [filas]
+"""
+
+import sys
+import os
+import gc
+import time
+import tracemalloc
+from itertools import starmap
+from typing import Callable, List, Tuple
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.usuario import Usuario
+from colorama import init, Fore, Style
+
+init()
+
+FILAS_POR_DEFECTO = 1_000_000
+
+
+class UsuarioConDict(Usuario):
+    """Usuario con __dict__ por instancia (sin __slots__), como antes"""
+
+
+def camino_anterior(filas: List[tuple]) -> List[Usuario]:
+    """Bucle de seleccionar() antes de CursorUsuarios"""
+    usuarios = []
+    for registro in filas:
+        try:
+            usuario = UsuarioConDict(
+                id_usuario=registro[0],
+                username=registro[1],
+                password=registro[2],
+                email=registro[3]
+            )
+            usuarios.append(usuario)
+        except Exception:
+            continue
+    return usuarios
+
+
+def camino_actual(filas: List[tuple]) -> List[Usuario]:
+    """Equivalente a CursorUsuarios.fetchall() sobre las mismas filas"""
+    return list(starmap(Usuario, filas))
+
+
+def generar_filas(cantidad: int) -> List[tuple]:
+    """Filas (id_usuario, username, password, email) como las entrega psycopg2"""
+    return [(i, f'usuario_{i}', f'clave_{i}', f'usuario_{i}@test.com') for i in range(1, cantidad + 1)]
+
+
+def medir(camino: Callable[[List[tuple]], List[Usuario]], filas: List[tuple]) -> Tuple[float, float]:
+    """
+    Retorna (segundos, MB) de construir los usuarios
+
+    El tiempo se mide sin tracemalloc (que lo distorsiona) y la memoria en
+    una segunda pasada; las cadenas de las filas son compartidas por ambos
+    caminos y no se cuentan.
+    """
+    gc.collect()
+    inicio = time.perf_counter()
+    usuarios = camino(filas)
+    segundos = time.perf_counter() - inicio
+    del usuarios
+
+    gc.collect()
+    tracemalloc.start()
+    usuarios = camino(filas)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del usuarios
+    return segundos, memoria / (1024 * 1024)
+
+
+def main():
+    """Ejecuta el benchmark de materialización"""
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else FILAS_POR_DEFECTO
+    print(f"{Fore.CYAN}⏱️  BENCHMARK DE MATERIALIZACIÓN DE USUARIOS ({cantidad} filas){Style.RESET_ALL}")
+
+    filas = generar_filas(cantidad)
+    t_anterior, mb_anterior = medir(camino_anterior, filas)
+    t_actual, mb_actual = medir(camino_actual, filas)
+
+    print(f"\n{Fore.CYAN}📊 Resultados{Style.RESET_ALL}")
+    print(f"   • Anterior (__dict__ + kwargs + try): {t_anterior:7.3f} s  {mb_anterior:8.1f} MB")
+    print(f"   • Actual (__slots__ + starmap)      : {t_actual:7.3f} s  {mb_actual:8.1f} MB")
+    print(f"   • Tiempo : {Fore.GREEN}{t_anterior / t_actual:.1f}x{Style.RESET_ALL} más rápido")
+    print(f"   • Memoria: {Fore.GREEN}{mb_actual / mb_anterior:.0%}{Style.RESET_ALL} de la anterior")
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,7 @@
 -- =====================================================
 
 DROP TABLE IF EXISTS usuario CASCADE;
+DROP TABLE IF EXISTS usuario_conteo;
 
 -- =====================================================
 -- 4. CREAR TABLA USUARIO
@@ -44,12 +45,16 @@ DROP TABLE IF EXISTS usuario CASCADE;
 CREATE TABLE usuario (
     id_usuario SERIAL PRIMARY KEY,
     username VARCHAR(50) UNIQUE NOT NULL,
-    password VARCHAR(100) NOT NULL,
+    password VARCHAR(255) NOT NULL,
     email VARCHAR(100) NOT NULL,
     fecha_creacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     fecha_modificacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Migración idempotente para bases creadas con password VARCHAR(100):
+-- se puede ejecutar sola sobre una base existente (no borra datos)
+ALTER TABLE IF EXISTS usuario ALTER COLUMN password TYPE VARCHAR(255);
+
 -- =====================================================
 -- 5. CREAR ÍNDICES PARA OPTIMIZACIÓN
 -- =====================================================
@@ -60,6 +65,16 @@ CREATE INDEX idx_usuario_username ON usuario(username);
 -- Índice para búsquedas por email
 CREATE INDEX idx_usuario_email ON usuario(email);
 
+-- Índices de UsuarioDao.buscar(). Este script recrea la tabla (borra los
+-- datos): en una base existente use `python setup_postgres.py --migrar`,
+-- que los crea con CREATE INDEX CONCURRENTLY sin borrar nada
+-- Prefijo de username: LIKE 'abc%' y ORDER BY con collation "C"
+-- (equivalente a text_pattern_ops, y además entrega el orden)
+CREATE INDEX IF NOT EXISTS idx_usuario_username_prefijo ON usuario (username COLLATE "C");
+
+-- Email sin distinguir mayúsculas: lower(email) = lower(%s)
+CREATE INDEX IF NOT EXISTS idx_usuario_email_lower ON usuario (lower(email));
+
 -- =====================================================
 -- 6. CREAR TRIGGER PARA FECHA DE MODIFICACIÓN
 -- =====================================================
@@ -80,9 +95,58 @@ CREATE TRIGGER trigger_actualizar_fecha_modificacion
     EXECUTE FUNCTION actualizar_fecha_modificacion();
 
 -- =====================================================
--- 7. INSERTAR DATOS DE PRUEBA
+-- 7. CONTADOR DE USUARIOS MANTENIDO POR TRIGGERS
+-- =====================================================
+
+-- Una sola fila con el total: contar_usuarios('contador') la lee en
+-- lugar de recorrer la tabla con COUNT(*). En una base existente se crea
+-- con `python setup_postgres.py --migrar`
+CREATE TABLE usuario_conteo (
+    unica BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (unica),
+    total BIGINT NOT NULL
+);
+
+INSERT INTO usuario_conteo (total) SELECT COUNT(*) FROM usuario;
+
+-- Triggers por sentencia: un UPDATE del contador por INSERT/DELETE,
+-- no uno por fila (las tablas de transición traen las filas afectadas)
+CREATE OR REPLACE FUNCTION actualizar_usuario_conteo()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE usuario_conteo SET total = total + (SELECT COUNT(*) FROM filas_nuevas);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE usuario_conteo SET total = total - (SELECT COUNT(*) FROM filas_borradas);
+    ELSE
+        UPDATE usuario_conteo SET total = 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_usuario_conteo_insertar
+    AFTER INSERT ON usuario
+    REFERENCING NEW TABLE AS filas_nuevas
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION actualizar_usuario_conteo();
+
+CREATE TRIGGER trigger_usuario_conteo_eliminar
+    AFTER DELETE ON usuario
+    REFERENCING OLD TABLE AS filas_borradas
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION actualizar_usuario_conteo();
+
+CREATE TRIGGER trigger_usuario_conteo_truncar
+    AFTER TRUNCATE ON usuario
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION actualizar_usuario_conteo();
+
+-- =====================================================
+-- 8. INSERTAR DATOS DE PRUEBA
 -- =====================================================
 
+-- Contraseñas en texto plano: UsuarioDao.autenticar() las reemplaza por
+-- un hash (scrypt/PBKDF2) en el primer login correcto
 INSERT INTO usuario (username, password, email) VALUES
     ('admin', 'admin123', 'admin@test.com'),
     ('usuario1', 'pass123', 'usuario1@test.com'),
@@ -91,7 +155,7 @@ INSERT INTO usuario (username, password, email) VALUES
     ('estudiante', 'est123', 'estudiante@universidad.edu');
 
 -- =====================================================
--- 8. VERIFICAR DATOS INSERTADOS
+-- 9. VERIFICAR DATOS INSERTADOS
 -- =====================================================
 
 SELECT 
@@ -103,13 +167,13 @@ FROM usuario
 ORDER BY id_usuario;
 
 -- =====================================================
--- 9. MOSTRAR INFORMACIÓN DE LA TABLA
+-- 10. MOSTRAR INFORMACIÓN DE LA TABLA
 -- =====================================================
 
 \d usuario;
 
 -- =====================================================
--- 10. CREAR USUARIO DE APLICACIÓN (OPCIONAL)
+-- 11. CREAR USUARIO DE APLICACIÓN (OPCIONAL)
 -- =====================================================
 
 -- Crear usuario específico para la aplicación
@@ -143,6 +207,6 @@ ORDER BY ordinal_position;
 -- =====================================================
 
 \echo '✅ Base de datos configurada exitosamente'
-\echo '📊 Tabla usuario creada con índices y triggers'
+\echo '📊 Tabla usuario creada con índices y triggers (incluye usuario_conteo)'
 \echo '🔍 Datos de prueba insertados'
 \echo '🎯 Sistema listo para el Lab UML 1.1'
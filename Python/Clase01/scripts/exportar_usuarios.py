@@ -0,0 +1,230 @@
+"""
+Exportación Masiva de Usuarios
+==============================
+
+Vuelca la tabla usuario a un archivo para análisis con
+COPY (SELECT ...) TO STDOUT: las filas van de PostgreSQL al archivo en
+bloques, sin construir objetos Usuario y con memoria constante.
+
+Formatos:
+  - csv:     CSV con encabezado (--gzip para comprimirlo)
+  - parquet: columnar comprimido con zstd; requiere pyarrow
+             (pip install pyarrow)
+
+La columna password se excluye salvo que se pida --incluir-password.
+La lectura se enruta a una réplica si hay réplicas configuradas.
+
+Uso:
+    python scripts/exportar_usuarios.py [--formato csv|parquet] [--salida ruta]
+                                        [--gzip] [--incluir-password] [--progreso filas]
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import threading
+import time
+from typing import BinaryIO, List
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.conexion import Conexion
+from src.database.cursor_del_pool import CursorDelPool
+from src.utils.logger_base import LoggerBase
+from colorama import init, Fore, Style
+
+init()
+
+logger = LoggerBase.get_logger('exportacion')
+
+COLUMNAS = ['id_usuario', 'username', 'email']
+COLUMNA_PASSWORD = 'password'
+
+# Filas entre reportes de progreso
+PROGRESO_POR_DEFECTO = 100_000
+
+# Bytes por bloque que COPY entrega al archivo
+TAMANO_BLOQUE = 64 * 1024
+
+
+def sentencia_copy(columnas: List[str]) -> str:
+    """COPY en CSV con encabezado, ordenado por id_usuario"""
+    return (f"COPY (SELECT {', '.join(columnas)} FROM usuario ORDER BY id_usuario) "
+            f"TO STDOUT WITH (FORMAT csv, HEADER true)")
+
+
+class Progreso:
+    """
+    Informa filas y bytes exportados cada `cada` filas
+
+    Args:
+        cada: Filas entre reportes
+    """
+
+    def __init__(self, cada: int):
+        self.cada = cada
+        self.filas = 0
+        self.bytes = 0
+        self._siguiente = cada
+        self._inicio = time.perf_counter()
+
+    def sumar(self, filas: int, bytes_escritos: int) -> None:
+        self.filas += filas
+        self.bytes += bytes_escritos
+        if self.filas >= self._siguiente:
+            self._siguiente = (self.filas // self.cada + 1) * self.cada
+            print(f"{Fore.CYAN}   ⏳ {self.filas:,} filas, {self.bytes / 1024 / 1024:.1f} MB, "
+                  f"{self.filas / self.segundos:,.0f} filas/s{Style.RESET_ALL}")
+
+    @property
+    def segundos(self) -> float:
+        return max(time.perf_counter() - self._inicio, 1e-9)
+
+
+class DestinoConProgreso:
+    """
+    Archivo binario que COPY escribe, contando filas por saltos de línea
+
+    El encabezado del CSV no se cuenta como fila. Los campos exportados
+    no contienen saltos de línea, así que cada uno cierra una fila.
+    """
+
+    def __init__(self, archivo: BinaryIO, progreso: Progreso):
+        self._archivo = archivo
+        self._progreso = progreso
+        self._encabezado_pendiente = True
+
+    def write(self, datos: bytes) -> int:
+        self._archivo.write(datos)
+        filas = datos.count(b'\n')
+        if self._encabezado_pendiente and filas:
+            self._encabezado_pendiente = False
+            filas -= 1
+        self._progreso.sumar(filas, len(datos))
+        return len(datos)
+
+
+def exportar_csv(ruta: str, columnas: List[str], comprimir: bool, progreso: Progreso) -> bool:
+    """
+    Exporta a CSV (opcionalmente gzip) con COPY directo al archivo
+
+    Returns:
+        bool: True si la exportación terminó
+    """
+    abrir = gzip.open if comprimir else open
+    with CursorDelPool(lectura=True) as cursor:
+        if cursor is None:
+            print(f"{Fore.RED}❌ No se pudo obtener cursor{Style.RESET_ALL}")
+            return False
+        with abrir(ruta, 'wb') as archivo:
+            cursor.copy_expert(sentencia_copy(columnas), DestinoConProgreso(archivo, progreso),
+                               size=TAMANO_BLOQUE)
+    return True
+
+
+def exportar_parquet(ruta: str, columnas: List[str], progreso: Progreso) -> bool:
+    """
+    Exporta a Parquet (zstd) convirtiendo el CSV de COPY por lotes
+
+    COPY escribe en un pipe desde un hilo; pyarrow lee el CSV del otro
+    extremo en bloques y escribe un row group por lote, así nunca hay
+    más de un bloque en memoria.
+
+    Returns:
+        bool: True si la exportación terminó
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+    except ImportError:
+        print(f"{Fore.RED}❌ El formato parquet requiere pyarrow (pip install pyarrow){Style.RESET_ALL}")
+        return False
+
+    lectura, escritura = os.pipe()
+    errores: List[Exception] = []
+
+    def copiar() -> None:
+        # El extremo de escritura se cierra siempre: pyarrow ve fin de archivo
+        with open(escritura, 'wb') as destino:
+            try:
+                with CursorDelPool(lectura=True) as cursor:
+                    if cursor is None:
+                        raise RuntimeError('No se pudo obtener cursor')
+                    cursor.copy_expert(sentencia_copy(columnas), destino, size=TAMANO_BLOQUE)
+            except Exception as e:
+                errores.append(e)
+
+    hilo = threading.Thread(target=copiar, name='exportar-copy', daemon=True)
+    hilo.start()
+
+    tipos = {columna: pa.int64() if columna == 'id_usuario' else pa.string() for columna in columnas}
+    try:
+        with open(lectura, 'rb') as origen:
+            lector = pa_csv.open_csv(
+                origen,
+                read_options=pa_csv.ReadOptions(block_size=4 * 1024 * 1024),
+                convert_options=pa_csv.ConvertOptions(column_types=tipos),
+            )
+            with pq.ParquetWriter(ruta, lector.schema, compression='zstd') as escritor:
+                for lote in lector:
+                    escritor.write_batch(lote)
+                    progreso.sumar(lote.num_rows, lote.nbytes)
+    except Exception as e:
+        # Un error de COPY deja el CSV incompleto: se informa el error de origen
+        hilo.join()
+        raise errores[0] if errores else e
+    hilo.join()
+    if errores:
+        raise errores[0]
+    return True
+
+
+def main() -> int:
+    """Ejecuta la exportación según los argumentos"""
+    LoggerBase()
+    parser = argparse.ArgumentParser(description='Exporta la tabla usuario con COPY')
+    parser.add_argument('--formato', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--salida', help='Ruta del archivo (por defecto usuarios.<formato>)')
+    parser.add_argument('--gzip', action='store_true', help='Comprimir el CSV con gzip')
+    parser.add_argument('--incluir-password', action='store_true',
+                        help='Incluir la columna password (excluida por defecto)')
+    parser.add_argument('--progreso', type=int, default=PROGRESO_POR_DEFECTO,
+                        help='Filas entre reportes de progreso')
+    args = parser.parse_args()
+
+    columnas = COLUMNAS + [COLUMNA_PASSWORD] if args.incluir_password else list(COLUMNAS)
+    extension = 'parquet' if args.formato == 'parquet' else ('csv.gz' if args.gzip else 'csv')
+    ruta = args.salida or f'usuarios.{extension}'
+    progreso = Progreso(max(args.progreso, 1))
+
+    print(f"{Fore.CYAN}📤 Exportando usuario ({', '.join(columnas)}) a {ruta}{Style.RESET_ALL}")
+    try:
+        if args.formato == 'parquet':
+            completo = exportar_parquet(ruta, columnas, progreso)
+        else:
+            completo = exportar_csv(ruta, columnas, args.gzip, progreso)
+    except Exception as e:
+        print(f"{Fore.RED}❌ Error exportando usuarios: {e}{Style.RESET_ALL}")
+        logger.error('❌ Error exportando usuarios a %s: %s', ruta, e)
+        completo = False
+    finally:
+        Conexion.cerrarConexiones()
+
+    if not completo:
+        # No dejar un archivo a medio escribir que parezca una exportación válida
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        return 1
+
+    tamano = os.path.getsize(ruta) / 1024 / 1024
+    print(f"{Fore.GREEN}✅ {progreso.filas:,} filas exportadas en {progreso.segundos:.1f} s "
+          f"({tamano:.1f} MB en disco){Style.RESET_ALL}")
+    logger.info('✅ Exportación de usuarios: %s filas a %s en %.1f s', progreso.filas, ruta, progreso.segundos)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.database.conexion import Conexion
 from src.database.cursor_del_pool import CursorDelPool
+from src.dao.usuario_dao import UsuarioDao
+from src.models.usuario import Usuario
 from src.utils.logger_base import LoggerBase
 from colorama import init, Fore, Style
 
@@ -71,21 +73,19 @@ def insertar_datos_ejemplo():
             ('test', 'test123', 'test@example.com')
         ]
         
-        with CursorDelPool() as cursor:
-            if cursor is None:
-                print(f"{Fore.RED}❌ No se pudo obtener cursor{Style.RESET_ALL}")
-                return False
-            
-            # Insertar cada usuario
-            for username, password, email in datos_ejemplo:
-                cursor.execute(
-                    "INSERT INTO usuario (username, password, email) VALUES (%s, %s, %s)",
-                    (username, password, email)
-                )
-            
-            print(f"{Fore.GREEN}✅ {len(datos_ejemplo)} usuarios de ejemplo insertados{Style.RESET_ALL}")
-            logger.info(f"Datos de ejemplo insertados: {len(datos_ejemplo)} usuarios")
-            return True
+        # Insertar todos los usuarios en una sola sentencia
+        usuarios = [Usuario(None, username, password, email)
+                    for username, password, email in datos_ejemplo]
+        ids = UsuarioDao.insertar_lote(usuarios)
+        insertados = sum(1 for id_usuario in ids if id_usuario is not None)
+        
+        if insertados == 0:
+            print(f"{Fore.RED}❌ No se insertaron usuarios de ejemplo{Style.RESET_ALL}")
+            return False
+        
+        print(f"{Fore.GREEN}✅ {insertados} usuarios de ejemplo insertados{Style.RESET_ALL}")
+        logger.info(f"Datos de ejemplo insertados: {insertados} usuarios")
+        return True
             
     except Exception as e:
         print(f"{Fore.RED}❌ Error insertando datos de ejemplo: {e}{Style.RESET_ALL}")
@@ -76,7 +76,7 @@ def create_tables():
             CREATE TABLE usuario (
                 id_usuario SERIAL PRIMARY KEY,
                 username VARCHAR(50) UNIQUE NOT NULL,
-                password VARCHAR(100) NOT NULL,
+                password VARCHAR(255) NOT NULL,
                 email VARCHAR(100) UNIQUE NOT NULL
             );
         """)
@@ -3,6 +3,10 @@ Script para configurar PostgreSQL automáticamente
 ================================================
 
 Crea la base de datos y tablas necesarias para el Lab UML 1.1
+
+Uso:
+    python setup_postgres.py            # crea (o recrea) base y tablas
+    python setup_postgres.py --migrar   # solo actualiza el esquema de una base existente
 """
 
 import sys
@@ -83,7 +87,7 @@ def crear_tablas():
         CREATE TABLE usuario (
             id_usuario SERIAL PRIMARY KEY,
             username VARCHAR(50) UNIQUE NOT NULL,
-            password VARCHAR(100) NOT NULL,
+            password VARCHAR(255) NOT NULL,
             email VARCHAR(100) UNIQUE NOT NULL,
             fecha_creacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             fecha_modificacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -93,6 +97,10 @@ def crear_tablas():
         CREATE INDEX idx_usuario_username ON usuario(username);
         CREATE INDEX idx_usuario_email ON usuario(email);
         
+        -- Índices de UsuarioDao.buscar(): prefijo de username y email sin mayúsculas
+        CREATE INDEX IF NOT EXISTS idx_usuario_username_prefijo ON usuario (username COLLATE "C");
+        CREATE INDEX IF NOT EXISTS idx_usuario_email_lower ON usuario (lower(email));
+        
         -- Crear trigger para actualizar fecha_modificacion
         CREATE OR REPLACE FUNCTION actualizar_fecha_modificacion()
         RETURNS TRIGGER AS $$
@@ -106,9 +114,13 @@ def crear_tablas():
             BEFORE UPDATE ON usuario
             FOR EACH ROW
             EXECUTE FUNCTION actualizar_fecha_modificacion();
+        
+        -- Contador de usuarios: se crea con SQL_CONTADOR_USUARIOS
+        DROP TABLE IF EXISTS usuario_conteo;
         """
         
         cursor.execute(sql_crear_tabla)
+        cursor.execute(SQL_CONTADOR_USUARIOS)
         print("✅ Tabla 'usuario' creada exitosamente")
         
         # Insertar datos de prueba
@@ -125,6 +137,100 @@ def crear_tablas():
         logger.error(f"Error creando tablas: {e}")
         return False
 
+# Contador de usuarios mantenido por triggers (contar_usuarios('contador')).
+# Idempotente: en una sola transacción y con la tabla usuario bloqueada para
+# escrituras, así ningún INSERT/DELETE queda fuera del total inicial
+SQL_CONTADOR_USUARIOS = """
+    BEGIN;
+    LOCK TABLE usuario IN SHARE ROW EXCLUSIVE MODE;
+    
+    CREATE TABLE IF NOT EXISTS usuario_conteo (
+        unica BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (unica),
+        total BIGINT NOT NULL
+    );
+    INSERT INTO usuario_conteo (total) SELECT COUNT(*) FROM usuario
+        ON CONFLICT DO NOTHING;
+    
+    CREATE OR REPLACE FUNCTION actualizar_usuario_conteo()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE usuario_conteo SET total = total + (SELECT COUNT(*) FROM filas_nuevas);
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE usuario_conteo SET total = total - (SELECT COUNT(*) FROM filas_borradas);
+        ELSE
+            UPDATE usuario_conteo SET total = 0;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    
+    DROP TRIGGER IF EXISTS trigger_usuario_conteo_insertar ON usuario;
+    CREATE TRIGGER trigger_usuario_conteo_insertar
+        AFTER INSERT ON usuario
+        REFERENCING NEW TABLE AS filas_nuevas
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION actualizar_usuario_conteo();
+    
+    DROP TRIGGER IF EXISTS trigger_usuario_conteo_eliminar ON usuario;
+    CREATE TRIGGER trigger_usuario_conteo_eliminar
+        AFTER DELETE ON usuario
+        REFERENCING OLD TABLE AS filas_borradas
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION actualizar_usuario_conteo();
+    
+    DROP TRIGGER IF EXISTS trigger_usuario_conteo_truncar ON usuario;
+    CREATE TRIGGER trigger_usuario_conteo_truncar
+        AFTER TRUNCATE ON usuario
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION actualizar_usuario_conteo();
+    
+    COMMIT;
+"""
+
+# Cambios de esquema para bases creadas con versiones anteriores; cada
+# sentencia es idempotente y se ejecuta por separado en autocommit
+# (CREATE INDEX CONCURRENTLY no admite un bloque de transacción)
+SQL_MIGRACIONES = [
+    # Hashes de contraseñas (scrypt/PBKDF2) más largos que VARCHAR(100);
+    # ampliar un VARCHAR no reescribe la tabla
+    "ALTER TABLE IF EXISTS usuario ALTER COLUMN password TYPE VARCHAR(255)",
+    # Índices de UsuarioDao.buscar(), sin bloquear escrituras
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_usuario_username_prefijo ON usuario (username COLLATE "C")',
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_usuario_email_lower ON usuario (lower(email))",
+    # Tabla usuario_conteo, su fila inicial y los triggers por sentencia
+    SQL_CONTADOR_USUARIOS,
+]
+
+def migrar_esquema():
+    """Aplica SQL_MIGRACIONES a test_db sin borrar datos"""
+    logger = LoggerBase().logger
+    
+    try:
+        print("📋 Actualizando esquema de test_db...")
+        
+        conn = psycopg2.connect(
+            host="localhost",
+            port="5432",
+            user="postgres",
+            password="postgres",
+            database="test_db"
+        )
+        conn.autocommit = True
+        cursor = conn.cursor()
+        for sentencia in SQL_MIGRACIONES:
+            cursor.execute(sentencia)
+        cursor.close()
+        conn.close()
+        
+        print("✅ Esquema actualizado")
+        return True
+        
+    except psycopg2.Error as e:
+        print(f"❌ Error actualizando esquema: {e}")
+        logger.error(f"Error actualizando esquema: {e}")
+        return False
+
 def insertar_datos_prueba(cursor):
     """Inserta datos de prueba en la tabla usuario"""
     try:
@@ -202,6 +308,9 @@ if __name__ == "__main__":
     print("Credenciales: postgres/postgres@localhost:5432")
     print()
     
+    if "--migrar" in sys.argv:
+        sys.exit(0 if migrar_esquema() else 1)
+    
     if crear_base_datos():
         verificar_configuracion()
         print("\n🎉 ¡CONFIGURACIÓN LISTA!")
@@ -6,5 +6,7 @@ Exporta todas las clases DAO del sistema
 """
 
 from .usuario_dao import UsuarioDao
+from .async_usuario_dao import AsyncUsuarioDao
+from .cargador_usuarios import CargadorUsuarios
 
-__all__ = ['UsuarioDao']
+__all__ = ['UsuarioDao', 'AsyncUsuarioDao', 'CargadorUsuarios']
@@ -0,0 +1,301 @@
+"""
+Data Access Object Asíncrono para Usuario
+=========================================
+
+Contraparte asyncio de UsuarioDao. Reutiliza las mismas sentencias SQL
+y mantiene los mismos contratos de retorno (listas de Usuario, 0/1
+registros afectados) para que los llamadores puedan migrar método a
+método.
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional
+from psycopg2 import OperationalError, errors
+from src.dao.usuario_dao import UsuarioDao
+from src.database.cursor_async import AsyncCursorDelPool
+from src.models.usuario import Usuario
+from src.utils.contrasenas import Contrasenas
+from src.utils.logger_base import LoggerBase
+
+logger = LoggerBase.get_logger('dao')
+
+
+class AsyncUsuarioDao:
+    """
+    DAO asíncrono para operaciones CRUD de usuarios
+
+    Cada método es una corrutina que usa AsyncCursorDelPool, de modo que
+    muchas consultas concurrentes comparten pocas conexiones sin
+    bloquear el event loop.
+    """
+
+    # === SENTENCIAS SQL (compartidas con UsuarioDao) ===
+    _SELECCIONAR: str = UsuarioDao._SELECCIONAR
+    _SELECCIONAR_POR_ID: str = UsuarioDao._SELECCIONAR_POR_ID
+    _SELECCIONAR_POR_IDS: str = UsuarioDao._SELECCIONAR_POR_IDS
+    _INSERTAR: str = UsuarioDao._INSERTAR
+    _ACTUALIZAR: str = UsuarioDao._ACTUALIZAR
+    _ELIMINAR: str = UsuarioDao._ELIMINAR
+
+    @classmethod
+    async def seleccionar(cls) -> List[Usuario]:
+        """
+        Selecciona todos los usuarios de la base de datos
+
+        Returns:
+            Lista de usuarios o lista vacía si hay error
+        """
+        usuarios = []
+        try:
+            logger.debug('🔍 Iniciando selección asíncrona de todos los usuarios...')
+
+            async with AsyncCursorDelPool() as cursor:
+                if cursor is None:
+                    logger.error('❌ No se pudo obtener cursor para seleccionar usuarios')
+                    return usuarios
+
+                await cursor.execute(cls._SELECCIONAR)
+                for registro in cursor.fetchall():
+                    try:
+                        usuarios.append(Usuario(
+                            id_usuario=registro[0],
+                            username=registro[1],
+                            password=registro[2],
+                            email=registro[3]
+                        ))
+                    except Exception as e:
+                        logger.error('❌ Error creando usuario desde registro %s: %s', registro, e)
+                        continue
+
+                logger.info('✅ Usuarios seleccionados: %s', len(usuarios))
+
+        except Exception as e:
+            logger.error('❌ Error al seleccionar usuarios: %s', e)
+
+        return usuarios
+
+    @classmethod
+    async def seleccionar_por_id(cls, id_usuario: int) -> Optional[Usuario]:
+        """
+        Selecciona un usuario por su ID
+
+        Args:
+            id_usuario: ID del usuario a buscar
+
+        Returns:
+            Usuario encontrado o None si no existe o hay error
+        """
+        try:
+            logger.debug('🔍 Buscando usuario con ID: %s', id_usuario)
+
+            async with AsyncCursorDelPool() as cursor:
+                if cursor is None:
+                    logger.error('❌ No se pudo obtener cursor para buscar usuario')
+                    return None
+
+                await cursor.execute(cls._SELECCIONAR_POR_ID, (id_usuario,))
+                registro = cursor.fetchone()
+
+                if registro:
+                    return Usuario(
+                        id_usuario=registro[0],
+                        username=registro[1],
+                        password=registro[2],
+                        email=registro[3]
+                    )
+                logger.info('⚠️  Usuario con ID %s no encontrado', id_usuario)
+                return None
+
+        except Exception as e:
+            logger.error('❌ Error al buscar usuario por ID %s: %s', id_usuario, e)
+            return None
+
+    @classmethod
+    async def seleccionar_por_ids(cls, ids: Iterable[int], tamano_lote: Optional[int] = None,
+                                  propagar: bool = False) -> Dict[int, Usuario]:
+        """
+        Selecciona muchos usuarios por ID con una consulta ANY(%s) por bloque
+
+        Args:
+            ids: IDs a buscar (con repetidos o en cualquier orden)
+            tamano_lote: IDs por consulta (por defecto el de UsuarioDao)
+            propagar: True para lanzar el error en lugar de retornar un
+                diccionario vacío, que no se distingue de "no existen";
+                CargadorUsuarios lo usa para no memorizar un fallo
+
+        Returns:
+            Diccionario id_usuario -> Usuario con los encontrados o vacío si hay error
+
+        Raises:
+            psycopg2.Error: Con propagar=True, si no hay conexión o la consulta falla
+        """
+        usuarios: Dict[int, Usuario] = {}
+        pendientes = list(dict.fromkeys(ids))
+        if not pendientes:
+            return usuarios
+
+        try:
+            logger.debug('🔍 Buscando %s usuarios por ID', len(pendientes))
+            tamano = max(tamano_lote or UsuarioDao._TAMANO_LOTE, 1)
+
+            async with AsyncCursorDelPool() as cursor:
+                if cursor is None:
+                    logger.error('❌ No se pudo obtener cursor para buscar usuarios por ID')
+                    if propagar:
+                        raise OperationalError('no se pudo obtener conexión del pool asíncrono')
+                    return usuarios
+
+                for desde in range(0, len(pendientes), tamano):
+                    await cursor.execute(cls._SELECCIONAR_POR_IDS, (pendientes[desde:desde + tamano],))
+                    for registro in cursor.fetchall():
+                        usuarios[registro[0]] = Usuario(*registro)
+
+            logger.info('✅ Usuarios encontrados por ID: %s', len(usuarios))
+            return usuarios
+
+        except Exception as e:
+            logger.error('❌ Error al buscar usuarios por ID: %s', e)
+            if propagar:
+                raise
+            return {}
+
+    @classmethod
+    async def insertar(cls, usuario: Usuario) -> int:
+        """
+        Inserta un nuevo usuario en la base de datos
+
+        Args:
+            usuario: Usuario a insertar
+
+        Returns:
+            Número de registros insertados (1 si éxito, 0 si error)
+        """
+        try:
+            if not usuario.is_valid():
+                logger.error('❌ Usuario no válido para insertar')
+                return 0
+
+            password = await cls._hashear(usuario.password)
+
+            async with AsyncCursorDelPool() as cursor:
+                if cursor is None:
+                    logger.error('❌ No se pudo obtener cursor para insertar usuario')
+                    return 0
+
+                valores = (usuario.username, password, usuario.email)
+                await cursor.execute(cls._INSERTAR, valores)
+                usuario.id_usuario = cursor.fetchone()[0]
+                usuario.password = password
+
+                logger.info('✅ Usuario insertado exitosamente con ID: %s', usuario.id_usuario)
+                return 1
+
+        except errors.UniqueViolation as e:
+            # La restricción UNIQUE decide en la misma sentencia (sin carrera check/escritura)
+            logger.error('❌ El username "%s" ya existe (%s)', usuario.username, e.diag.constraint_name)
+            return 0
+        except Exception as e:
+            logger.error('❌ Error al insertar usuario %s: %s', usuario.username, e)
+            return 0
+
+    @classmethod
+    async def actualizar(cls, usuario: Usuario) -> int:
+        """
+        Actualiza un usuario existente en la base de datos
+
+        Args:
+            usuario: Usuario con datos actualizados
+
+        Returns:
+            Número de registros actualizados (1 si éxito, 0 si error)
+        """
+        try:
+            if not usuario.is_valid() or usuario.id_usuario is None:
+                logger.error('❌ Usuario no válido para actualizar')
+                return 0
+
+            password = await cls._hashear(usuario.password)
+
+            async with AsyncCursorDelPool() as cursor:
+                if cursor is None:
+                    logger.error('❌ No se pudo obtener cursor para actualizar usuario')
+                    return 0
+
+                # Igual a la guardada: sin cambios; otro valor: se guarda su hash
+                valores = (usuario.username, usuario.password, password, usuario.email, usuario.id_usuario)
+                await cursor.execute(cls._ACTUALIZAR, valores)
+
+                registros_afectados = cursor.rowcount
+                if registros_afectados > 0:
+                    usuario.password = cursor.fetchone()[0]
+                    logger.info('✅ Usuario actualizado exitosamente: %s', usuario.username)
+                else:
+                    logger.warning('⚠️  No se actualizó ningún registro para ID: %s', usuario.id_usuario)
+                return registros_afectados
+
+        except errors.UniqueViolation as e:
+            logger.error('❌ El username "%s" ya está en uso (%s)', usuario.username, e.diag.constraint_name)
+            return 0
+        except Exception as e:
+            logger.error('❌ Error al actualizar usuario ID %s: %s', usuario.id_usuario, e)
+            return 0
+
+    @classmethod
+    async def eliminar(cls, usuario: Usuario) -> int:
+        """
+        Elimina un usuario de la base de datos
+
+        Args:
+            usuario: Usuario a eliminar
+
+        Returns:
+            Número de registros eliminados (1 si éxito, 0 si error)
+        """
+        try:
+            if usuario.id_usuario is None:
+                logger.error('❌ No se puede eliminar usuario sin ID')
+                return 0
+
+            async with AsyncCursorDelPool() as cursor:
+                if cursor is None:
+                    logger.error('❌ No se pudo obtener cursor para eliminar usuario')
+                    return 0
+
+                await cursor.execute(cls._ELIMINAR, (usuario.id_usuario,))
+
+                registros_afectados = cursor.rowcount
+                if registros_afectados > 0:
+                    logger.info('✅ Usuario eliminado exitosamente: %s', usuario.username)
+                else:
+                    logger.warning('⚠️  No se eliminó ningún registro para ID: %s', usuario.id_usuario)
+                return registros_afectados
+
+        except Exception as e:
+            logger.error('❌ Error al eliminar usuario ID %s: %s', usuario.id_usuario, e)
+            return 0
+
+    @classmethod
+    async def contar_usuarios(cls) -> int:
+        """
+        Cuenta el total de usuarios en la base de datos
+
+        Returns:
+            int: Número total de usuarios
+        """
+        try:
+            async with AsyncCursorDelPool() as cursor:
+                if cursor is None:
+                    return 0
+
+                await cursor.execute("SELECT COUNT(*) FROM usuario")
+                resultado = cursor.fetchone()
+                return resultado[0] if resultado else 0
+
+        except Exception as e:
+            logger.error('❌ Error contando usuarios: %s', e)
+            return 0
+
+    @staticmethod
+    async def _hashear(password: str) -> str:
+        """Hash en el pool de Contrasenas sin bloquear el event loop"""
+        return await asyncio.wrap_future(Contrasenas.enviar_hash(password))
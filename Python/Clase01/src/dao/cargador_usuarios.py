@@ -0,0 +1,128 @@
+"""
+Cargador de Usuarios por Lotes
+==============================
+
+Agrupa las búsquedas por ID que se piden en el mismo ciclo del event loop
+en una sola llamada a AsyncUsuarioDao.seleccionar_por_ids() (patrón
+DataLoader):
+
+    cargador = CargadorUsuarios()
+    a, b = await asyncio.gather(cargador.cargar(1), cargador.cargar(2))
+    # una consulta: WHERE id_usuario = ANY('{1,2}')
+
+Cada ID se busca una sola vez por cargador: los resultados quedan en
+memoria del cargador, que debe vivir lo que dura una petición o unidad
+de trabajo (no es un cache compartido ni se invalida con escrituras).
+Si la consulta del lote falla, cada cargar() del lote recibe el error y
+no se memoriza nada: la próxima llamada vuelve a consultar.
+"""
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+from src.dao.async_usuario_dao import AsyncUsuarioDao
+from src.models.usuario import Usuario
+from src.utils.logger_base import LoggerBase
+
+logger = LoggerBase.get_logger('dao')
+
+CargaLote = Callable[[List[int]], Awaitable[Dict[int, Usuario]]]
+
+
+class CargadorUsuarios:
+    """
+    Junta los cargar(id) de un mismo ciclo del event loop en una consulta
+
+    Args:
+        cargar_lote: Corrutina ids -> {id: Usuario} que lanza una excepción
+            si falla (por defecto AsyncUsuarioDao.seleccionar_por_ids con
+            propagar=True)
+        memorizar: False para volver a consultar cada ID en cada lote
+    """
+
+    def __init__(self, cargar_lote: Optional[CargaLote] = None, memorizar: bool = True):
+        self._cargar_lote = cargar_lote or functools.partial(AsyncUsuarioDao.seleccionar_por_ids, propagar=True)
+        self._memorizar = memorizar
+        self._memoria: Dict[int, 'asyncio.Future[Optional[Usuario]]'] = {}
+        self._pendientes: Dict[int, 'asyncio.Future[Optional[Usuario]]'] = {}
+        self._despacho_programado = False
+        self._tareas: Set['asyncio.Task[None]'] = set()
+
+    async def cargar(self, id_usuario: int) -> Optional[Usuario]:
+        """
+        Usuario con ese ID, buscado junto con los demás pedidos del ciclo
+
+        Returns:
+            Usuario o None si no existe
+
+        Raises:
+            Exception: El error de la consulta del lote (no queda memorizado)
+        """
+        # shield: cancelar a un llamador no cancela el resultado compartido
+        return await asyncio.shield(self._futuro(id_usuario))
+
+    async def cargar_varios(self, ids: Iterable[int]) -> Dict[int, Usuario]:
+        """
+        Varios usuarios en el mismo lote que los demás pedidos del ciclo
+
+        Returns:
+            Diccionario id_usuario -> Usuario con los encontrados
+        """
+        futuros = {id_usuario: self._futuro(id_usuario) for id_usuario in ids}
+        usuarios = await asyncio.gather(*map(asyncio.shield, futuros.values()))
+        return {id_usuario: usuario for id_usuario, usuario in zip(futuros, usuarios) if usuario is not None}
+
+    def limpiar(self, *ids: int) -> None:
+        """Olvida los IDs indicados (todos si no se indica ninguno)"""
+        if not ids:
+            self._memoria.clear()
+        for id_usuario in ids:
+            self._memoria.pop(id_usuario, None)
+
+    def _futuro(self, id_usuario: int) -> 'asyncio.Future[Optional[Usuario]]':
+        """Future del ID, encolado para el próximo despacho si es nuevo"""
+        futuro = self._memoria.get(id_usuario) or self._pendientes.get(id_usuario)
+        if futuro is not None:
+            return futuro
+
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._pendientes[id_usuario] = futuro
+        if self._memorizar:
+            self._memoria[id_usuario] = futuro
+        if not self._despacho_programado:
+            # call_soon corre después de las tareas ya listas en este ciclo,
+            # así sus cargar() entran en el mismo lote
+            self._despacho_programado = True
+            loop.call_soon(self._despachar)
+        return futuro
+
+    def _despachar(self) -> None:
+        """Lanza la consulta del lote acumulado"""
+        lote, self._pendientes = self._pendientes, {}
+        self._despacho_programado = False
+        if not lote:
+            return
+        tarea = asyncio.ensure_future(self._resolver(lote))
+        # Referencia fuerte hasta que termine (el loop solo guarda referencias débiles)
+        self._tareas.add(tarea)
+        tarea.add_done_callback(self._tareas.discard)
+
+    async def _resolver(self, lote: Dict[int, 'asyncio.Future[Optional[Usuario]]']) -> None:
+        """Consulta el lote y entrega a cada Future su usuario"""
+        logger.debug('🔍 Cargando lote de %s usuarios', len(lote))
+        try:
+            usuarios = await self._cargar_lote(list(lote))
+        except Exception as e:
+            logger.error('❌ Error cargando lote de %s usuarios: %s', len(lote), e)
+            for id_usuario, futuro in lote.items():
+                # Un error no queda memorizado: el próximo cargar() reintenta
+                if self._memoria.get(id_usuario) is futuro:
+                    del self._memoria[id_usuario]
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+
+        for id_usuario, futuro in lote.items():
+            if not futuro.done():
+                futuro.set_result(usuarios.get(id_usuario))
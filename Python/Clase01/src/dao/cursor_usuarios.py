@@ -0,0 +1,49 @@
+"""
+Cursor que Entrega Usuarios
+===========================
+
+cursor_factory de psycopg2 que convierte cada fila
+(id_usuario, username, password, email) en un Usuario al leerla:
+
+    with CursorDelPool(cursor_factory=CursorUsuarios) as cursor:
+        cursor.execute(UsuarioDao._SELECCIONAR)
+        usuarios = cursor.fetchall()   # List[Usuario]
+
+Construye los objetos con argumentos posicionales (itertools.starmap),
+sin diccionarios intermedios ni try/except por fila.
+"""
+
+from itertools import starmap
+from typing import Iterator, List, Optional
+from psycopg2.extensions import cursor
+from src.models.usuario import Usuario
+
+
+class CursorUsuarios(cursor):
+    """
+    Cursor cuyos fetch*() e iteración retornan Usuario en lugar de tuplas
+
+    Solo sirve para consultas que seleccionan exactamente
+    id_usuario, username, password, email en ese orden.
+    """
+
+    def fetchone(self) -> Optional[Usuario]:
+        fila = super().fetchone()
+        return Usuario(*fila) if fila is not None else None
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Usuario]:
+        filas = super().fetchmany() if size is None else super().fetchmany(size)
+        return list(starmap(Usuario, filas))
+
+    def fetchall(self) -> List[Usuario]:
+        return list(starmap(Usuario, super().fetchall()))
+
+    def __iter__(self) -> Iterator[Usuario]:
+        # __next__ de psycopg2 (en C) trae bloques de itersize en cursores con nombre
+        siguiente = super().__next__
+        while True:
+            try:
+                fila = siguiente()
+            except StopIteration:
+                return
+            yield Usuario(*fila)
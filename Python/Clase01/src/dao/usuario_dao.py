@@ -6,11 +6,30 @@ Implementa el patrón DAO para operaciones CRUD según diagrama UML
 Manejo robusto de excepciones para evitar detener la ejecución
 """
 
-from typing import List, Optional
+import time
+import uuid
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, TypeVar
+from psycopg2 import errors
+from psycopg2.extras import execute_values
+from config.database_config import DatabaseConfig
+from src.database.consultas_lentas import ConsultasLentas
 from src.database.cursor_del_pool import CursorDelPool
+from src.database.resiliencia import PoliticaReintentos
+from src.database.transaccion import Transaccion
+from src.dao.cursor_usuarios import CursorUsuarios
+from src.database.sentencias_preparadas import SentenciasPreparadas
 from src.models.usuario import Usuario
+from src.utils.cache_lru import CacheLRU
+from src.utils.contrasenas import Contrasenas
+from src.utils.formato_json import evento
+from src.utils.metricas import RegistroMetricas
 from src.utils.logger_base import LoggerBase
 
+# Logger hijo de 'usuario_app', obtenido una sola vez al importar el módulo
+logger = LoggerBase.get_logger('dao')
+
+T = TypeVar('T')
+
 class UsuarioDao:
     """
     Clase DAO (Data Access Object) para operaciones CRUD de usuarios
@@ -18,6 +37,19 @@ class UsuarioDao:
     Implementa las sentencias SQL y métodos según diagrama UML:
     - SELECCIONAR, INSERTAR, ACTUALIZAR, ELIMINAR
     - seleccionar(), insertar(), actualizar(), eliminar()
+    
+    Las lecturas (seleccionar*, contar_usuarios) usan CursorDelPool(lectura=True)
+    y pueden servirse desde una réplica; las escrituras van al primario. Las
+    lecturas no abren transacción (solo lectura): un viaje al servidor por SELECT.
+    
+    Las operaciones idempotentes (lecturas y actualizar) se reintentan con
+    espera exponencial ante errores transitorios (conexión perdida,
+    failover, deadlock); insertar y eliminar no, porque repetirlas tras un
+    commit incierto duplicaría la fila o informaría 0 registros.
+    
+    Las contraseñas se guardan como hash (Contrasenas): insertar y los lotes
+    hashean la contraseña recibida, actualizar solo si difiere de la guardada,
+    y autenticar() las verifica.
     """
     
     # === SENTENCIAS SQL SEGÚN UML ===
@@ -27,22 +59,79 @@ class UsuarioDao:
         ORDER BY id_usuario
     """
     
+    _SELECCIONAR_PAGINA: str = """
+        SELECT id_usuario, username, password, email 
+        FROM usuario 
+        WHERE id_usuario > %s
+        ORDER BY id_usuario
+        LIMIT %s
+    """
+    
     _SELECCIONAR_POR_ID: str = """
         SELECT id_usuario, username, password, email 
         FROM usuario 
         WHERE id_usuario = %s
     """
     
+    # Un viaje por bloque de ids en seleccionar_por_ids()
+    _SELECCIONAR_POR_IDS: str = """
+        SELECT id_usuario, username, password, email 
+        FROM usuario 
+        WHERE id_usuario = ANY(%s)
+    """
+    
+    # Búsquedas de buscar(): prefijo con el índice (username COLLATE "C"),
+    # email sin distinguir mayúsculas con el índice lower(email)
+    _BUSCAR_POR_PREFIJO: str = """
+        SELECT id_usuario, username, password, email 
+        FROM usuario 
+        WHERE username COLLATE "C" LIKE %s
+        ORDER BY username COLLATE "C"
+        LIMIT %s
+    """
+    
+    _BUSCAR_POR_EMAIL: str = """
+        SELECT id_usuario, username, password, email 
+        FROM usuario 
+        WHERE lower(email) = lower(%s)
+        ORDER BY id_usuario
+        LIMIT %s
+    """
+    
+    _BUSCAR_POR_EMAIL_Y_PREFIJO: str = """
+        SELECT id_usuario, username, password, email 
+        FROM usuario 
+        WHERE lower(email) = lower(%s) AND username COLLATE "C" LIKE %s
+        ORDER BY id_usuario
+        LIMIT %s
+    """
+    
     _INSERTAR: str = """
         INSERT INTO usuario(username, password, email) 
         VALUES(%s, %s, %s)
         RETURNING id_usuario
     """
     
+    # La contraseña recibida igual a la guardada (el hash leído) no cambia;
+    # cualquier otro valor es una contraseña nueva y se guarda su hash
     _ACTUALIZAR: str = """
         UPDATE usuario 
-        SET username=%s, password=%s, email=%s 
+        SET username=%s, password=CASE WHEN password=%s THEN password ELSE %s END, email=%s 
         WHERE id_usuario=%s
+        RETURNING password
+    """
+    
+    _SELECCIONAR_POR_USERNAME: str = """
+        SELECT id_usuario, username, password, email 
+        FROM usuario 
+        WHERE username = %s
+    """
+    
+    # Rehash al autenticar: solo si nadie cambió la contraseña entre la lectura y la escritura
+    _ACTUALIZAR_PASSWORD: str = """
+        UPDATE usuario 
+        SET password=%s 
+        WHERE id_usuario=%s AND password=%s
     """
     
     _ELIMINAR: str = """
@@ -50,12 +139,66 @@ class UsuarioDao:
         WHERE id_usuario=%s
     """
     
-    _VERIFICAR_USERNAME: str = """
-        SELECT COUNT(*) 
-        FROM usuario 
-        WHERE username = %s AND id_usuario != COALESCE(%s, -1)
+    _INSERTAR_LOTE: str = """
+        INSERT INTO usuario(username, password, email) 
+        VALUES %s
+        ON CONFLICT (username) DO NOTHING
+        RETURNING id_usuario, username
+    """
+    
+    _UPSERT_LOTE: str = """
+        INSERT INTO usuario(username, password, email) 
+        VALUES %s
+        ON CONFLICT (username) DO UPDATE 
+        SET password = EXCLUDED.password, email = EXCLUDED.email
+        RETURNING id_usuario, username
     """
     
+    _CONTAR: str = "SELECT COUNT(*) FROM usuario"
+    
+    # Estimación del planner: filas por página del último ANALYZE × páginas actuales
+    _CONTAR_ESTIMADO: str = """
+        SELECT CASE
+            WHEN c.reltuples < 0 THEN -1
+            WHEN c.relpages = 0 THEN c.reltuples::bigint
+            ELSE (c.reltuples / c.relpages
+                  * (pg_relation_size(c.oid) / current_setting('block_size')::int))::bigint
+        END
+        FROM pg_class c
+        WHERE c.oid = 'usuario'::regclass
+    """
+    
+    # Fila única mantenida por los triggers de scripts/database_setup.sql
+    _CONTAR_CONTADOR: str = "SELECT total FROM usuario_conteo"
+    
+    # Estrategias de contar_usuarios() y la sentencia de cada una
+    _ESTRATEGIAS_CONTEO: Dict[str, str] = {
+        'exacto': '_CONTAR',
+        'estimado': '_CONTAR_ESTIMADO',
+        'contador': '_CONTAR_CONTADOR',
+    }
+    _ESTRATEGIA_CONTEO: str = DatabaseConfig.COUNT_STRATEGY
+    # Estrategias ya avisadas como no disponibles (el aviso sale una sola vez)
+    _conteos_no_disponibles: Set[str] = set()
+    
+    # Reintentos ante errores transitorios (DB_RETRY_*)
+    _reintentos: PoliticaReintentos = PoliticaReintentos(
+        DatabaseConfig.RETRY_ATTEMPTS, DatabaseConfig.RETRY_BASE_SECONDS, DatabaseConfig.RETRY_MAX_SECONDS
+    )
+    
+    # Filas por sentencia INSERT multi-VALUES en las operaciones por lote
+    _TAMANO_LOTE: int = 1000
+    
+    # Filas por viaje al servidor en seleccionar_stream()
+    _ITERSIZE: int = 2000
+    
+    # Cache opcional para seleccionar_por_id() y contar_usuarios() (None = desactivado)
+    _cache: Optional[CacheLRU] = (
+        CacheLRU(DatabaseConfig.CACHE_MAX_SIZE, DatabaseConfig.CACHE_TTL)
+        if DatabaseConfig.CACHE_ENABLED else None
+    )
+    _CLAVE_CONTEO: str = 'contar_usuarios'
+    
     @classmethod
     def seleccionar(cls) -> List[Usuario]:
         """
@@ -66,39 +209,209 @@ class UsuarioDao:
             Lista de usuarios o lista vacía si hay error
         """
         usuarios = []
+        inicio = time.perf_counter()
         try:
-            logger = LoggerBase().logger
             logger.debug('🔍 Iniciando selección de todos los usuarios...')
             
-            with CursorDelPool() as cursor:
+            def consultar() -> Optional[List[Usuario]]:
+                with CursorDelPool(lectura=True, cursor_factory=CursorUsuarios) as cursor:
+                    if cursor is None:
+                        return None
+                    cls._ejecutar(cursor, '_SELECCIONAR')
+                    # CursorUsuarios construye cada Usuario directo desde la tupla
+                    return cursor.fetchall()
+            
+            resultado = cls._con_reintentos('seleccionar', consultar)
+            if resultado is None:
+                logger.error('❌ No se pudo obtener cursor para seleccionar usuarios')
+                return usuarios
+            
+            usuarios = resultado
+            logger.info('✅ Usuarios seleccionados: %s', len(usuarios),
+                        extra=evento('seleccionar', inicio, len(usuarios)))
+                
+        except Exception as e:
+            logger.error('❌ Error al seleccionar usuarios: %s', e)
+            # Retornar lista vacía en lugar de fallar
+            
+        return usuarios
+    
+    @classmethod
+    def seleccionar_stream(cls, itersize: Optional[int] = None) -> Iterator[Usuario]:
+        """
+        Recorre todos los usuarios en memoria constante
+        
+        Usa un cursor del lado del servidor: las filas llegan en bloques de
+        `itersize` y se construye un Usuario a la vez. La conexión queda
+        ocupada hasta que el generador se agota o se cierra.
+        
+        Args:
+            itersize: Filas por viaje al servidor (por defecto _ITERSIZE)
+            
+        Yields:
+            Usuario por cada registro, ordenados por id_usuario
+        """
+        total = 0
+        inicio = time.perf_counter()
+        try:
+            logger.debug('🔍 Iniciando recorrido de usuarios con cursor del servidor...')
+            
+            nombre = f'usuarios_stream_{uuid.uuid4().hex}'
+            with CursorDelPool(nombre=nombre, itersize=itersize or cls._ITERSIZE, lectura=True,
+                               cursor_factory=CursorUsuarios) as cursor:
                 if cursor is None:
-                    logger.error('❌ No se pudo obtener cursor para seleccionar usuarios')
-                    return usuarios
+                    logger.error('❌ No se pudo obtener cursor para recorrer usuarios')
+                    return
                 
                 cursor.execute(cls._SELECCIONAR)
-                registros = cursor.fetchall()
+                for usuario in cursor:
+                    total += 1
+                    yield usuario
                 
-                for registro in registros:
-                    try:
-                        usuario = Usuario(
-                            id_usuario=registro[0],
-                            username=registro[1], 
-                            password=registro[2],
-                            email=registro[3]
-                        )
-                        usuarios.append(usuario)
-                    except Exception as e:
-                        logger.error(f'❌ Error creando usuario desde registro {registro}: {e}')
-                        continue  # Continuar con los demás registros
+            logger.info('✅ Usuarios recorridos: %s', total,
+                        extra=evento('seleccionar_stream', inicio, total))
+            
+        except Exception as e:
+            logger.error('❌ Error al recorrer usuarios (tras %s registros): %s', total, e)
+    
+    @classmethod
+    def seleccionar_pagina(cls, after_id: Optional[int] = None, limit: int = 100) -> List[Usuario]:
+        """
+        Selecciona una página de usuarios por keyset (id_usuario > after_id)
+        
+        A diferencia de OFFSET, el costo no crece con el número de página:
+        la siguiente página se pide con el id_usuario del último elemento.
+        
+        Args:
+            after_id: Último id_usuario de la página anterior (None para la primera)
+            limit: Máximo de usuarios por página
+            
+        Returns:
+            Lista de usuarios (vacía al final o si hay error)
+        """
+        usuarios = []
+        inicio = time.perf_counter()
+        try:
+            logger.debug('🔍 Seleccionando página de usuarios: after_id=%s, limit=%s', after_id, limit)
+            
+            def consultar() -> Optional[List[Usuario]]:
+                with CursorDelPool(lectura=True, cursor_factory=CursorUsuarios) as cursor:
+                    if cursor is None:
+                        return None
+                    cls._ejecutar(cursor, '_SELECCIONAR_PAGINA', (after_id or 0, limit))
+                    return cursor.fetchall()
+            
+            resultado = cls._con_reintentos('seleccionar_pagina', consultar)
+            if resultado is None:
+                logger.error('❌ No se pudo obtener cursor para seleccionar página')
+                return usuarios
+            
+            usuarios = resultado
+            logger.info('✅ Página de usuarios seleccionada: %s', len(usuarios),
+                        extra=evento('seleccionar_pagina', inicio, len(usuarios)))
                 
-                logger.info(f'✅ Usuarios seleccionados: {len(usuarios)}')
+        except Exception as e:
+            logger.error('❌ Error al seleccionar página de usuarios: %s', e)
+            
+        return usuarios
+    
+    @classmethod
+    def buscar(cls, username_prefix: Optional[str] = None, email: Optional[str] = None,
+               limit: int = 100) -> List[Usuario]:
+        """
+        Busca usuarios por prefijo de username y/o email usando índices
+        
+        El prefijo distingue mayúsculas ('ana' no encuentra 'Ana'); el email
+        se compara sin distinguirlas. Con ambos criterios se aplican los dos.
+        
+        Args:
+            username_prefix: Comienzo del username (los % y _ se buscan literalmente)
+            email: Email exacto
+            limit: Máximo de usuarios a retornar
+            
+        Returns:
+            Lista de usuarios (por username si solo hay prefijo, por id con email)
+            o lista vacía si no hay criterios o hay error
+        """
+        usuarios = []
+        if not username_prefix and not email:
+            logger.error('❌ buscar() requiere username_prefix o email')
+            return usuarios
+        if limit <= 0:
+            return usuarios
+        
+        inicio = time.perf_counter()
+        try:
+            logger.debug('🔍 Buscando usuarios: username_prefix=%s, email=%s, limit=%s',
+                         username_prefix, email, limit)
+            
+            patron = cls._patron_prefijo(username_prefix) if username_prefix else None
+            if email and patron:
+                sentencia, params = '_BUSCAR_POR_EMAIL_Y_PREFIJO', (email, patron, limit)
+            elif email:
+                sentencia, params = '_BUSCAR_POR_EMAIL', (email, limit)
+            else:
+                sentencia, params = '_BUSCAR_POR_PREFIJO', (patron, limit)
+            
+            def consultar() -> Optional[List[Usuario]]:
+                with CursorDelPool(lectura=True, cursor_factory=CursorUsuarios) as cursor:
+                    if cursor is None:
+                        return None
+                    cls._ejecutar(cursor, sentencia, params)
+                    return cursor.fetchall()
+            
+            resultado = cls._con_reintentos('buscar', consultar)
+            if resultado is None:
+                logger.error('❌ No se pudo obtener cursor para buscar usuarios')
+                return usuarios
+            
+            usuarios = resultado
+            logger.info('✅ Usuarios encontrados: %s', len(usuarios),
+                        extra=evento('buscar', inicio, len(usuarios)))
                 
         except Exception as e:
-            logger.error(f'❌ Error al seleccionar usuarios: {e}')
-            # Retornar lista vacía en lugar de fallar
+            logger.error('❌ Error al buscar usuarios: %s', e)
             
         return usuarios
     
+    @classmethod
+    def _con_reintentos(cls, operacion: str, funcion: Callable[[], T]) -> T:
+        """
+        Ejecuta una operación idempotente reintentando errores transitorios
+        
+        Dentro de una Transaccion no se reintenta: el error ya la marcó
+        para rollback y repetir solo esta operación rompería la atomicidad.
+        """
+        return cls._reintentos.ejecutar(funcion, operacion,
+                                        reintentable=lambda: Transaccion.actual() is None)
+    
+    @staticmethod
+    def _patron_prefijo(prefijo: str) -> str:
+        """Patrón LIKE 'prefijo%' con los comodines del prefijo escapados"""
+        escapado = prefijo.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f'{escapado}%'
+    
+    @classmethod
+    def _ejecutar(cls, cursor, sentencia: str, params: Optional[tuple] = None) -> None:
+        """
+        Ejecuta una de las sentencias SQL fijas de la clase
+        
+        Con sentencias preparadas activas (DB_PREPARED_STATEMENTS), cada
+        conexión hace PREPARE una sola vez y luego solo EXECUTE. La duración
+        se registra en RegistroMetricas con la etiqueta statement=<sentencia>
+        y, si supera DB_SLOW_QUERY_MS, en el log de consultas lentas.
+        
+        Args:
+            cursor: Cursor obtenido de CursorDelPool
+            sentencia: Nombre de la constante SQL (p.ej. '_SELECCIONAR_POR_ID')
+            params: Parámetros de la sentencia
+        """
+        sql = getattr(cls, sentencia)
+        inicio = time.perf_counter()
+        with RegistroMetricas.medir('db_query_duration_seconds', statement=sentencia):
+            SentenciasPreparadas.ejecutar(cursor, f'usuario_dao{sentencia.lower()}', sql, params)
+        ConsultasLentas.verificar(sentencia, sql, params, time.perf_counter() - inicio)
+    
     @classmethod
     def seleccionar_por_id(cls, id_usuario: int) -> Optional[Usuario]:
         """
@@ -110,35 +423,107 @@ class UsuarioDao:
         Returns:
             Usuario encontrado o None si no existe o hay error
         """
+        inicio = time.perf_counter()
         try:
-            logger = LoggerBase().logger
-            logger.debug(f'🔍 Buscando usuario con ID: {id_usuario}')
+            logger.debug('🔍 Buscando usuario con ID: %s', id_usuario)
             
-            with CursorDelPool() as cursor:
-                if cursor is None:
-                    logger.error('❌ No se pudo obtener cursor para buscar usuario')
-                    return None
-                
-                cursor.execute(cls._SELECCIONAR_POR_ID, (id_usuario,))
-                registro = cursor.fetchone()
-                
-                if registro:
-                    usuario = Usuario(
-                        id_usuario=registro[0],
-                        username=registro[1],
-                        password=registro[2], 
-                        email=registro[3]
-                    )
-                    logger.info(f'✅ Usuario encontrado: {usuario.username}')
-                    return usuario
-                else:
-                    logger.info(f'⚠️  Usuario con ID {id_usuario} no encontrado')
-                    return None
+            usuario = cls._obtener_de_cache(id_usuario)
+            if usuario is not None:
+                logger.debug('⚡ Usuario %s obtenido del cache', id_usuario)
+                return usuario
+            
+            def consultar() -> tuple:
+                with CursorDelPool(lectura=True, cursor_factory=CursorUsuarios) as cursor:
+                    if cursor is None:
+                        return False, None
+                    cls._ejecutar(cursor, '_SELECCIONAR_POR_ID', (id_usuario,))
+                    return True, cursor.fetchone()
+            
+            con_cursor, usuario = cls._con_reintentos('seleccionar_por_id', consultar)
+            if not con_cursor:
+                logger.error('❌ No se pudo obtener cursor para buscar usuario')
+                return None
+            
+            if usuario:
+                if cls._puede_cachear():
+                    cls._cache.guardar(('usuario', usuario.id_usuario), usuario.to_dict())
+                logger.info('✅ Usuario encontrado: %s', usuario.username,
+                            extra=evento('seleccionar_por_id', inicio, 1))
+                return usuario
+            else:
+                logger.info('⚠️  Usuario con ID %s no encontrado', id_usuario,
+                            extra=evento('seleccionar_por_id', inicio, 0))
+                return None
                     
         except Exception as e:
-            logger.error(f'❌ Error al buscar usuario por ID {id_usuario}: {e}')
+            logger.error('❌ Error al buscar usuario por ID %s: %s', id_usuario, e)
             return None
     
+    @classmethod
+    def seleccionar_por_ids(cls, ids: Iterable[int], tamano_lote: Optional[int] = None) -> Dict[int, Usuario]:
+        """
+        Selecciona muchos usuarios por ID con una consulta por bloque
+        
+        Reemplaza N llamadas a seleccionar_por_id() (N conexiones, consultas
+        y commits) por una consulta WHERE id_usuario = ANY(%s) por cada
+        `tamano_lote` ids, todas con la misma conexión. Los ids repetidos se
+        consultan una vez y los que están en cache no se consultan.
+        
+        Args:
+            ids: IDs a buscar (en cualquier orden, con repetidos)
+            tamano_lote: IDs por consulta (por defecto _TAMANO_LOTE)
+            
+        Returns:
+            Diccionario id_usuario -> Usuario con los encontrados (los
+            inexistentes no aparecen) o diccionario vacío si hay error
+        """
+        usuarios: Dict[int, Usuario] = {}
+        pendientes = list(dict.fromkeys(ids))
+        if not pendientes:
+            return usuarios
+        
+        inicio = time.perf_counter()
+        try:
+            logger.debug('🔍 Buscando %s usuarios por ID', len(pendientes))
+            
+            if cls._cache is not None:
+                for id_usuario in pendientes:
+                    usuario = cls._obtener_de_cache(id_usuario)
+                    if usuario is not None:
+                        usuarios[id_usuario] = usuario
+                pendientes = [id_usuario for id_usuario in pendientes if id_usuario not in usuarios]
+            
+            if pendientes:
+                tamano = max(tamano_lote or cls._TAMANO_LOTE, 1)
+                
+                def consultar() -> Optional[List[Usuario]]:
+                    with CursorDelPool(lectura=True, cursor_factory=CursorUsuarios) as cursor:
+                        if cursor is None:
+                            return None
+                        encontrados = []
+                        for desde in range(0, len(pendientes), tamano):
+                            cls._ejecutar(cursor, '_SELECCIONAR_POR_IDS', (pendientes[desde:desde + tamano],))
+                            encontrados.extend(cursor.fetchall())
+                        return encontrados
+                
+                encontrados = cls._con_reintentos('seleccionar_por_ids', consultar)
+                if encontrados is None:
+                    logger.error('❌ No se pudo obtener cursor para buscar usuarios por ID')
+                    return {}
+                
+                for usuario in encontrados:
+                    usuarios[usuario.id_usuario] = usuario
+                    if cls._puede_cachear():
+                        cls._cache.guardar(('usuario', usuario.id_usuario), usuario.to_dict())
+            
+            logger.info('✅ Usuarios encontrados por ID: %s', len(usuarios),
+                        extra=evento('seleccionar_por_ids', inicio, len(usuarios)))
+            return usuarios
+            
+        except Exception as e:
+            logger.error('❌ Error al buscar usuarios por ID: %s', e)
+            return {}
+    
     @classmethod
     def insertar(cls, usuario: Usuario) -> int:
         """
@@ -151,37 +536,44 @@ class UsuarioDao:
         Returns:
             Número de registros insertados (1 si éxito, 0 si error)
         """
+        inicio = time.perf_counter()
         try:
-            logger = LoggerBase().logger
-            logger.debug(f'📝 Insertando usuario: {usuario.username}')
+            logger.debug('📝 Insertando usuario: %s', usuario.username)
             
             # Validar datos del usuario
             if not usuario.is_valid():
                 logger.error('❌ Usuario no válido para insertar')
                 return 0
             
-            # Verificar que el username no exista
-            if cls._verificar_username_existe(usuario.username):
-                logger.error(f'❌ El username "{usuario.username}" ya existe')
-                return 0
+            # El hash se calcula antes de tomar la conexión del pool
+            password = Contrasenas.hashear(usuario.password)
             
             with CursorDelPool() as cursor:
                 if cursor is None:
                     logger.error('❌ No se pudo obtener cursor para insertar usuario')
                     return 0
                 
-                valores = (usuario.username, usuario.password, usuario.email)
-                cursor.execute(cls._INSERTAR, valores)
+                valores = (usuario.username, password, usuario.email)
+                cls._ejecutar(cursor, '_INSERTAR', valores)
                 
                 # Obtener el ID del usuario insertado
                 id_insertado = cursor.fetchone()[0]
                 usuario.id_usuario = id_insertado
+                usuario.password = password
                 
-                logger.info(f'✅ Usuario insertado exitosamente con ID: {id_insertado}')
-                return 1
+                logger.info('✅ Usuario insertado exitosamente con ID: %s', id_insertado,
+                            extra=evento('insertar', inicio, 1))
+            
+            # Invalidar después del commit para no re-cachear datos previos
+            cls._invalidar_cache()
+            return 1
                 
+        except errors.UniqueViolation as e:
+            # La restricción UNIQUE decide en la misma sentencia (sin carrera check/escritura)
+            logger.error('❌ El username "%s" ya existe (%s)', usuario.username, e.diag.constraint_name)
+            return 0
         except Exception as e:
-            logger.error(f'❌ Error al insertar usuario {usuario.username}: {e}')
+            logger.error('❌ Error al insertar usuario %s: %s', usuario.username, e)
             return 0
     
     @classmethod
@@ -190,44 +582,62 @@ class UsuarioDao:
         Actualiza un usuario existente en la base de datos
         Método según UML: +actualizar(usuario): int
         
+        Si usuario.password es el valor guardado (el hash leído con
+        seleccionar_por_id) la contraseña no cambia; cualquier otro valor
+        se toma como contraseña nueva en texto plano y se guarda su hash.
+        
         Args:
             usuario: Usuario con datos actualizados
             
         Returns:
             Número de registros actualizados (1 si éxito, 0 si error)
         """
+        inicio = time.perf_counter()
         try:
-            logger = LoggerBase().logger
-            logger.debug(f'📝 Actualizando usuario ID: {usuario.id_usuario}')
+            logger.debug('📝 Actualizando usuario ID: %s', usuario.id_usuario)
             
             # Validar datos del usuario
             if not usuario.is_valid() or usuario.id_usuario is None:
                 logger.error('❌ Usuario no válido para actualizar')
                 return 0
             
-            # Verificar que el username no esté en uso por otro usuario
-            if cls._verificar_username_existe(usuario.username, usuario.id_usuario):
-                logger.error(f'❌ El username "{usuario.username}" ya está en uso')
+            # Se compara con lo guardado en el UPDATE (no por el formato del
+            # valor): un hash recibido que no es el guardado se hashea como texto
+            password = Contrasenas.hashear(usuario.password)
+            
+            valores = (usuario.username, usuario.password, password, usuario.email, usuario.id_usuario)
+            
+            # UPDATE con valores absolutos por ID: repetirlo deja el mismo resultado
+            def escribir() -> Optional[tuple]:
+                with CursorDelPool() as cursor:
+                    if cursor is None:
+                        return None
+                    cls._ejecutar(cursor, '_ACTUALIZAR', valores)
+                    return cursor.rowcount, cursor.fetchone()
+            
+            resultado = cls._con_reintentos('actualizar', escribir)
+            if resultado is None:
+                logger.error('❌ No se pudo obtener cursor para actualizar usuario')
                 return 0
             
-            with CursorDelPool() as cursor:
-                if cursor is None:
-                    logger.error('❌ No se pudo obtener cursor para actualizar usuario')
-                    return 0
-                
-                valores = (usuario.username, usuario.password, usuario.email, usuario.id_usuario)
-                cursor.execute(cls._ACTUALIZAR, valores)
-                
-                registros_afectados = cursor.rowcount
-                if registros_afectados > 0:
-                    logger.info(f'✅ Usuario actualizado exitosamente: {usuario.username}')
-                else:
-                    logger.warning(f'⚠️  No se actualizó ningún registro para ID: {usuario.id_usuario}')
-                
-                return registros_afectados
+            registros_afectados, fila = resultado
+            if registros_afectados > 0:
+                usuario.password = fila[0]
+                logger.info('✅ Usuario actualizado exitosamente: %s', usuario.username,
+                            extra=evento('actualizar', inicio, registros_afectados))
+            else:
+                logger.warning('⚠️  No se actualizó ningún registro para ID: %s', usuario.id_usuario,
+                               extra=evento('actualizar', inicio, 0))
+            
+            if registros_afectados > 0:
+                cls._invalidar_cache(usuario.id_usuario)
+            return registros_afectados
                 
+        except errors.UniqueViolation as e:
+            logger.error('❌ El username "%s" ya está en uso (%s)', usuario.username, e.diag.constraint_name)
+            return 0
         except Exception as e:
-            logger.error(f'❌ Error al actualizar usuario ID {usuario.id_usuario}: {e}')
+            logger.error('❌ Error al actualizar usuario ID %s: %s', usuario.id_usuario, e)
             return 0
     
     @classmethod
@@ -242,9 +652,9 @@ class UsuarioDao:
         Returns:
             Número de registros eliminados (1 si éxito, 0 si error)
         """
+        inicio = time.perf_counter()
         try:
-            logger = LoggerBase().logger
-            logger.debug(f'🗑️  Eliminando usuario ID: {usuario.id_usuario}')
+            logger.debug('🗑️  Eliminando usuario ID: %s', usuario.id_usuario)
             
             if usuario.id_usuario is None:
                 logger.error('❌ No se puede eliminar usuario sin ID')
@@ -255,64 +665,364 @@ class UsuarioDao:
                     logger.error('❌ No se pudo obtener cursor para eliminar usuario')
                     return 0
                 
-                cursor.execute(cls._ELIMINAR, (usuario.id_usuario,))
+                cls._ejecutar(cursor, '_ELIMINAR', (usuario.id_usuario,))
                 
                 registros_afectados = cursor.rowcount
                 if registros_afectados > 0:
-                    logger.info(f'✅ Usuario eliminado exitosamente: {usuario.username}')
+                    logger.info('✅ Usuario eliminado exitosamente: %s', usuario.username,
+                                extra=evento('eliminar', inicio, registros_afectados))
                 else:
-                    logger.warning(f'⚠️  No se eliminó ningún registro para ID: {usuario.id_usuario}')
-                
-                return registros_afectados
+                    logger.warning('⚠️  No se eliminó ningún registro para ID: %s', usuario.id_usuario,
+                                   extra=evento('eliminar', inicio, 0))
+            
+            if registros_afectados > 0:
+                cls._invalidar_cache(usuario.id_usuario)
+            return registros_afectados
                 
         except Exception as e:
-            logger.error(f'❌ Error al eliminar usuario ID {usuario.id_usuario}: {e}')
+            logger.error('❌ Error al eliminar usuario ID %s: %s', usuario.id_usuario, e)
             return 0
     
     @classmethod
-    def _verificar_username_existe(cls, username: str, excluir_id: Optional[int] = None) -> bool:
+    def insertar_lote(cls, usuarios: List[Usuario], tamano_lote: Optional[int] = None) -> List[Optional[int]]:
         """
-        Verifica si un username ya existe en la base de datos
+        Inserta muchos usuarios en una sola transacción con INSERT multi-VALUES
+        
+        Los usernames ya existentes (o repetidos dentro del lote) se omiten
+        mediante ON CONFLICT (username) DO NOTHING, sin consulta previa.
         
         Args:
-            username: Username a verificar
-            excluir_id: ID a excluir de la verificación (para actualizaciones)
+            usuarios: Usuarios a insertar
+            tamano_lote: Filas por sentencia INSERT (por defecto _TAMANO_LOTE)
             
         Returns:
-            bool: True si el username existe, False en caso contrario
+            IDs generados en el mismo orden de entrada (None para los omitidos o si hay error)
+        """
+        return cls._ejecutar_lote(cls._INSERTAR_LOTE, usuarios, tamano_lote, 'insertar_lote')
+    
+    @classmethod
+    def upsert_lote(cls, usuarios: List[Usuario], tamano_lote: Optional[int] = None) -> List[Optional[int]]:
         """
+        Inserta o actualiza (por username) muchos usuarios en una sola transacción
+        
+        Si un username aparece varias veces en el lote, prevalece la última aparición.
+        Cada password se toma como texto plano y se guarda su hash.
+        
+        Args:
+            usuarios: Usuarios a insertar o actualizar
+            tamano_lote: Filas por sentencia INSERT (por defecto _TAMANO_LOTE)
+            
+        Returns:
+            IDs (nuevos o existentes) en el mismo orden de entrada (None para inválidos o si hay error)
+        """
+        return cls._ejecutar_lote(cls._UPSERT_LOTE, usuarios, tamano_lote, 'upsert_lote')
+    
+    @classmethod
+    def _ejecutar_lote(cls, sql: str, usuarios: List[Usuario],
+                       tamano_lote: Optional[int], operacion: str) -> List[Optional[int]]:
+        """
+        Ejecuta una sentencia INSERT ... VALUES %s por páginas dentro de una transacción
+        
+        Args:
+            sql: _INSERTAR_LOTE o _UPSERT_LOTE
+            usuarios: Usuarios a enviar
+            tamano_lote: Filas por sentencia
+            operacion: Nombre de la operación para los logs
+            
+        Returns:
+            IDs en el orden de entrada; también se asignan a cada usuario
+        """
+        ids: List[Optional[int]] = [None] * len(usuarios)
+        if not usuarios:
+            return ids
+        
+        inicio = time.perf_counter()
         try:
+            logger.debug('📝 %s: %s usuarios', operacion, len(usuarios))
+            
+            # Una sola fila por username para que ON CONFLICT no afecte dos veces
+            # la misma fila: en inserción gana la primera aparición, en upsert la última
+            ultima_gana = sql is cls._UPSERT_LOTE
+            posiciones: Dict[str, int] = {}
+            for posicion, usuario in enumerate(usuarios):
+                if not usuario.is_valid():
+                    logger.warning('⚠️  Usuario no válido omitido en %s: %r', operacion, usuario)
+                elif ultima_gana or usuario.username not in posiciones:
+                    posiciones[usuario.username] = posicion
+            
+            if not posiciones:
+                return ids
+            
+            # Los hashes del lote se reparten entre los hilos del pool de Contrasenas
+            passwords = Contrasenas.hashear_lote([usuarios[posicion].password for posicion in posiciones.values()])
+            filas = [(usuarios[posicion].username, password, usuarios[posicion].email)
+                     for posicion, password in zip(posiciones.values(), passwords)]
+            
             with CursorDelPool() as cursor:
                 if cursor is None:
-                    return False
-                
-                cursor.execute(cls._VERIFICAR_USERNAME, (username, excluir_id))
-                resultado = cursor.fetchone()
-                
-                return resultado[0] > 0 if resultado else False
+                    logger.error('❌ No se pudo obtener cursor para %s', operacion)
+                    return ids
                 
+                sentencia = '_UPSERT_LOTE' if ultima_gana else '_INSERTAR_LOTE'
+                inicio_sentencia = time.perf_counter()
+                with RegistroMetricas.medir('db_query_duration_seconds', statement=sentencia):
+                    resultado = execute_values(
+                        cursor, sql, filas,
+                        page_size=tamano_lote or cls._TAMANO_LOTE,
+                        fetch=True
+                    )
+                # VALUES %s se expande por páginas: no hay una sentencia única que explicar
+                ConsultasLentas.verificar(sentencia, sql, filas, time.perf_counter() - inicio_sentencia,
+                                          explicable=False)
+            
+            # RETURNING no garantiza orden: se asocia cada ID por username
+            password_de = {fila[0]: fila[1] for fila in filas}
+            for id_usuario, username in resultado:
+                posicion = posiciones[username]
+                usuarios[posicion].id_usuario = id_usuario
+                usuarios[posicion].password = password_de[username]
+                ids[posicion] = id_usuario
+            
+            cls._invalidar_cache(*(id_usuario for id_usuario, _ in resultado))
+            
+            logger.info('✅ %s: %s de %s usuarios escritos', operacion, len(resultado), len(usuarios),
+                        extra=evento(operacion, inicio, len(resultado)))
+            return ids
+            
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error verificando username: {e}')
-            return False
+            logger.error('❌ Error en %s: %s', operacion, e)
+            return [None] * len(usuarios)
     
     @classmethod
-    def contar_usuarios(cls) -> int:
+    def autenticar(cls, username: str, password: str) -> Optional[Usuario]:
         """
-        Cuenta el total de usuarios en la base de datos
+        Verifica username y contraseña contra el hash guardado
         
+        La verificación corre en el pool de Contrasenas. Un username
+        inexistente cuesta lo mismo que uno real (no revela si existe).
+        Si el valor guardado es texto plano heredado o usa otro algoritmo
+        o costo, se reemplaza por un hash actual con la contraseña recibida.
+        
+        Args:
+            username: Username del usuario
+            password: Contraseña en texto plano
+            
         Returns:
-            int: Número total de usuarios
+            Usuario autenticado o None si las credenciales no son válidas o hay error
         """
+        inicio = time.perf_counter()
+        try:
+            logger.debug('🔐 Autenticando usuario: %s', username)
+            
+            def consultar() -> tuple:
+                # Primario: una contraseña recién cambiada debe valer de inmediato
+                with CursorDelPool(solo_lectura=True, cursor_factory=CursorUsuarios) as cursor:
+                    if cursor is None:
+                        return False, None
+                    cls._ejecutar(cursor, '_SELECCIONAR_POR_USERNAME', (username,))
+                    return True, cursor.fetchone()
+            
+            con_cursor, usuario = cls._con_reintentos('autenticar', consultar)
+            if not con_cursor:
+                logger.error('❌ No se pudo obtener cursor para autenticar usuario')
+                return None
+            
+            # La conexión ya volvió al pool mientras corre el KDF
+            almacenado = usuario.password if usuario else None
+            if not Contrasenas.verificar(password, almacenado):
+                RegistroMetricas.incrementar('auth_total', resultado='rechazado')
+                logger.warning('⚠️  Credenciales inválidas para: %s', username,
+                               extra=evento('autenticar', inicio, 0))
+                return None
+            
+            if Contrasenas.necesita_rehash(almacenado):
+                cls._rehashear(usuario, password)
+            
+            RegistroMetricas.incrementar('auth_total', resultado='aceptado')
+            logger.info('✅ Usuario autenticado: %s', username, extra=evento('autenticar', inicio, 1))
+            return usuario
+            
+        except Exception as e:
+            logger.error('❌ Error al autenticar usuario %s: %s', username, e)
+            return None
+    
+    @classmethod
+    def _rehashear(cls, usuario: Usuario, password: str) -> None:
+        """Reemplaza el valor guardado por un hash con el algoritmo y costo actuales"""
+        nuevo = Contrasenas.hashear(password)
         try:
             with CursorDelPool() as cursor:
                 if cursor is None:
-                    return 0
-                
-                cursor.execute("SELECT COUNT(*) FROM usuario")
-                resultado = cursor.fetchone()
-                
-                return resultado[0] if resultado else 0
+                    return
+                cls._ejecutar(cursor, '_ACTUALIZAR_PASSWORD', (nuevo, usuario.id_usuario, usuario.password))
+                actualizado = cursor.rowcount > 0
+        except Exception as e:
+            # El login ya fue válido: el rehash se reintenta en el próximo
+            logger.warning('⚠️  No se pudo actualizar el hash de %s: %s', usuario.username, e)
+            return
+        
+        if actualizado:
+            usuario.password = nuevo
+            cls._invalidar_cache(usuario.id_usuario)
+            logger.info('🔐 Hash de contraseña actualizado para: %s', usuario.username)
+    
+    @classmethod
+    def contar_usuarios(cls, estrategia: Optional[str] = None) -> int:
+        """
+        Cuenta el total de usuarios en la base de datos
+        
+        Args:
+            estrategia: 'exacto' recorre la tabla con COUNT(*); 'estimado' usa
+                pg_class.reltuples (aproximado, se actualiza con ANALYZE);
+                'contador' lee usuario_conteo, exacto y sin recorrer la tabla.
+                Por defecto DB_COUNT_STRATEGY. Si no están disponibles se
+                usa COUNT(*), salvo que el fallo haya abortado la Transaccion
+                activa (entonces retorna 0 y la transacción hace rollback).
+        
+        Returns:
+            int: Número total de usuarios
+        """
+        estrategia = estrategia or cls._ESTRATEGIA_CONTEO
+        if estrategia not in cls._ESTRATEGIAS_CONTEO:
+            logger.error('❌ Estrategia de conteo desconocida: %s (use %s)',
+                         estrategia, ', '.join(cls._ESTRATEGIAS_CONTEO))
+            return 0
+        if estrategia != 'exacto':
+            total = cls._contar_sin_recorrer(estrategia)
+            if total is not None:
+                return total
+            transaccion = Transaccion.actual()
+            if transaccion is not None and transaccion.fallida:
+                # La consulta falló y abortó la transacción: COUNT(*) también fallaría
+                logger.error('❌ Conteo %s falló dentro de una transacción; se omite COUNT(*)',
+                             estrategia)
+                return 0
+            logger.debug('🔍 Conteo %s no disponible, se usa COUNT(*)', estrategia)
+        
+        try:
+            if cls._cache is not None:
+                total = cls._cache.obtener(cls._CLAVE_CONTEO)
+                if total is not None:
+                    return total
+            
+            def consultar() -> Optional[int]:
+                with CursorDelPool(lectura=True) as cursor:
+                    if cursor is None:
+                        return None
+                    cls._ejecutar(cursor, '_CONTAR')
+                    resultado = cursor.fetchone()
+                    return resultado[0] if resultado else 0
+            
+            total = cls._con_reintentos('contar_usuarios', consultar)
+            if total is None:
+                return 0
+            
+            if cls._puede_cachear():
+                cls._cache.guardar(cls._CLAVE_CONTEO, total)
+            return total
                 
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error contando usuarios: {e}')
+            logger.error('❌ Error contando usuarios: %s', e)
             return 0
+    
+    @classmethod
+    def _contar_sin_recorrer(cls, estrategia: str) -> Optional[int]:
+        """
+        Conteo 'estimado' o 'contador' sin leer la tabla usuario
+        
+        Returns:
+            Total o None si no está disponible (tabla nunca analizada o
+            usuario_conteo sin crear)
+        """
+        def consultar() -> Optional[tuple]:
+            with CursorDelPool(lectura=True) as cursor:
+                if cursor is None:
+                    return None
+                cls._ejecutar(cursor, cls._ESTRATEGIAS_CONTEO[estrategia])
+                return cursor.fetchone()
+        
+        try:
+            resultado = cls._con_reintentos(f'contar_{estrategia}', consultar)
+        except errors.UndefinedTable:
+            cls._avisar_conteo_no_disponible(
+                estrategia, 'no existe la tabla usuario_conteo (ejecute python setup_postgres.py --migrar)')
+            return None
+        except Exception as e:
+            logger.error('❌ Error en conteo %s: %s', estrategia, e)
+            return None
+        
+        if resultado is None:
+            return None
+        # reltuples = -1: la tabla todavía no tiene estadísticas (sin ANALYZE)
+        if resultado[0] is None or resultado[0] < 0:
+            cls._avisar_conteo_no_disponible(estrategia, 'la tabla usuario no tiene estadísticas (ANALYZE)')
+            return None
+        cls._conteos_no_disponibles.discard(estrategia)
+        return int(resultado[0])
+    
+    @classmethod
+    def _avisar_conteo_no_disponible(cls, estrategia: str, motivo: str) -> None:
+        """Avisa con WARNING la primera vez que un conteo no está disponible y luego con DEBUG"""
+        if estrategia in cls._conteos_no_disponibles:
+            logger.debug('🔍 Conteo %s no disponible: %s', estrategia, motivo)
+            return
+        cls._conteos_no_disponibles.add(estrategia)
+        logger.warning('⚠️  Conteo %s no disponible: %s; se usa COUNT(*)', estrategia, motivo)
+    
+    # === CACHE DE LECTURAS ===
+    
+    @classmethod
+    def configurar_cache(cls, max_size: int = DatabaseConfig.CACHE_MAX_SIZE,
+                         ttl: float = DatabaseConfig.CACHE_TTL) -> None:
+        """
+        Activa (o reinicia) el cache de seleccionar_por_id() y contar_usuarios()
+        
+        Args:
+            max_size: Máximo de entradas en el cache
+            ttl: Segundos de vida de cada entrada
+        """
+        cls._cache = CacheLRU(max_size, ttl)
+    
+    @classmethod
+    def desactivar_cache(cls) -> None:
+        """Desactiva el cache: todas las lecturas vuelven a consultar la BD"""
+        cls._cache = None
+    
+    @classmethod
+    def estadisticas_cache(cls) -> dict:
+        """
+        Obtiene los contadores del cache de lecturas
+        
+        Returns:
+            dict: aciertos, fallos, tamaño, etc. o {'activo': False}
+        """
+        if cls._cache is None:
+            return {'activo': False}
+        return {'activo': True, **cls._cache.estadisticas()}
+    
+    @classmethod
+    def _obtener_de_cache(cls, id_usuario: int) -> Optional[Usuario]:
+        """Retorna una copia del usuario cacheado o None si no está"""
+        if cls._cache is None:
+            return None
+        datos = cls._cache.obtener(('usuario', id_usuario))
+        return Usuario.from_dict(datos) if datos is not None else None
+    
+    @classmethod
+    def _puede_cachear(cls) -> bool:
+        """True si el cache está activo y no hay una transacción sin confirmar"""
+        # Dentro de una Transaccion se leen datos propios aún no confirmados
+        return cls._cache is not None and Transaccion.actual() is None
+    
+    @classmethod
+    def _invalidar_cache(cls, *ids_usuario: int) -> None:
+        """Invalida los usuarios indicados y el conteo total"""
+        if cls._cache is None:
+            return
+        claves = (cls._CLAVE_CONTEO, *(('usuario', id_usuario) for id_usuario in ids_usuario))
+        cls._cache.invalidar(*claves)
+        
+        # En una transacción, otro hilo pudo re-cachear el valor anterior antes del commit
+        transaccion = Transaccion.actual()
+        if transaccion is not None:
+            transaccion.al_confirmar(lambda: cls._cache is not None and cls._cache.invalidar(*claves))
@@ -7,5 +7,12 @@ Exporta las clases para manejo de base de datos
 
 from .conexion import Conexion
 from .cursor_del_pool import CursorDelPool
+from .pool_seguro import PoolConexionesSeguro
+from .conexion_async import ConexionAsync
+from .cursor_async import AsyncCursorDelPool
+from .sentencias_preparadas import ConexionPreparada, SentenciasPreparadas
+from .consultas_lentas import ConsultasLentas
+from .transaccion import Transaccion, TransaccionAsync
 
-__all__ = ['Conexion', 'CursorDelPool']
+__all__ = ['Conexion', 'CursorDelPool', 'PoolConexionesSeguro', 'ConexionAsync', 'AsyncCursorDelPool',
+           'ConexionPreparada', 'SentenciasPreparadas', 'ConsultasLentas', 'Transaccion', 'TransaccionAsync']
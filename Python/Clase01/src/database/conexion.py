@@ -4,11 +4,21 @@ Gestión de Conexiones de Base de Datos
 
 Implementa el patrón Singleton para el pool de conexiones PostgreSQL
 Manejo robusto de excepciones según requerimientos UML
+
+Con DB_REPLICA_HOSTS mantiene además un pool por réplica de lectura
+(ver replicas.py); obtenerConexion() siempre entrega una conexión del
+primario y obtenerConexionLectura() una de réplica.
+
+Cada servidor tiene un Disyuntor (ver resiliencia.py): las conexiones
+rotas se descartan al liberarlas y cuentan como fallo; con el circuito
+abierto no se piden conexiones a ese servidor hasta el próximo intento.
 """
 
 import sys
 import os
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from psycopg2 import pool, OperationalError, DatabaseError
 from psycopg2.extensions import connection
 
@@ -16,6 +26,13 @@ from psycopg2.extensions import connection
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from config.database_config import DatabaseConfig
 from src.utils.logger_base import LoggerBase
+from src.utils.metricas import RegistroMetricas
+from .pool_seguro import PoolConexionesSeguro
+from .replicas import SelectorReplicas, escritura_reciente, parsear_hosts
+from .resiliencia import Disyuntor, es_conexion_rota
+from .sentencias_preparadas import ConexionPreparada
+
+logger = LoggerBase.get_logger('database')
 
 class Conexion:
     """
@@ -33,99 +50,350 @@ class Conexion:
     _HOST: str = DatabaseConfig.HOST
     _MIN_CON: int = DatabaseConfig.MIN_CONNECTIONS
     _MAX_CON: int = DatabaseConfig.MAX_CONNECTIONS
-    _Pool_Pool: Optional[pool.SimpleConnectionPool] = None  # Pool_Pool según UML
+    _POOL_MODE: str = DatabaseConfig.POOL_MODE
+    # Arranque: 'eager' abre conexiones en iniciar_pool(), 'lazy' al primer uso
+    _ARRANQUE: str = DatabaseConfig.POOL_STARTUP
+    _CALENTAR: int = DatabaseConfig.POOL_WARMUP
+    _HILOS_APERTURA: int = DatabaseConfig.POOL_WARMUP_THREADS
+    _Pool_Pool: Optional[Union[PoolConexionesSeguro, pool.SimpleConnectionPool]] = None  # Pool_Pool según UML
+    _lock_pool = threading.Lock()
+    
+    # Réplicas de lectura: (host, puerto) configurados y pools creados a demanda
+    _REPLICAS: List[Tuple[str, str]] = parsear_hosts(DatabaseConfig.REPLICA_HOSTS, DatabaseConfig.PORT)
+    _REPLICA_STRATEGY: str = DatabaseConfig.REPLICA_STRATEGY
+    _LEER_LO_PROPIO: float = DatabaseConfig.READ_YOUR_WRITES_SECONDS
+    _selector_replicas: Optional[SelectorReplicas] = None
+    _hosts_replicas: List[Tuple[str, str]] = []
+    # id(conexión) -> pool de réplica que la entregó, para devolverla a su pool
+    _origen_replica: Dict[int, Any] = {}
+    
+    # Circuit breaker del primario y de cada réplica (id(pool) -> Disyuntor)
+    _disyuntor: Disyuntor = Disyuntor('primario', DatabaseConfig.CIRCUIT_FAILURES,
+                                      DatabaseConfig.CIRCUIT_OPEN_SECONDS)
+    _disyuntores_replicas: Dict[int, Disyuntor] = {}
+    
+    # Muestreo periódico de estadísticas del pool
+    _hilo_muestreo: Optional[threading.Thread] = None
+    _fin_muestreo = threading.Event()
+    
+    # Medidores publicados en RegistroMetricas en cada muestra
+    _MEDIDORES_POOL = {
+        'en_uso': 'db_pool_connections_in_use',
+        'ociosas': 'db_pool_connections_idle',
+        'total': 'db_pool_connections_open',
+        'creadas_total': 'db_pool_connections_created',
+        'veces_agotado': 'db_pool_exhausted',
+        'timeouts': 'db_pool_timeouts',
+    }
     
     def __init__(self):
         """Constructor vacío según diagrama UML"""
         pass
     
     @classmethod
-    def obtenerPool(cls) -> Optional[pool.SimpleConnectionPool]:
+    def obtenerPool(cls, propagar: bool = False) -> Optional[Union[PoolConexionesSeguro, pool.SimpleConnectionPool]]:
         """
         Obtiene el pool de conexiones, lo crea si no existe
         Método según UML: +obtenerPool(): Pool
         
+        Args:
+            propagar: True para lanzar el OperationalError de conexión en
+                lugar de retornar None (para que se pueda reintentar)
+        
         Returns:
             Pool de conexiones o None si hay error
         """
-        if cls._Pool_Pool is None:
+        if cls._Pool_Pool is not None:
+            return cls._Pool_Pool
+        
+        with cls._lock_pool:
+            # Otro hilo pudo crear el pool mientras esperábamos el lock
+            if cls._Pool_Pool is not None:
+                return cls._Pool_Pool
+            
             try:
-                logger = LoggerBase().logger
                 logger.info("🔄 Creando pool de conexiones...")
                 
-                cls._Pool_Pool = pool.SimpleConnectionPool(
-                    minconn=cls._MIN_CON,
-                    maxconn=cls._MAX_CON,
-                    host=cls._HOST,
-                    user=cls._USERNAME,
-                    password=cls._PASSWORD,
-                    port=cls._DB_PORT,
-                    database=cls._DATABASE,
-                    client_encoding='utf8'
-                )
+                cls._Pool_Pool = cls._crear_pool()
                 
-                logger.info(f'✅ Pool de conexiones creado exitosamente')
-                logger.info(f'📊 Configuración: Host={cls._HOST}, DB={cls._DATABASE}, '
-                           f'Pool={cls._MIN_CON}-{cls._MAX_CON} conexiones')
+                logger.info('✅ Pool de conexiones creado exitosamente')
+                logger.info('📊 Configuración: Host=%s, DB=%s, Pool=%s-%s conexiones, modo=%s',
+                            cls._HOST, cls._DATABASE, cls._MIN_CON, cls._MAX_CON, cls._POOL_MODE)
                 
                 return cls._Pool_Pool
                 
             except OperationalError as e:
-                LoggerBase().logger.error(f'❌ Error de conexión a PostgreSQL: {e}')
-                LoggerBase().logger.error('💡 Verifique que PostgreSQL esté ejecutándose')
+                cls._disyuntor.registrar_fallo(e)
+                logger.error('❌ Error de conexión a PostgreSQL: %s', e)
+                logger.error('💡 Verifique que PostgreSQL esté ejecutándose')
+                if propagar:
+                    raise
                 return None
             except DatabaseError as e:
-                LoggerBase().logger.error(f'❌ Error de base de datos: {e}')
+                logger.error('❌ Error de base de datos: %s', e)
                 return None
             except Exception as e:
-                LoggerBase().logger.error(f'❌ Error inesperado al crear pool: {e}')
+                logger.error('❌ Error inesperado al crear pool: %s', e)
                 return None
-        else:
-            return cls._Pool_Pool
     
     @classmethod
-    def obtenerConexion(cls) -> Optional[connection]:
+    def iniciar_pool(cls, modo: Optional[str] = None) -> Optional[str]:
+        """
+        Prepara el pool al iniciar la aplicación según DB_POOL_STARTUP
+        
+        - 'eager': crea el pool y abre en paralelo DB_POOL_WARMUP conexiones
+          (por defecto DB_MIN_CONN), también en cada réplica; el arranque
+          tarda un handshake TCP + autenticación en lugar de uno por conexión
+          y la primera ráfaga de peticiones encuentra conexiones abiertas.
+        - 'lazy': no conecta; el pool se crea sin conexiones al primer uso
+          y cada conexión se abre cuando se necesita.
+        
+        Args:
+            modo: 'eager' o 'lazy' (por defecto DB_POOL_STARTUP)
+            
+        Returns:
+            El modo usado ('eager' o 'lazy'; uno desconocido se trata como
+            'eager') o None si el modo eager no pudo conectar al primario
+        """
+        modo = modo or cls._ARRANQUE
+        if modo not in ('eager', 'lazy'):
+            logger.warning("⚠️  DB_POOL_STARTUP desconocido: %r, se usa 'eager'", modo)
+            modo = 'eager'
+        cls._ARRANQUE = modo
+        if modo == 'lazy':
+            logger.info('💤 Pool en modo lazy: las conexiones se abren al primer uso')
+            return modo
+        
+        inicio = time.perf_counter()
+        pool_conexiones = cls.obtenerPool()
+        if pool_conexiones is None:
+            return None
+        
+        cantidad = max(cls._CALENTAR, cls._MIN_CON)
+        pools = [pool_conexiones] + (cls.obtenerReplicas().pools if cls._REPLICAS else [])
+        for pool_servidor in pools:
+            if not isinstance(pool_servidor, PoolConexionesSeguro):
+                # SimpleConnectionPool abre sus DB_MIN_CONN de a una al crearse
+                continue
+            try:
+                pool_servidor.calentar(cantidad)
+            except Exception as e:
+                logger.warning('⚠️  No se pudieron abrir todas las conexiones iniciales: %s', e)
+        
+        duracion = time.perf_counter() - inicio
+        RegistroMetricas.fijar('db_pool_warmup_seconds', duracion)
+        logger.info('🔥 Pool calentado: %s conexiones abiertas en %.1f ms',
+                    sum(cls._estadisticas_pool(pool_servidor)['total'] for pool_servidor in pools),
+                    duracion * 1000)
+        return modo
+    
+    @classmethod
+    def _crear_pool(cls, host: Optional[str] = None,
+                    puerto: Optional[str] = None) -> Union[PoolConexionesSeguro, pool.SimpleConnectionPool]:
+        """
+        Crea el pool según el modo configurado (DB_POOL_MODE)
+        
+        Args:
+            host: Host del servidor (por defecto el primario)
+            puerto: Puerto del servidor (por defecto el del primario)
+        
+        Returns:
+            PoolConexionesSeguro en modo 'seguro', SimpleConnectionPool en modo 'simple'
+        """
+        parametros = {
+            'host': host or cls._HOST,
+            'user': cls._USERNAME,
+            'password': cls._PASSWORD,
+            'port': puerto or cls._DB_PORT,
+            'database': cls._DATABASE,
+            'client_encoding': 'utf8',
+            # Cada conexión registra sus sentencias preparadas (ver SentenciasPreparadas)
+            'connection_factory': ConexionPreparada
+        }
+        
+        # En modo lazy el pool nace vacío: cada conexión se abre al pedirla
+        minimas = 0 if cls._ARRANQUE == 'lazy' else cls._MIN_CON
+        
+        if cls._POOL_MODE == 'simple':
+            return pool.SimpleConnectionPool(
+                minconn=minimas,
+                maxconn=cls._MAX_CON,
+                **parametros
+            )
+        
+        return PoolConexionesSeguro(
+            minconn=minimas,
+            maxconn=cls._MAX_CON,
+            timeout=DatabaseConfig.POOL_TIMEOUT,
+            max_lifetime=DatabaseConfig.POOL_MAX_LIFETIME,
+            idle_check=DatabaseConfig.POOL_IDLE_CHECK,
+            hilos_apertura=cls._HILOS_APERTURA,
+            **parametros
+        )
+    
+    @classmethod
+    def obtenerConexion(cls, propagar: bool = False) -> Optional[connection]:
         """
         Obtiene una conexión del pool
         Método según UML: +obtenerConexion(): Connection
         
+        Args:
+            propagar: True para lanzar los errores de conexión transitorios
+                (servidor reiniciando, failover) en lugar de retornar None,
+                así quien llama puede reintentar; CursorDelPool lo usa
+        
         Returns:
-            Conexión de PostgreSQL o None si hay error
+            Conexión de PostgreSQL o None si hay error o el circuito está abierto
         """
+        if not cls._disyuntor.permitir():
+            logger.warning('🚫 Circuito del primario abierto: no se pide conexión')
+            return None
         try:
-            pool_conexiones = cls.obtenerPool()
+            pool_conexiones = cls.obtenerPool(propagar)
             if pool_conexiones is None:
-                LoggerBase().logger.error('❌ No hay pool de conexiones disponible')
+                logger.error('❌ No hay pool de conexiones disponible')
                 return None
                 
+            inicio = time.perf_counter()
             conexion = pool_conexiones.getconn()
-            LoggerBase().logger.debug('🔗 Conexión obtenida del pool')
+            RegistroMetricas.observar('db_pool_wait_seconds', time.perf_counter() - inicio)
+            logger.debug('🔗 Conexión obtenida del pool')
             return conexion
             
         except pool.PoolError as e:
-            LoggerBase().logger.error(f'❌ Error del pool de conexiones: {e}')
+            RegistroMetricas.incrementar('db_pool_errors_total', operacion='obtener')
+            logger.error('❌ Error del pool de conexiones: %s', e)
             return None
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error al obtener conexión: {e}')
+            RegistroMetricas.incrementar('db_pool_errors_total', operacion='obtener')
+            logger.error('❌ Error al obtener conexión: %s', e)
+            if es_conexion_rota(e):
+                # obtenerPool(propagar) ya lo contó al crear el pool
+                if cls._Pool_Pool is not None:
+                    cls._disyuntor.registrar_fallo(e)
+                if propagar:
+                    raise
             return None
     
     @classmethod
-    def liberarConexion(cls, conexion: connection) -> None:
+    def obtenerReplicas(cls) -> SelectorReplicas:
+        """
+        Obtiene el selector de réplicas, creando un pool por réplica la primera vez
+        
+        Una réplica que no responde al crear su pool se omite (se registra
+        el error) y sus lecturas van a las demás o al primario.
+        
+        Returns:
+            SelectorReplicas (sin pools si no hay réplicas disponibles)
+        """
+        if cls._selector_replicas is not None:
+            return cls._selector_replicas
+        
+        with cls._lock_pool:
+            if cls._selector_replicas is not None:
+                return cls._selector_replicas
+            
+            pools, hosts = [], []
+            for host, puerto in cls._REPLICAS:
+                try:
+                    pool_replica = cls._crear_pool(host, puerto)
+                    pools.append(pool_replica)
+                    hosts.append((host, puerto))
+                    cls._disyuntores_replicas[id(pool_replica)] = Disyuntor(
+                        f'{host}:{puerto}', DatabaseConfig.CIRCUIT_FAILURES, DatabaseConfig.CIRCUIT_OPEN_SECONDS)
+                    logger.info('✅ Pool de réplica creado: %s:%s', host, puerto)
+                except Exception as e:
+                    logger.error('❌ No se pudo crear el pool de la réplica %s:%s: %s', host, puerto, e)
+            
+            cls._hosts_replicas = hosts
+            cls._selector_replicas = SelectorReplicas(pools, cls._REPLICA_STRATEGY, cls._conexiones_en_uso)
+            return cls._selector_replicas
+    
+    @classmethod
+    def obtenerConexionLectura(cls, propagar: bool = False) -> Optional[connection]:
+        """
+        Obtiene una conexión para consultas de solo lectura
+        
+        Se toma de una réplica si hay réplicas configuradas y el hilo/tarea
+        no escribió en los últimos DB_READ_YOUR_WRITES_SECONDS; si ninguna
+        réplica entrega conexión (o todas tienen el circuito abierto), se
+        usa el primario.
+        
+        Args:
+            propagar: Como en obtenerConexion(), para el primario
+        
+        Returns:
+            Conexión de PostgreSQL o None si hay error
+        """
+        if cls._REPLICAS and not escritura_reciente(cls._LEER_LO_PROPIO):
+            for pool_replica in cls.obtenerReplicas().candidatos():
+                disyuntor = cls._disyuntor_de(pool_replica)
+                if disyuntor is not None and not disyuntor.permitir():
+                    continue
+                try:
+                    inicio = time.perf_counter()
+                    conexion = pool_replica.getconn()
+                    RegistroMetricas.observar('db_pool_wait_seconds', time.perf_counter() - inicio)
+                except Exception as e:
+                    RegistroMetricas.incrementar('db_pool_errors_total', operacion='obtener_replica')
+                    if disyuntor is not None and es_conexion_rota(e):
+                        disyuntor.registrar_fallo(e)
+                    logger.warning('⚠️  Réplica sin conexión disponible, se prueba la siguiente: %s', e)
+                    continue
+                cls._origen_replica[id(conexion)] = pool_replica
+                RegistroMetricas.incrementar('db_reads_total', destino='replica')
+                logger.debug('🔗 Conexión de lectura obtenida de una réplica')
+                return conexion
+            logger.warning('⚠️  Ninguna réplica disponible: la lectura va al primario')
+        
+        RegistroMetricas.incrementar('db_reads_total', destino='primario')
+        return cls.obtenerConexion(propagar)
+    
+    @classmethod
+    def liberarConexion(cls, conexion: connection, descartar: bool = False) -> None:
         """
         Libera una conexión de vuelta al pool
         Método según UML: +liberarConexion(conn): void
         
+        Una conexión rota (cerrada o marcada con `descartar`) se cierra con
+        putconn(close=True) en lugar de volver al pool, cuenta como fallo en
+        el disyuntor de su servidor y descarta las ociosas de ese pool, que
+        tras un reinicio o failover también están muertas.
+        
         Args:
-            conexion: Conexión a liberar
+            conexion: Conexión a liberar (del primario o de una réplica)
+            descartar: True si se sabe que la conexión quedó inutilizable
         """
         try:
-            if conexion and cls._Pool_Pool:
-                cls._Pool_Pool.putconn(conexion)
-                LoggerBase().logger.debug('🔄 Conexión liberada al pool')
+            pool_origen = cls._origen_replica.pop(id(conexion), None) or cls._Pool_Pool
+            if conexion and pool_origen:
+                rota = descartar or bool(conexion.closed)
+                with RegistroMetricas.medir('db_pool_release_seconds'):
+                    pool_origen.putconn(conexion, close=rota)
+                disyuntor = cls._disyuntor_de(pool_origen)
+                if rota:
+                    RegistroMetricas.incrementar('db_connections_discarded_total')
+                    if isinstance(pool_origen, PoolConexionesSeguro):
+                        pool_origen.descartar_ociosas()
+                    logger.warning('🔌 Conexión rota descartada del pool')
+                    if disyuntor is not None:
+                        disyuntor.registrar_fallo()
+                elif disyuntor is not None:
+                    disyuntor.registrar_exito()
+                logger.debug('🔄 Conexión liberada al pool')
         except pool.PoolError as e:
-            LoggerBase().logger.error(f'❌ Error al liberar conexión al pool: {e}')
+            RegistroMetricas.incrementar('db_pool_errors_total', operacion='liberar')
+            logger.error('❌ Error al liberar conexión al pool: %s', e)
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error inesperado al liberar conexión: {e}')
+            RegistroMetricas.incrementar('db_pool_errors_total', operacion='liberar')
+            logger.error('❌ Error inesperado al liberar conexión: %s', e)
+    
+    @classmethod
+    def _disyuntor_de(cls, pool_origen: Any) -> Optional[Disyuntor]:
+        """Disyuntor del servidor al que pertenece el pool (None si no tiene)"""
+        if pool_origen is cls._Pool_Pool:
+            return cls._disyuntor
+        return cls._disyuntores_replicas.get(id(pool_origen))
     
     @classmethod
     def cerrarConexiones(cls) -> None:
@@ -133,13 +401,22 @@ class Conexion:
         Cierra todas las conexiones del pool
         Método según UML: +cerrarConexiones(): void
         """
+        cls.detener_muestreo()
         try:
-            if cls._Pool_Pool:
-                cls._Pool_Pool.closeall()
-                cls._Pool_Pool = None
-                LoggerBase().logger.info('🔒 Pool de conexiones cerrado exitosamente')
+            with cls._lock_pool:
+                if cls._Pool_Pool:
+                    cls._Pool_Pool.closeall()
+                    cls._Pool_Pool = None
+                    logger.info('🔒 Pool de conexiones cerrado exitosamente')
+                if cls._selector_replicas is not None:
+                    for pool_replica in cls._selector_replicas.pools:
+                        pool_replica.closeall()
+                    cls._selector_replicas = None
+                    cls._origen_replica.clear()
+                    cls._disyuntores_replicas.clear()
+                    logger.info('🔒 Pools de réplicas cerrados')
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error al cerrar pool de conexiones: {e}')
+            logger.error('❌ Error al cerrar pool de conexiones: %s', e)
     
     @classmethod
     def verificar_conexion(cls) -> bool:
@@ -158,11 +435,11 @@ class Conexion:
                 cursor.close()
                 cls.liberarConexion(conexion)
                 
-                LoggerBase().logger.info('✅ Verificación de conexión exitosa')
+                logger.info('✅ Verificación de conexión exitosa')
                 return resultado[0] == 1
             return False
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error en verificación de conexión: {e}')
+            logger.error('❌ Error en verificación de conexión: %s', e)
             return False
     
     @classmethod
@@ -170,21 +447,115 @@ class Conexion:
         """
         Obtiene información del estado actual del pool
         
+        Además de la configuración incluye el estado en vivo: conexiones
+        en uso y ociosas y, con el pool 'seguro', conexiones creadas,
+        veces que se agotó, espera de checkout p50/p99 y edad de las conexiones.
+        
         Returns:
             dict: Información del pool de conexiones
         """
         try:
-            if cls._Pool_Pool:
+            pool_conexiones = cls._Pool_Pool
+            if pool_conexiones:
                 return {
                     'conexiones_minimas': cls._MIN_CON,
                     'conexiones_maximas': cls._MAX_CON,
                     'host': cls._HOST,
                     'database': cls._DATABASE,
                     'puerto': cls._DB_PORT,
-                    'pool_activo': True
+                    'modo': cls._POOL_MODE,
+                    'pool_activo': True,
+                    **cls._estadisticas_pool(pool_conexiones),
+                    'circuito': cls._disyuntor.estado,
+                    'replicas': cls._info_replicas()
                 }
             else:
                 return {'pool_activo': False}
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error al obtener info del pool: {e}')
+            logger.error('❌ Error al obtener info del pool: %s', e)
             return {'error': str(e)}
+    
+    @classmethod
+    def _info_replicas(cls) -> List[dict]:
+        """Host y estado en vivo de cada pool de réplica creado"""
+        selector = cls._selector_replicas
+        if selector is None:
+            return []
+        return [{'host': host, 'puerto': puerto, **cls._estadisticas_pool(pool_replica),
+                 'circuito': getattr(cls._disyuntor_de(pool_replica), 'estado', None)}
+                for (host, puerto), pool_replica in zip(cls._hosts_replicas, selector.pools)]
+    
+    @staticmethod
+    def _conexiones_en_uso(pool_conexiones) -> int:
+        """Conexiones entregadas por un pool (criterio de 'menos_ocupada')"""
+        if isinstance(pool_conexiones, PoolConexionesSeguro):
+            return pool_conexiones.en_uso
+        return len(pool_conexiones._used)
+    
+    @classmethod
+    def _estadisticas_pool(cls, pool_conexiones) -> dict:
+        """Estado en vivo del pool según su tipo"""
+        if isinstance(pool_conexiones, PoolConexionesSeguro):
+            return pool_conexiones.estadisticas()
+        # SimpleConnectionPool solo lleva las listas de conexiones
+        en_uso = len(pool_conexiones._used)
+        ociosas = len(pool_conexiones._pool)
+        return {'en_uso': en_uso, 'ociosas': ociosas, 'total': en_uso + ociosas}
+    
+    @classmethod
+    def iniciar_muestreo(cls, intervalo: float = DatabaseConfig.POOL_STATS_INTERVAL) -> bool:
+        """
+        Inicia un hilo que registra las estadísticas del pool cada `intervalo` segundos
+        
+        Cada muestra se escribe en el log (INFO) y se publica como medidores
+        en RegistroMetricas (db_pool_connections_in_use, ...).
+        
+        Args:
+            intervalo: Segundos entre muestras
+            
+        Returns:
+            bool: True si el muestreo quedó activo
+        """
+        if intervalo <= 0:
+            return False
+        with cls._lock_pool:
+            if cls._hilo_muestreo is not None and cls._hilo_muestreo.is_alive():
+                return True
+            cls._fin_muestreo.clear()
+            cls._hilo_muestreo = threading.Thread(
+                target=cls._muestrear, args=(intervalo,), name='muestreo-pool', daemon=True
+            )
+            cls._hilo_muestreo.start()
+        logger.info('📊 Muestreo de estadísticas del pool cada %ss', intervalo)
+        return True
+    
+    @classmethod
+    def detener_muestreo(cls) -> None:
+        """Detiene el hilo de muestreo si está activo"""
+        cls._fin_muestreo.set()
+        hilo = cls._hilo_muestreo
+        if hilo is not None and hilo is not threading.current_thread():
+            hilo.join(timeout=5)
+        cls._hilo_muestreo = None
+    
+    @classmethod
+    def _muestrear(cls, intervalo: float) -> None:
+        while not cls._fin_muestreo.wait(intervalo):
+            cls.registrar_estadisticas()
+    
+    @classmethod
+    def registrar_estadisticas(cls) -> None:
+        """Escribe una muestra de las estadísticas del pool y actualiza los medidores"""
+        info = cls.get_info_pool()
+        if not info.get('pool_activo'):
+            return
+        
+        for clave, metrica in cls._MEDIDORES_POOL.items():
+            if info.get(clave) is not None:
+                RegistroMetricas.fijar(metrica, info[clave])
+        
+        logger.info('📊 Pool: en uso=%s/%s, ociosas=%s, creadas=%s, agotado=%s veces, '
+                    'espera p50=%sms p99=%sms, edad conexiones=%s',
+                    info.get('en_uso'), cls._MAX_CON, info.get('ociosas'), info.get('creadas_total'),
+                    info.get('veces_agotado'), info.get('espera_p50_ms'), info.get('espera_p99_ms'),
+                    info.get('edad_conexiones_s'))
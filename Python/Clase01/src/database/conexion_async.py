@@ -0,0 +1,310 @@
+"""
+Gestión de Conexiones Asíncronas
+================================
+
+Contraparte asyncio de Conexion: pool de conexiones PostgreSQL que no
+bloquea el event loop. Usa el modo asíncrono nativo de psycopg2
+(async_=1 + poll()) integrado con loop.add_reader/add_writer, por lo
+que no requiere dependencias adicionales.
+
+Nota: requiere un event loop con soporte de add_reader (en Windows,
+usar WindowsSelectorEventLoopPolicy).
+"""
+
+import asyncio
+import sys
+import os
+from collections import deque
+from typing import Deque, Optional, Set
+
+import psycopg2
+from psycopg2 import pool, OperationalError, DatabaseError
+from psycopg2.extensions import connection, POLL_OK, POLL_READ, POLL_WRITE
+
+# Agregar config al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.database_config import DatabaseConfig
+from src.utils.logger_base import LoggerBase
+
+logger = LoggerBase.get_logger('database')
+
+
+async def esperar_conexion(conn: connection) -> None:
+    """
+    Espera (sin bloquear el event loop) a que termine la operación
+    pendiente de una conexión asíncrona de psycopg2
+
+    Args:
+        conn: Conexión creada con async_=1
+
+    Raises:
+        psycopg2.Error: Si la operación pendiente falla
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        estado = conn.poll()
+        if estado == POLL_OK:
+            return
+
+        listo = loop.create_future()
+        fd = conn.fileno()
+        if estado == POLL_READ:
+            loop.add_reader(fd, listo.set_result, None)
+            try:
+                await listo
+            finally:
+                loop.remove_reader(fd)
+        elif estado == POLL_WRITE:
+            loop.add_writer(fd, listo.set_result, None)
+            try:
+                await listo
+            finally:
+                loop.remove_writer(fd)
+        else:
+            raise OperationalError(f'estado de poll() inesperado: {estado}')
+
+
+class PoolConexionesAsync:
+    """
+    Pool de conexiones asíncronas de tamaño acotado
+
+    Cientos de corrutinas pueden compartir unas pocas conexiones: cuando
+    el pool está agotado, obtener() espera (hasta `timeout`) a que otra
+    corrutina libere una conexión.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, timeout: float = 30.0, **kwargs):
+        """
+        Constructor del pool (las conexiones se abren en abrir())
+
+        Args:
+            minconn: Conexiones abiertas por abrir()
+            maxconn: Máximo de conexiones simultáneas
+            timeout: Segundos máximos de espera en obtener()
+            **kwargs: Parámetros de conexión para psycopg2
+        """
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.closed = False
+
+        self._kwargs = kwargs
+        self._ociosas: Deque[connection] = deque()
+        self._en_uso: Set[int] = set()
+        self._total = 0
+        self._cond = asyncio.Condition()
+
+    async def abrir(self) -> None:
+        """Abre las conexiones mínimas del pool en paralelo"""
+        conexiones = await asyncio.gather(
+            *(self._nueva_conexion() for _ in range(self.minconn))
+        )
+        async with self._cond:
+            self._ociosas.extend(conexiones)
+            self._total += len(conexiones)
+
+    async def obtener(self) -> connection:
+        """
+        Obtiene una conexión, esperando si el pool está agotado
+
+        Raises:
+            pool.PoolError: Si el pool está cerrado o se agota el tiempo de espera
+        """
+        try:
+            return await asyncio.wait_for(self._obtener(), self.timeout)
+        except asyncio.TimeoutError:
+            raise pool.PoolError(
+                f'tiempo de espera agotado ({self.timeout}s): '
+                f'las {self.maxconn} conexiones están en uso'
+            )
+
+    async def liberar(self, conn: connection, close: bool = False) -> None:
+        """
+        Devuelve una conexión al pool
+
+        Args:
+            conn: Conexión obtenida con obtener()
+            close: True para cerrar la conexión en lugar de reutilizarla
+        """
+        async with self._cond:
+            if id(conn) not in self._en_uso:
+                raise pool.PoolError('intentando devolver una conexión que no pertenece al pool')
+            self._en_uso.discard(id(conn))
+
+            if close or self.closed or conn.closed:
+                if not conn.closed:
+                    conn.close()
+                self._total -= 1
+            else:
+                self._ociosas.append(conn)
+            self._cond.notify()
+
+    async def cerrar(self) -> None:
+        """Cierra todas las conexiones ociosas y rechaza nuevos checkouts"""
+        async with self._cond:
+            self.closed = True
+            while self._ociosas:
+                self._ociosas.pop().close()
+                self._total -= 1
+            self._cond.notify_all()
+
+    async def _obtener(self) -> connection:
+        """Toma una conexión ociosa o abre una nueva si hay hueco"""
+        async with self._cond:
+            while True:
+                if self.closed:
+                    raise pool.PoolError('el pool de conexiones está cerrado')
+                while self._ociosas:
+                    conn = self._ociosas.pop()
+                    if conn.closed:
+                        self._total -= 1
+                        continue
+                    self._en_uso.add(id(conn))
+                    return conn
+                if self._total < self.maxconn:
+                    self._total += 1
+                    break
+                await self._cond.wait()
+
+        conn = None
+        try:
+            conn = await self._nueva_conexion()
+            async with self._cond:
+                self._en_uso.add(id(conn))
+            return conn
+        except BaseException:
+            # Incluye CancelledError (timeout de obtener()), que no hereda de
+            # Exception: sin liberar el hueco el pool se quedaría sin conexiones
+            if conn is not None:
+                conn.close()
+            async with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+    async def _nueva_conexion(self) -> connection:
+        """Abre una conexión asíncrona y espera a que esté lista"""
+        conn = psycopg2.connect(async_=1, **self._kwargs)
+        try:
+            await esperar_conexion(conn)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+
+class ConexionAsync:
+    """
+    Contraparte asyncio de Conexion
+
+    Mantiene un PoolConexionesAsync único por proceso con la misma
+    configuración (DatabaseConfig) que el pool síncrono.
+    """
+
+    _MIN_CON: int = DatabaseConfig.MIN_CONNECTIONS
+    _MAX_CON: int = DatabaseConfig.MAX_CONNECTIONS
+    _Pool_Pool: Optional[PoolConexionesAsync] = None
+    _lock_pool: Optional[asyncio.Lock] = None
+
+    @classmethod
+    async def obtenerPool(cls) -> Optional[PoolConexionesAsync]:
+        """
+        Obtiene el pool asíncrono, lo crea si no existe
+
+        Returns:
+            Pool de conexiones o None si hay error
+        """
+        if cls._Pool_Pool is not None:
+            return cls._Pool_Pool
+
+        if cls._lock_pool is None:
+            cls._lock_pool = asyncio.Lock()
+
+        async with cls._lock_pool:
+            if cls._Pool_Pool is not None:
+                return cls._Pool_Pool
+
+            try:
+                logger.info("🔄 Creando pool de conexiones asíncrono...")
+
+                pool_async = PoolConexionesAsync(
+                    minconn=cls._MIN_CON,
+                    maxconn=cls._MAX_CON,
+                    timeout=DatabaseConfig.POOL_TIMEOUT,
+                    host=DatabaseConfig.HOST,
+                    user=DatabaseConfig.USERNAME,
+                    password=DatabaseConfig.PASSWORD,
+                    port=DatabaseConfig.PORT,
+                    database=DatabaseConfig.DATABASE,
+                    client_encoding='utf8'
+                )
+                await pool_async.abrir()
+                cls._Pool_Pool = pool_async
+
+                logger.info('✅ Pool asíncrono creado: %s-%s conexiones', cls._MIN_CON, cls._MAX_CON)
+                return cls._Pool_Pool
+
+            except OperationalError as e:
+                logger.error('❌ Error de conexión a PostgreSQL (async): %s', e)
+                return None
+            except DatabaseError as e:
+                logger.error('❌ Error de base de datos (async): %s', e)
+                return None
+            except Exception as e:
+                logger.error('❌ Error inesperado al crear pool asíncrono: %s', e)
+                return None
+
+    @classmethod
+    async def obtenerConexion(cls) -> Optional[connection]:
+        """
+        Obtiene una conexión del pool asíncrono
+
+        Returns:
+            Conexión asíncrona de PostgreSQL o None si hay error
+        """
+        try:
+            pool_conexiones = await cls.obtenerPool()
+            if pool_conexiones is None:
+                logger.error('❌ No hay pool de conexiones asíncrono disponible')
+                return None
+
+            conexion = await pool_conexiones.obtener()
+            logger.debug('🔗 Conexión asíncrona obtenida del pool')
+            return conexion
+
+        except pool.PoolError as e:
+            logger.error('❌ Error del pool asíncrono: %s', e)
+            return None
+        except Exception as e:
+            logger.error('❌ Error al obtener conexión asíncrona: %s', e)
+            return None
+
+    @classmethod
+    async def liberarConexion(cls, conexion: connection, close: bool = False) -> None:
+        """
+        Libera una conexión de vuelta al pool asíncrono
+
+        Args:
+            conexion: Conexión a liberar
+            close: True para cerrarla en lugar de reutilizarla
+        """
+        try:
+            if conexion and cls._Pool_Pool:
+                await cls._Pool_Pool.liberar(conexion, close=close)
+                logger.debug('🔄 Conexión asíncrona liberada al pool')
+        except pool.PoolError as e:
+            logger.error('❌ Error al liberar conexión asíncrona: %s', e)
+        except Exception as e:
+            logger.error('❌ Error inesperado al liberar conexión asíncrona: %s', e)
+
+    @classmethod
+    async def cerrarConexiones(cls) -> None:
+        """Cierra todas las conexiones del pool asíncrono"""
+        try:
+            if cls._Pool_Pool:
+                await cls._Pool_Pool.cerrar()
+                cls._Pool_Pool = None
+                cls._lock_pool = None
+                logger.info('🔒 Pool de conexiones asíncrono cerrado')
+        except Exception as e:
+            logger.error('❌ Error al cerrar pool asíncrono: %s', e)
@@ -0,0 +1,243 @@
+"""
+Registro de Consultas Lentas
+============================
+
+Las sentencias que superan DB_SLOW_QUERY_MS se escriben en
+logs/consultas_lentas.log (junto a errores.log) con su duración, los
+parámetros con los datos sensibles ocultos (password) y el plan de
+ejecución.
+
+El plan se obtiene en un hilo de fondo con EXPLAIN sin ANALYZE: solo se
+planifica, la consulta no se vuelve a ejecutar (repetirla cargaría la base
+justo cuando ya está lenta). Los SELECT se explican en una réplica si hay
+réplicas configuradas, igual que se enrutan las lecturas; el resto en el
+primario. Cada sentencia se explica como máximo una vez por intervalo
+(DB_SLOW_QUERY_EXPLAIN_INTERVAL) y el hilo usa una sola conexión a la vez.
+"""
+
+import queue
+import re
+import sys
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+# Agregar config al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.database_config import DatabaseConfig
+from src.utils.logger_base import LoggerBase
+from src.utils.metricas import RegistroMetricas
+from .conexion import Conexion
+
+logger = LoggerBase.get_logger('database')
+
+# Logger propio, sin propagar: lo atiende el handler de consultas_lentas.log
+logger_lentas = LoggerBase.get_logger('consultas_lentas')
+
+OCULTO = '***'
+
+# Nombres de columna cuyos valores nunca se escriben en el log
+COLUMNAS_SENSIBLES = ('password', 'contrasena', 'clave', 'secret', 'token')
+
+_INSERT_COLUMNAS = re.compile(r'INSERT\s+INTO\s+\w+\s*\(([^)]*)\)', re.IGNORECASE)
+_COLUMNA_ANTERIOR = re.compile(r'(\w+)\s*(?:=|<>|!=|<=|>=|<|>|\s+LIKE|\s+ILIKE)\s*$', re.IGNORECASE)
+
+
+def _es_sensible(columna: Optional[str]) -> bool:
+    return columna is not None and any(nombre in columna.lower() for nombre in COLUMNAS_SENSIBLES)
+
+
+def _columna_anterior(texto: str) -> Optional[str]:
+    coincidencia = _COLUMNA_ANTERIOR.search(texto)
+    return coincidencia.group(1) if coincidencia else None
+
+
+def redactar_parametros(sql: str, params: Optional[Sequence[Any]]) -> Any:
+    """
+    Reemplaza por '***' los parámetros que corresponden a columnas sensibles
+
+    Asocia cada %s con su columna: por posición en INSERT INTO t(cols)
+    o por la comparación que lo precede (col = %s). Si la sentencia
+    menciona una columna sensible, los parámetros que no se pueden
+    asociar a una columna también se ocultan.
+
+    Args:
+        sql: Sentencia con parámetros %s
+        params: Tupla de parámetros o lista de filas (lotes)
+
+    Returns:
+        Parámetros con los valores sensibles ocultos
+    """
+    if not params:
+        return params
+
+    insert = _INSERT_COLUMNAS.search(sql)
+    if insert:
+        columnas: List[Optional[str]] = [columna.strip() for columna in insert.group(1).split(',')]
+    else:
+        columnas = [_columna_anterior(parte) for parte in sql.split('%s')[:-1]]
+
+    hay_sensible = any(nombre in sql.lower() for nombre in COLUMNAS_SENSIBLES)
+
+    def redactar_fila(fila: Sequence[Any]) -> Any:
+        if not isinstance(fila, (tuple, list)):
+            return fila
+        if len(fila) != len(columnas):
+            return tuple(OCULTO for _ in fila) if hay_sensible else tuple(fila)
+        # Un parámetro sin columna conocida se oculta si la sentencia toca datos sensibles
+        return tuple(OCULTO if _es_sensible(columna) or (columna is None and hay_sensible) else valor
+                     for columna, valor in zip(columnas, fila))
+
+    # Lote (lista de filas) o una sola fila de parámetros
+    if isinstance(params, list) and params and isinstance(params[0], (tuple, list)):
+        return [redactar_fila(fila) for fila in params]
+    return redactar_fila(params)
+
+
+class ConsultasLentas:
+    """
+    Detección de consultas lentas y captura asíncrona de su plan
+
+    verificar() se llama después de cada sentencia; si no supera el
+    umbral no hace nada más que una comparación.
+    """
+
+    umbral: float = DatabaseConfig.SLOW_QUERY_MS / 1000
+    explicar: bool = DatabaseConfig.SLOW_QUERY_EXPLAIN
+    intervalo_explain: float = DatabaseConfig.SLOW_QUERY_EXPLAIN_INTERVAL
+
+    _cola: 'queue.Queue[dict]' = queue.Queue(maxsize=100)
+    _hilo: Optional[threading.Thread] = None
+    _lock = threading.Lock()
+    _ultimo_explain: Dict[str, float] = {}
+
+    # Filas de un lote que se muestran en el log
+    _FILAS_MOSTRADAS = 5
+
+    @classmethod
+    def configurar(cls, umbral_ms: float, explicar: Optional[bool] = None) -> None:
+        """
+        Cambia el umbral (0 desactiva) y opcionalmente la captura del plan
+
+        Args:
+            umbral_ms: Milisegundos a partir de los cuales una sentencia es lenta
+            explicar: True/False para capturar o no el plan
+        """
+        cls.umbral = umbral_ms / 1000
+        if explicar is not None:
+            cls.explicar = explicar
+
+    @classmethod
+    def verificar(cls, sentencia: str, sql: str, params: Optional[Sequence[Any]],
+                  duracion: float, explicable: bool = True) -> None:
+        """
+        Registra la sentencia si tardó más que el umbral
+
+        Args:
+            sentencia: Nombre de la constante del DAO (p.ej. '_SELECCIONAR')
+            sql: Texto SQL ejecutado
+            params: Parámetros usados (se ocultan los sensibles)
+            duracion: Segundos que tardó la ejecución
+            explicable: False si no se puede obtener el plan (p.ej. lotes)
+        """
+        if cls.umbral <= 0 or duracion < cls.umbral:
+            return
+
+        RegistroMetricas.incrementar('db_slow_queries_total', statement=sentencia)
+        consulta = {
+            'sentencia': sentencia,
+            'sql': ' '.join(sql.split()),
+            'params': params,
+            'duracion': duracion,
+            'explicar': explicable and cls.explicar and cls._toca_explicar(sentencia),
+        }
+        cls._iniciar_hilo()
+        try:
+            cls._cola.put_nowait(consulta)
+        except queue.Full:
+            # Sin lugar para el plan: se registra igual, sin bloquear al llamador
+            consulta['explicar'] = False
+            cls._escribir(consulta, None)
+
+    @classmethod
+    def esperar(cls, timeout: float = 10.0) -> bool:
+        """
+        Espera a que se escriban las consultas lentas pendientes
+
+        Returns:
+            bool: True si no quedan pendientes
+        """
+        limite = time.monotonic() + timeout
+        while cls._cola.unfinished_tasks and time.monotonic() < limite:
+            time.sleep(0.01)
+        return cls._cola.unfinished_tasks == 0
+
+    @classmethod
+    def _toca_explicar(cls, sentencia: str) -> bool:
+        """True si la sentencia no se explicó dentro del intervalo"""
+        ahora = time.monotonic()
+        with cls._lock:
+            ultimo = cls._ultimo_explain.get(sentencia)
+            if ultimo is not None and ahora - ultimo < cls.intervalo_explain:
+                return False
+            cls._ultimo_explain[sentencia] = ahora
+            return True
+
+    @classmethod
+    def _iniciar_hilo(cls) -> None:
+        with cls._lock:
+            if cls._hilo is None or not cls._hilo.is_alive():
+                cls._hilo = threading.Thread(target=cls._trabajar, name='consultas-lentas', daemon=True)
+                cls._hilo.start()
+
+    @classmethod
+    def _trabajar(cls) -> None:
+        while True:
+            consulta = cls._cola.get()
+            try:
+                plan = cls._capturar_plan(consulta['sql'], consulta['params']) if consulta['explicar'] else None
+                cls._escribir(consulta, plan)
+            except Exception as e:
+                logger.error('❌ Error registrando consulta lenta %s: %s', consulta['sentencia'], e)
+            finally:
+                cls._cola.task_done()
+
+    @classmethod
+    def _capturar_plan(cls, sql: str, params: Optional[Sequence[Any]]) -> Optional[str]:
+        """
+        Ejecuta EXPLAIN (sin ANALYZE) en una conexión del pool y deshace la transacción
+
+        Returns:
+            Plan en texto o None si no se pudo obtener
+        """
+        es_lectura = sql.lstrip().upper().startswith('SELECT')
+        conexion = Conexion.obtenerConexionLectura() if es_lectura else Conexion.obtenerConexion()
+        if conexion is None:
+            return None
+        try:
+            with conexion.cursor() as cursor:
+                cursor.execute(f'EXPLAIN {sql}', params)
+                return '\n'.join(fila[0] for fila in cursor.fetchall())
+        except Exception as e:
+            logger.warning('⚠️  No se pudo obtener el plan de la consulta lenta: %s', e)
+            return None
+        finally:
+            try:
+                conexion.rollback()
+            finally:
+                Conexion.liberarConexion(conexion)
+
+    @classmethod
+    def _escribir(cls, consulta: dict, plan: Optional[str]) -> None:
+        duracion_ms = round(consulta['duracion'] * 1000, 3)
+        params = redactar_parametros(consulta['sql'], consulta['params'])
+        if isinstance(params, list) and len(params) > cls._FILAS_MOSTRADAS:
+            params = params[:cls._FILAS_MOSTRADAS] + [f'... ({len(params)} filas)']
+        logger_lentas.warning(
+            '🐢 %s tardó %.1f ms | params=%r | sql=%s%s',
+            consulta['sentencia'], duracion_ms, params,
+            consulta['sql'],
+            f'\n{plan}' if plan else '',
+            extra={'operation': consulta['sentencia'], 'duration_ms': duracion_ms},
+        )
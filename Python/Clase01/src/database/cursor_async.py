@@ -0,0 +1,172 @@
+"""
+Gestor de Cursores Asíncrono
+============================
+
+Contraparte asyncio de CursorDelPool: context manager 'async with' que
+obtiene una conexión de ConexionAsync, abre una transacción y hace
+commit o rollback al salir, igual que CursorDelPool.__enter__/__exit__
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+from psycopg2.extensions import connection, cursor
+from .conexion_async import ConexionAsync, esperar_conexion
+from .resiliencia import es_conexion_rota
+from .transaccion import TransaccionAsync
+from src.utils.logger_base import LoggerBase
+
+logger = LoggerBase.get_logger('database')
+
+
+class CursorAsync:
+    """
+    Envoltorio de un cursor psycopg2 asíncrono
+
+    execute() es una corrutina; fetchone()/fetchall() leen el resultado
+    ya recibido y no necesitan await.
+    """
+
+    def __init__(self, conn: connection):
+        self._conn = conn
+        self._cursor: cursor = conn.cursor()
+
+    async def execute(self, sql: str, params: Optional[Sequence[Any]] = None) -> None:
+        """Ejecuta una sentencia sin bloquear el event loop"""
+        self._cursor.execute(sql, params)
+        await esperar_conexion(self._conn)
+
+    def fetchone(self) -> Optional[Tuple]:
+        """Retorna la siguiente fila del resultado"""
+        return self._cursor.fetchone()
+
+    def fetchall(self) -> List[Tuple]:
+        """Retorna todas las filas del resultado"""
+        return self._cursor.fetchall()
+
+    @property
+    def rowcount(self) -> int:
+        """Número de filas afectadas por la última sentencia"""
+        return self._cursor.rowcount
+
+    def close(self) -> None:
+        """Cierra el cursor subyacente"""
+        self._cursor.close()
+
+
+class AsyncCursorDelPool:
+    """
+    Context manager asíncrono para cursores de base de datos
+
+    Las conexiones asíncronas de psycopg2 trabajan en autocommit, por lo
+    que la transacción se abre explícitamente con BEGIN en __aenter__ y
+    se cierra con COMMIT/ROLLBACK en __aexit__.
+
+    Dentro de una TransaccionAsync reutiliza su conexión y no abre ni
+    cierra la transacción.
+    """
+
+    def __init__(self):
+        """Inicializa los atributos privados _conn y _cursor"""
+        self._conn: Optional[connection] = None
+        self._cursor: Optional[CursorAsync] = None
+        self._transaccion: Optional[TransaccionAsync] = None
+
+    async def __aenter__(self) -> Optional[CursorAsync]:
+        """
+        Método para entrar al contexto 'async with'
+
+        Returns:
+            CursorAsync dentro de una transacción o None si hay error
+        """
+        try:
+            logger.debug('🔄 Iniciando context manager asíncrono - obteniendo conexión...')
+
+            self._transaccion = TransaccionAsync.actual()
+            if self._transaccion is not None:
+                self._conn = self._transaccion.conexion
+                if self._conn is None:
+                    logger.error('❌ La transacción asíncrona no tiene conexión')
+                    return None
+                self._cursor = CursorAsync(self._conn)
+                return self._cursor
+
+            self._conn = await ConexionAsync.obtenerConexion()
+            if self._conn is None:
+                logger.error('❌ No se pudo obtener conexión del pool asíncrono')
+                return None
+
+            self._cursor = CursorAsync(self._conn)
+            await self._cursor.execute('BEGIN')
+            logger.debug('✅ Cursor asíncrono creado exitosamente')
+
+            return self._cursor
+
+        except Exception as e:
+            logger.error('❌ Error en __aenter__ del AsyncCursorDelPool: %s', e)
+            if self._transaccion is not None:
+                self._transaccion.marcar_fallida()
+            await self._cleanup_resources()
+            raise e
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """
+        Método para salir del contexto 'async with'
+
+        Args:
+            exc_type: Tipo de excepción si ocurrió
+            exc_val: Valor de la excepción si ocurrió
+            exc_tb: Traceback de la excepción si ocurrió
+        """
+        descartar = False
+        try:
+            if self._cursor is None:
+                return
+
+            if self._transaccion is not None:
+                # La transacción hace COMMIT/ROLLBACK una sola vez al terminar
+                if exc_type is not None:
+                    self._transaccion.marcar_fallida()
+                return
+
+            if exc_type is not None:
+                logger.warning('⚠️  Excepción detectada en context manager asíncrono: %s: %s',
+                               exc_type.__name__, exc_val)
+                await self._cursor.execute('ROLLBACK')
+                logger.info('🔄 Rollback ejecutado debido a excepción')
+            else:
+                await self._cursor.execute('COMMIT')
+                logger.debug('✅ Commit ejecutado exitosamente')
+
+        except Exception as e:
+            logger.error('❌ Error durante commit/rollback asíncrono: %s', e)
+            # Igual que TransaccionAsync: una conexión rota no vuelve al pool
+            descartar = es_conexion_rota(e)
+            if not descartar:
+                try:
+                    await self._cursor.execute('ROLLBACK')
+                    logger.info('🔄 Rollback de emergencia ejecutado')
+                except Exception:
+                    logger.error('❌ Error crítico: no se pudo hacer rollback de emergencia')
+                    descartar = True
+
+        finally:
+            await self._cleanup_resources(descartar)
+
+    async def _cleanup_resources(self, descartar: bool = False) -> None:
+        """
+        Cierra el cursor y devuelve la conexión al pool asíncrono
+
+        Args:
+            descartar: True para cerrar la conexión en lugar de reutilizarla
+        """
+        try:
+            if self._cursor:
+                self._cursor.close()
+                self._cursor = None
+
+            if self._conn and self._transaccion is None:
+                await ConexionAsync.liberarConexion(self._conn, close=descartar)
+            self._conn = None
+            self._transaccion = None
+
+        except Exception as e:
+            logger.error('❌ Error al limpiar recursos del AsyncCursorDelPool: %s', e)
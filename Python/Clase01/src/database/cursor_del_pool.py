@@ -6,10 +6,16 @@ Implementa el patrón Context Manager para manejo automático de cursores
 Según diagrama UML con manejo robusto de excepciones
 """
 
-from typing import Optional
-from psycopg2.extensions import connection, cursor
+from typing import Optional, Type
+from psycopg2.extensions import connection, cursor, TRANSACTION_STATUS_IDLE
 from .conexion import Conexion
+from .replicas import registrar_escritura
+from .resiliencia import es_conexion_rota
+from .transaccion import Transaccion
 from src.utils.logger_base import LoggerBase
+from src.utils.metricas import RegistroMetricas
+
+logger = LoggerBase.get_logger('database')
 
 class CursorDelPool:
     """
@@ -17,15 +23,46 @@ class CursorDelPool:
     
     Implementa __enter__ y __exit__ según diagrama UML
     Manejo de excepciones para evitar que se detenga la ejecución
+    
+    Dentro de una Transaccion reutiliza su conexión: no hace commit ni
+    la devuelve al pool, y ante un error marca la transacción para rollback.
+    
+    Con lectura=True la conexión puede venir de una réplica; los cursores
+    de escritura registran la escritura para leer lo propio del primario.
+    
+    Los cursores de solo lectura (por defecto los de lectura=True) no abren
+    transacción: la conexión pasa a autocommit mientras dura el bloque, así
+    un SELECT es un solo viaje al servidor, sin BEGIN ni COMMIT. Un cursor
+    con nombre necesita transacción: se abre con BEGIN READ ONLY.
     """
     
-    def __init__(self):
+    def __init__(self, nombre: Optional[str] = None, itersize: Optional[int] = None,
+                 lectura: bool = False, cursor_factory: Optional[Type[cursor]] = None,
+                 solo_lectura: Optional[bool] = None):
         """
         Constructor según UML
         Inicializa los atributos privados _conn y _cursor
+        
+        Args:
+            nombre: Nombre para crear un cursor del lado del servidor (named cursor)
+            itersize: Filas por viaje al servidor al iterar un cursor con nombre
+            lectura: True si el bloque solo consulta (se puede enrutar a una réplica)
+            cursor_factory: Clase de cursor de psycopg2 (p.ej. CursorUsuarios)
+            solo_lectura: True si el bloque no modifica datos (sin commit);
+                por defecto igual a `lectura`. Con lectura=False la conexión
+                es del primario, para lecturas que no toleran atraso de réplicas
         """
         self._conn: Optional[connection] = None
         self._cursor: Optional[cursor] = None
+        self._nombre = nombre
+        self._itersize = itersize
+        self._lectura = lectura
+        self._cursor_factory = cursor_factory
+        self._solo_lectura = lectura if solo_lectura is None else solo_lectura
+        self._sesion_modificada = False
+        # True si un error dejó la conexión inutilizable: no vuelve al pool
+        self._rota = False
+        self._transaccion: Optional[Transaccion] = None
     
     def __enter__(self) -> Optional[cursor]:
         """
@@ -33,26 +70,48 @@ class CursorDelPool:
         Según UML: +__enter__(self)
         
         Returns:
-            Cursor de la base de datos o None si hay error
+            Cursor de la base de datos o None si hay error (o el circuito
+            está abierto)
+        
+        Raises:
+            OperationalError/InterfaceError: Si no se pudo conectar al servidor
         """
         try:
-            logger = LoggerBase().logger
             logger.debug('🔄 Iniciando context manager - obteniendo conexión...')
             
-            # Obtener conexión del pool
-            self._conn = Conexion.obtenerConexion()
+            # Reutilizar la conexión de la transacción activa o pedir una al pool
+            self._transaccion = Transaccion.actual()
+            if self._transaccion is not None:
+                self._conn = self._transaccion.conexion
+            elif self._lectura:
+                self._conn = Conexion.obtenerConexionLectura(propagar=True)
+            else:
+                # Un error de conexión transitorio se lanza (no None) para
+                # que PoliticaReintentos pueda reintentarlo
+                self._conn = Conexion.obtenerConexion(propagar=True)
             if self._conn is None:
                 logger.error('❌ No se pudo obtener conexión del pool')
                 return None
             
-            # Crear cursor
-            self._cursor = self._conn.cursor()
+            if self._solo_lectura and self._transaccion is None:
+                self._configurar_solo_lectura()
+            
+            # Crear cursor (del lado del servidor si tiene nombre)
+            opciones = {'cursor_factory': self._cursor_factory} if self._cursor_factory else {}
+            if self._nombre:
+                self._cursor = self._conn.cursor(name=self._nombre, **opciones)
+                if self._itersize:
+                    self._cursor.itersize = self._itersize
+            else:
+                self._cursor = self._conn.cursor(**opciones)
             logger.debug('✅ Cursor creado exitosamente')
             
             return self._cursor
             
         except Exception as e:
-            logger.error(f'❌ Error en __enter__ del CursorDelPool: {e}')
+            logger.error('❌ Error en __enter__ del CursorDelPool: %s', e)
+            if self._transaccion is not None:
+                self._transaccion.marcar_fallida()
             # Limpiar recursos si hay error
             self._cleanup_on_error()
             raise e  # Re-lanzar para que el código que usa el context manager sepa que falló
@@ -67,28 +126,53 @@ class CursorDelPool:
             exc_val: Valor de la excepción si ocurrió  
             exc_tb: Traceback de la excepción si ocurrió
         """
+        if self._transaccion is not None:
+            self._salir_de_transaccion(exc_type, exc_val)
+            return
+        
+        self._rota = exc_val is not None and es_conexion_rota(exc_val)
+        if self._sesion_modificada and not self._nombre:
+            # Solo lectura en autocommit: no hay transacción que cerrar
+            if exc_type is not None and not issubclass(exc_type, GeneratorExit):
+                logger.warning('⚠️  Excepción detectada en cursor de solo lectura: %s: %s',
+                               exc_type.__name__, exc_val)
+            self._cleanup_resources()
+            return
+        
         try:
-            logger = LoggerBase().logger
             
-            if exc_type is not None:
+            if exc_type is not None and issubclass(exc_type, GeneratorExit):
+                # Un generador se cerró antes de consumirse por completo
+                if self._conn:
+                    self._conn.rollback()
+                    RegistroMetricas.incrementar('db_rollbacks_total', motivo='generador')
+                    logger.debug('🔄 Rollback por cierre anticipado de generador')
+            elif exc_type is not None:
                 # Hubo una excepción durante la ejecución
-                logger.warning(f'⚠️  Excepción detectada en context manager: {exc_type.__name__}: {exc_val}')
+                logger.warning('⚠️  Excepción detectada en context manager: %s: %s', exc_type.__name__, exc_val)
                 
                 if self._conn:
                     self._conn.rollback()
+                    RegistroMetricas.incrementar('db_rollbacks_total', motivo='excepcion')
                     logger.info('🔄 Rollback ejecutado debido a excepción')
             else:
                 # Todo salió bien, hacer commit
                 if self._conn:
-                    self._conn.commit()
+                    with RegistroMetricas.medir('db_commit_duration_seconds'):
+                        self._conn.commit()
+                    RegistroMetricas.incrementar('db_commits_total')
+                    if not self._lectura and not self._solo_lectura:
+                        registrar_escritura()
                     logger.debug('✅ Commit ejecutado exitosamente')
             
         except Exception as e:
-            logger.error(f'❌ Error durante commit/rollback: {e}')
+            logger.error('❌ Error durante commit/rollback: %s', e)
+            self._rota = self._rota or es_conexion_rota(e)
             # Intentar rollback como último recurso
             try:
                 if self._conn:
                     self._conn.rollback()
+                    RegistroMetricas.incrementar('db_rollbacks_total', motivo='emergencia')
                     logger.info('🔄 Rollback de emergencia ejecutado')
             except:
                 logger.error('❌ Error crítico: no se pudo hacer rollback de emergencia')
@@ -97,22 +181,72 @@ class CursorDelPool:
             # Siempre limpiar recursos
             self._cleanup_resources()
     
+    def _salir_de_transaccion(self, exc_type, exc_val) -> None:
+        """Cierra el cursor sin commit ni liberar la conexión de la transacción"""
+        try:
+            if exc_type is not None and not issubclass(exc_type, GeneratorExit):
+                logger.warning('⚠️  Excepción dentro de la transacción: %s: %s', exc_type.__name__, exc_val)
+                self._transaccion.marcar_fallida()
+            if not self._lectura and not self._solo_lectura:
+                self._transaccion.marcar_escritura()
+            if self._cursor:
+                self._cursor.close()
+        except Exception as e:
+            logger.error('❌ Error al cerrar cursor de la transacción: %s', e)
+            self._transaccion.marcar_fallida()
+        finally:
+            self._cursor = None
+            self._conn = None
+            self._transaccion = None
+    
+    def _configurar_solo_lectura(self) -> None:
+        """
+        Autocommit para cursores normales; BEGIN READ ONLY para cursores con nombre
+        
+        psycopg2 solo guarda estos valores en el cliente (no consulta al
+        servidor): el modo de lectura no agrega viajes.
+        """
+        if self._nombre:
+            self._conn.readonly = True
+        else:
+            self._conn.autocommit = True
+        self._sesion_modificada = True
+    
+    def _restaurar_sesion(self) -> None:
+        """Devuelve la conexión al modo transaccional antes de volver al pool"""
+        if not self._sesion_modificada:
+            return
+        self._sesion_modificada = False
+        if self._conn.closed:
+            return
+        try:
+            if self._nombre:
+                # No se puede cambiar dentro de una transacción abierta
+                if self._conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                    self._conn.rollback()
+                self._conn.readonly = None
+            else:
+                self._conn.autocommit = False
+        except Exception as e:
+            # El pool descarta la conexión si quedó inutilizable
+            logger.error('❌ No se pudo restaurar el modo de la conexión: %s', e)
+    
     def _cleanup_on_error(self) -> None:
         """Limpia recursos cuando hay error en __enter__"""
         try:
             if self._cursor:
                 self._cursor.close()
                 self._cursor = None
-            if self._conn:
+            if self._conn and self._transaccion is None:
+                self._restaurar_sesion()
                 Conexion.liberarConexion(self._conn)
-                self._conn = None
+            self._conn = None
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error limpiando recursos en error: {e}')
+            logger.error('❌ Error limpiando recursos en error: %s', e)
     
     def _cleanup_resources(self) -> None:
         """Limpia todos los recursos del context manager"""
         try:
-            logger = LoggerBase().logger
             
             # Cerrar cursor
             if self._cursor:
@@ -122,12 +256,13 @@ class CursorDelPool:
             
             # Liberar conexión al pool
             if self._conn:
-                Conexion.liberarConexion(self._conn)
+                self._restaurar_sesion()
+                Conexion.liberarConexion(self._conn, descartar=self._rota)
                 logger.debug('🔄 Conexión liberada al pool')
                 self._conn = None
                 
         except Exception as e:
-            LoggerBase().logger.error(f'❌ Error al limpiar recursos del CursorDelPool: {e}')
+            logger.error('❌ Error al limpiar recursos del CursorDelPool: %s', e)
     
     # Métodos adicionales para depuración
     def is_active(self) -> bool:
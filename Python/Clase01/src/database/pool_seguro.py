@@ -0,0 +1,390 @@
+"""
+Pool de Conexiones Thread-Safe
+==============================
+
+Pool de conexiones PostgreSQL seguro entre hilos, con espera bloqueante
+(timeout configurable), validación de conexiones ociosas y reciclado
+de conexiones que superan su tiempo de vida máximo.
+
+Expone la misma interfaz que los pools de psycopg2 (getconn, putconn,
+closeall) para que Conexion pueda usarlo de forma intercambiable.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import psycopg2
+from psycopg2 import pool
+from psycopg2.extensions import connection, TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+from src.utils.metricas import Histograma, LIMITES_LATENCIA
+
+# Un checkout sin espera tarda microsegundos: buckets más finos que los de consultas
+_LIMITES_ESPERA = (0.00001, 0.00005, 0.0001, 0.00025) + LIMITES_LATENCIA
+
+
+class PoolConexionesSeguro:
+    """
+    Pool de conexiones thread-safe con checkout bloqueante
+
+    - getconn() espera hasta `timeout` segundos si el pool está agotado
+      en lugar de fallar inmediatamente
+    - Las conexiones ociosas más de `idle_check` segundos se validan con
+      SELECT 1 antes de entregarse
+    - Las conexiones con más de `max_lifetime` segundos se descartan y
+      se reemplazan por conexiones nuevas
+    - Las conexiones iniciales (y las de calentar()) se abren en paralelo:
+      cada una cuesta un handshake TCP + autenticación con el servidor
+    """
+
+    def __init__(self, minconn: int, maxconn: int,
+                 timeout: float = 30.0,
+                 max_lifetime: float = 3600.0,
+                 idle_check: float = 30.0,
+                 conectar: Optional[Callable[..., connection]] = None,
+                 hilos_apertura: int = 0,
+                 **kwargs):
+        """
+        Constructor del pool
+
+        Args:
+            minconn: Conexiones abiertas al crear el pool
+            maxconn: Máximo de conexiones simultáneas
+            timeout: Segundos máximos de espera en getconn()
+            max_lifetime: Segundos de vida antes de reciclar una conexión (0 = sin límite)
+            idle_check: Segundos ociosa a partir de los cuales se valida la conexión
+            conectar: Función para abrir conexiones (por defecto psycopg2.connect)
+            hilos_apertura: Hilos para abrir las conexiones iniciales
+                (0 = uno por conexión, 1 = de a una)
+            **kwargs: Parámetros de conexión para psycopg2
+        """
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise pool.PoolError('parámetros minconn/maxconn inválidos')
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.idle_check = idle_check
+        self.hilos_apertura = hilos_apertura
+        self.closed = False
+
+        self._kwargs = kwargs
+        self._conectar = conectar or psycopg2.connect
+        self._cond = threading.Condition(threading.Lock())
+        self._ociosas: Deque[Tuple[connection, float]] = deque()
+        self._en_uso: Dict[int, connection] = {}
+        self._creacion: Dict[int, float] = {}
+        self._total = 0
+
+        # Estadísticas acumuladas desde la creación del pool
+        self._creadas = 0
+        self._agotamientos = 0
+        self._timeouts = 0
+        self._espera = Histograma(_LIMITES_ESPERA)
+
+        try:
+            self.calentar(minconn)
+        except Exception:
+            self.closeall()
+            raise
+
+    # === API COMPATIBLE CON psycopg2.pool ===
+
+    def getconn(self, timeout: Optional[float] = None) -> connection:
+        """
+        Obtiene una conexión, esperando si el pool está agotado
+
+        Args:
+            timeout: Segundos de espera (por defecto el timeout del pool)
+
+        Returns:
+            Conexión validada
+
+        Raises:
+            pool.PoolError: Si el pool está cerrado o se agota el tiempo de espera
+        """
+        espera = self.timeout if timeout is None else timeout
+        inicio = time.monotonic()
+        limite = inicio + espera
+
+        while True:
+            conn, ociosa_desde = self._reservar(limite)
+
+            if conn is None:
+                # Se reservó un hueco para crear una conexión nueva
+                try:
+                    conn = self._nueva_conexion()
+                except Exception:
+                    self._liberar_hueco()
+                    raise
+            elif not self._es_reutilizable(conn, ociosa_desde):
+                self._descartar(conn)
+                continue
+
+            with self._cond:
+                self._en_uso[id(conn)] = conn
+                self._espera.observar(time.monotonic() - inicio)
+            return conn
+
+    def putconn(self, conn: connection, close: bool = False) -> None:
+        """
+        Devuelve una conexión al pool
+
+        Args:
+            conn: Conexión obtenida con getconn()
+            close: True para cerrar la conexión en lugar de reutilizarla
+
+        Raises:
+            pool.PoolError: Si la conexión no pertenece al pool
+        """
+        with self._cond:
+            if self._en_uso.pop(id(conn), None) is None:
+                raise pool.PoolError('intentando devolver una conexión que no pertenece al pool')
+
+        if close or self.closed or not self._limpiar_para_reuso(conn):
+            self._descartar(conn)
+            return
+
+        with self._cond:
+            self._ociosas.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self) -> None:
+        """Cierra todas las conexiones del pool"""
+        with self._cond:
+            if self.closed:
+                raise pool.PoolError('el pool de conexiones ya está cerrado')
+            self.closed = True
+            conexiones = [conn for conn, _ in self._ociosas] + list(self._en_uso.values())
+            self._ociosas.clear()
+            self._en_uso.clear()
+            self._creacion.clear()
+            self._total = 0
+            self._cond.notify_all()
+
+        for conn in conexiones:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def descartar_ociosas(self) -> int:
+        """
+        Cierra todas las conexiones ociosas
+
+        Tras un reinicio o failover del servidor las conexiones ociosas
+        están muertas aunque no lo parezcan: se descartan para que las
+        próximas peticiones abran conexiones nuevas.
+
+        Returns:
+            int: Conexiones descartadas
+        """
+        with self._cond:
+            conexiones = [conn for conn, _ in self._ociosas]
+            self._ociosas.clear()
+        for conn in conexiones:
+            self._descartar(conn)
+        return len(conexiones)
+
+    def calentar(self, cantidad: int, hilos: Optional[int] = None) -> int:
+        """
+        Abre en paralelo las conexiones que faltan para tener `cantidad`
+
+        Así la primera ráfaga de peticiones no paga la apertura de
+        conexiones, y el arranque tarda un handshake en lugar de N.
+
+        Args:
+            cantidad: Conexiones abiertas deseadas (tope: maxconn)
+            hilos: Hilos de apertura (por defecto hilos_apertura del pool)
+
+        Returns:
+            int: Conexiones nuevas abiertas
+
+        Raises:
+            El error de la primera conexión que falló (las que se abrieron
+            quedan en el pool)
+        """
+        with self._cond:
+            faltan = min(cantidad, self.maxconn) - self._total
+            if faltan <= 0:
+                return 0
+            # Reservar los huecos para que getconn() no los supere mientras tanto
+            self._total += faltan
+
+        errores = []
+
+        def abrir() -> None:
+            try:
+                conn = self._nueva_conexion()
+            except Exception as e:
+                self._liberar_hueco()
+                errores.append(e)
+                return
+            with self._cond:
+                self._ociosas.append((conn, time.monotonic()))
+                self._cond.notify()
+
+        hilos = min(hilos or self.hilos_apertura or faltan, faltan)
+        if hilos <= 1:
+            for _ in range(faltan):
+                abrir()
+        else:
+            with ThreadPoolExecutor(max_workers=hilos, thread_name_prefix='pool-apertura') as ejecutor:
+                for _ in range(faltan):
+                    ejecutor.submit(abrir)
+
+        if errores:
+            raise errores[0]
+        return faltan
+
+    # === ESTADO DEL POOL ===
+
+    @property
+    def en_uso(self) -> int:
+        """Número de conexiones entregadas actualmente"""
+        with self._cond:
+            return len(self._en_uso)
+
+    @property
+    def ociosas(self) -> int:
+        """Número de conexiones disponibles en el pool"""
+        with self._cond:
+            return len(self._ociosas)
+
+    @property
+    def total(self) -> int:
+        """Número total de conexiones abiertas (o en apertura)"""
+        with self._cond:
+            return self._total
+
+    def estadisticas(self) -> dict:
+        """
+        Estado actual y acumulado del pool
+
+        Returns:
+            dict: conexiones en uso/ociosas/total, creadas, veces agotado,
+            timeouts, espera de checkout p50/p99 (ms) y edad de las conexiones (s)
+        """
+        ahora = time.monotonic()
+        with self._cond:
+            edades = sorted(ahora - creada for creada in self._creacion.values())
+            espera_p50 = self._espera.percentil(50)
+            espera_p99 = self._espera.percentil(99)
+            return {
+                'en_uso': len(self._en_uso),
+                'ociosas': len(self._ociosas),
+                'total': self._total,
+                'creadas_total': self._creadas,
+                'checkouts': self._espera.total,
+                'veces_agotado': self._agotamientos,
+                'timeouts': self._timeouts,
+                'espera_p50_ms': round(espera_p50 * 1000, 3) if espera_p50 is not None else None,
+                'espera_p99_ms': round(espera_p99 * 1000, 3) if espera_p99 is not None else None,
+                'edad_conexiones_s': {
+                    'min': round(edades[0], 1),
+                    'p50': round(edades[len(edades) // 2], 1),
+                    'max': round(edades[-1], 1),
+                } if edades else None,
+            }
+
+    # === MÉTODOS PRIVADOS ===
+
+    def _reservar(self, limite: float) -> Tuple[Optional[connection], float]:
+        """
+        Toma una conexión ociosa o reserva un hueco para crear una nueva
+
+        Returns:
+            (conexión, ociosa_desde) o (None, 0) si se reservó un hueco
+        """
+        with self._cond:
+            esperando = False
+            while True:
+                if self.closed:
+                    raise pool.PoolError('el pool de conexiones está cerrado')
+                if self._ociosas:
+                    return self._ociosas.pop()
+                if self._total < self.maxconn:
+                    self._total += 1
+                    return None, 0.0
+
+                if not esperando:
+                    # Pool agotado: este checkout tiene que esperar
+                    esperando = True
+                    self._agotamientos += 1
+
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    self._timeouts += 1
+                    raise pool.PoolError(
+                        f'tiempo de espera agotado ({self.timeout}s): '
+                        f'las {self.maxconn} conexiones están en uso'
+                    )
+                self._cond.wait(restante)
+
+    def _nueva_conexion(self) -> connection:
+        """Abre una conexión nueva y registra su momento de creación"""
+        conn = self._conectar(**self._kwargs)
+        with self._cond:
+            self._creacion[id(conn)] = time.monotonic()
+            self._creadas += 1
+        return conn
+
+    def _es_reutilizable(self, conn: connection, ociosa_desde: float) -> bool:
+        """Verifica que una conexión ociosa siga viva y dentro de su tiempo de vida"""
+        if conn.closed or self._expirada(conn):
+            return False
+
+        if time.monotonic() - ociosa_desde < self.idle_check:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _limpiar_para_reuso(self, conn: connection) -> bool:
+        """Deja la conexión sin transacción abierta; False si debe descartarse"""
+        if conn.closed or self._expirada(conn):
+            return False
+        try:
+            estado = conn.info.transaction_status
+            if estado == TRANSACTION_STATUS_UNKNOWN:
+                return False
+            if estado != TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _expirada(self, conn: connection) -> bool:
+        """Indica si la conexión superó su tiempo de vida máximo"""
+        if not self.max_lifetime:
+            return False
+        with self._cond:
+            creada = self._creacion.get(id(conn))
+        return creada is not None and time.monotonic() - creada >= self.max_lifetime
+
+    def _descartar(self, conn: connection) -> None:
+        """Cierra una conexión y libera su hueco en el pool"""
+        try:
+            if not conn.closed:
+                conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._creacion.pop(id(conn), None)
+        self._liberar_hueco()
+
+    def _liberar_hueco(self) -> None:
+        """Decrementa el total de conexiones y despierta a un hilo en espera"""
+        with self._cond:
+            if self._total > 0:
+                self._total -= 1
+            self._cond.notify()
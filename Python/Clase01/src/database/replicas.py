@@ -0,0 +1,95 @@
+"""
+Enrutamiento de Lecturas a Réplicas
+===================================
+
+Con DB_REPLICA_HOSTS configurado, Conexion mantiene un pool por réplica
+además del pool del primario:
+  - Las lecturas (CursorDelPool(lectura=True)) van a una réplica elegida
+    por turno ('round_robin') o por menor uso ('menos_ocupada').
+  - Las escrituras y todo lo que ocurre dentro de una Transaccion van
+    al primario.
+  - Leer lo propio: durante DB_READ_YOUR_WRITES_SECONDS después de una
+    escritura, las lecturas del mismo hilo o tarea asyncio van al
+    primario para no ver una réplica atrasada.
+"""
+
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, List, Sequence, Tuple
+
+_ultima_escritura: ContextVar[float] = ContextVar('ultima_escritura', default=0.0)
+
+ESTRATEGIAS = ('round_robin', 'menos_ocupada')
+
+
+def registrar_escritura() -> None:
+    """Marca que el hilo/tarea actual acaba de confirmar una escritura"""
+    _ultima_escritura.set(time.monotonic())
+
+
+def escritura_reciente(ventana: float) -> bool:
+    """
+    True si el hilo/tarea actual escribió hace menos de `ventana` segundos
+
+    Args:
+        ventana: Segundos de lectura desde el primario tras escribir (0 = nunca)
+    """
+    ultima = _ultima_escritura.get()
+    return ventana > 0 and ultima > 0 and time.monotonic() - ultima < ventana
+
+
+def parsear_hosts(texto: str, puerto_defecto: str) -> List[Tuple[str, str]]:
+    """
+    Convierte 'host1:5433,host2' en [('host1', '5433'), ('host2', puerto_defecto)]
+
+    Args:
+        texto: Hosts separados por coma, con puerto opcional
+        puerto_defecto: Puerto para los hosts que no lo indican
+    """
+    hosts = []
+    for parte in texto.split(','):
+        parte = parte.strip()
+        if not parte:
+            continue
+        host, _, puerto = parte.partition(':')
+        hosts.append((host, puerto or puerto_defecto))
+    return hosts
+
+
+class SelectorReplicas:
+    """
+    Elige el orden en que se prueban los pools de réplicas
+
+    Args:
+        pools: Un pool por réplica
+        estrategia: 'round_robin' o 'menos_ocupada'
+        ocupacion: Función que retorna las conexiones en uso de un pool
+    """
+
+    def __init__(self, pools: Sequence[Any], estrategia: str = 'round_robin',
+                 ocupacion: Callable[[Any], int] = lambda pool: 0):
+        if estrategia not in ESTRATEGIAS:
+            raise ValueError(f"Estrategia de réplicas desconocida: {estrategia!r} (use {', '.join(ESTRATEGIAS)})")
+        self.pools = list(pools)
+        self.estrategia = estrategia
+        self._ocupacion = ocupacion
+        self._turno = itertools.count()
+        self._lock = threading.Lock()
+
+    def candidatos(self) -> List[Any]:
+        """
+        Pools en el orden en que se deben probar
+
+        El primero es el elegido; los demás sirven de respaldo si una
+        réplica no entrega conexión.
+        """
+        if not self.pools:
+            return []
+        if self.estrategia == 'menos_ocupada':
+            # sorted es estable: a igual uso se respeta el orden configurado
+            return sorted(self.pools, key=self._ocupacion)
+        with self._lock:
+            inicio = next(self._turno) % len(self.pools)
+        return self.pools[inicio:] + self.pools[:inicio]
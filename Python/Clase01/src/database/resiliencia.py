@@ -0,0 +1,206 @@
+"""
+Reintentos y Disyuntor ante Fallas de la Base de Datos
+======================================================
+
+Herramientas para que un reinicio o failover de PostgreSQL no se
+traduzca en errores para cada operación:
+
+  - es_conexion_rota() / es_error_transitorio(): clasifican un error
+    según su SQLSTATE (clase 08 y 57P0x: la conexión murió; 40001 y
+    40P01: conflicto que se resuelve repitiendo la operación).
+  - PoliticaReintentos: repite una operación idempotente con espera
+    exponencial con jitter (full jitter: uniforme entre 0 y el tope).
+  - Disyuntor (circuit breaker): tras N fallos de conexión seguidos deja
+    de pedir conexiones durante un tiempo y falla de inmediato, en lugar
+    de que cada petición espere el timeout de TCP; luego deja pasar una
+    sola prueba y se cierra si funciona.
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+from psycopg2 import InterfaceError, OperationalError
+from src.utils.logger_base import LoggerBase
+from src.utils.metricas import RegistroMetricas
+
+logger = LoggerBase.get_logger('database')
+
+T = TypeVar('T')
+
+# SQLSTATE de conexión perdida: servidor apagado, reiniciado o sin aceptar conexiones
+_CONEXION_PERDIDA = ('57P01', '57P02', '57P03')
+# SQLSTATE de conflictos entre transacciones: repetir la operación la resuelve
+_CONFLICTO = ('40001', '40P01')
+
+
+def es_conexion_rota(error: BaseException) -> bool:
+    """
+    True si el error indica que la conexión ya no sirve
+
+    Los errores del lado del cliente (sin SQLSTATE), la clase 08 y los
+    apagados del servidor dejan la conexión inutilizable; un
+    statement_timeout o un deadlock también son OperationalError pero no.
+    """
+    if isinstance(error, InterfaceError):
+        return True
+    if not isinstance(error, OperationalError):
+        return False
+    codigo = error.pgcode
+    return codigo is None or codigo.startswith('08') or codigo in _CONEXION_PERDIDA
+
+
+def es_error_transitorio(error: BaseException) -> bool:
+    """True si repetir la operación (idempotente) puede tener éxito"""
+    return es_conexion_rota(error) or getattr(error, 'pgcode', None) in _CONFLICTO
+
+
+class PoliticaReintentos:
+    """
+    Repite operaciones idempotentes ante errores transitorios
+
+    Args:
+        intentos: Intentos totales (1 = sin reintentos)
+        espera_base: Segundos de tope de la primera espera
+        espera_maxima: Tope de cualquier espera
+        dormir: Función de espera (reemplazable en tests)
+    """
+
+    def __init__(self, intentos: int = 3, espera_base: float = 0.1, espera_maxima: float = 2.0,
+                 dormir: Callable[[float], None] = time.sleep):
+        self.intentos = max(intentos, 1)
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+        self._dormir = dormir
+
+    def espera(self, intento: int) -> float:
+        """Segundos a esperar tras el intento fallido número `intento` (desde 1)"""
+        tope = min(self.espera_maxima, self.espera_base * 2 ** (intento - 1))
+        # Full jitter: los clientes que fallaron juntos no reintentan juntos
+        return random.uniform(0, tope)
+
+    def ejecutar(self, funcion: Callable[[], T], operacion: str,
+                 reintentable: Callable[[], bool] = lambda: True) -> T:
+        """
+        Ejecuta `funcion` reintentando los errores transitorios
+
+        Args:
+            funcion: Operación idempotente sin argumentos
+            operacion: Nombre para logs y métricas
+            reintentable: Retorna False cuando no se debe reintentar
+                (p.ej. dentro de una Transaccion, que ya quedó fallida)
+
+        Returns:
+            El resultado de `funcion`
+
+        Raises:
+            El último error si no es transitorio o se agotaron los intentos
+        """
+        intento = 1
+        while True:
+            try:
+                return funcion()
+            except Exception as e:
+                if intento >= self.intentos or not es_error_transitorio(e) or not reintentable():
+                    raise
+                espera = self.espera(intento)
+                RegistroMetricas.incrementar('db_retries_total', operacion=operacion)
+                logger.warning('🔁 %s falló (%s), reintento %s/%s en %.0f ms',
+                               operacion, e.__class__.__name__, intento, self.intentos - 1, espera * 1000)
+                self._dormir(espera)
+                intento += 1
+
+
+class Disyuntor:
+    """
+    Circuit breaker: cerrado -> abierto tras `umbral` fallos seguidos ->
+    semiabierto pasado `tiempo_abierto` -> cerrado si la prueba funciona
+
+    Args:
+        nombre: Identifica el servidor en logs y métricas
+        umbral: Fallos de conexión seguidos que abren el circuito (0 = desactivado)
+        tiempo_abierto: Segundos que falla de inmediato antes de probar de nuevo
+        reloj: Fuente de tiempo monotónico (reemplazable en tests)
+    """
+
+    CERRADO = 'cerrado'
+    ABIERTO = 'abierto'
+    SEMIABIERTO = 'semiabierto'
+
+    def __init__(self, nombre: str, umbral: int = 5, tiempo_abierto: float = 30.0,
+                 reloj: Callable[[], float] = time.monotonic):
+        self.nombre = nombre
+        self.umbral = umbral
+        self.tiempo_abierto = tiempo_abierto
+        self._reloj = reloj
+        self._estado = self.CERRADO
+        self._fallos = 0
+        self._abierto_desde = 0.0
+        # Inicio de la prueba en curso del estado semiabierto (None = ninguna)
+        self._prueba_desde: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def estado(self) -> str:
+        """'cerrado', 'abierto' o 'semiabierto'"""
+        with self._lock:
+            if self._estado == self.ABIERTO and self._reloj() - self._abierto_desde >= self.tiempo_abierto:
+                return self.SEMIABIERTO
+            return self._estado
+
+    def permitir(self) -> bool:
+        """
+        True si se puede intentar una conexión
+
+        Con el circuito abierto retorna False hasta que pasa
+        `tiempo_abierto`; entonces deja pasar una sola prueba (otra si la
+        anterior no informó resultado en `tiempo_abierto`).
+        """
+        if not self.umbral:
+            return True
+        with self._lock:
+            if self._estado == self.CERRADO:
+                return True
+            ahora = self._reloj()
+            if self._estado == self.ABIERTO:
+                if ahora - self._abierto_desde < self.tiempo_abierto:
+                    RegistroMetricas.incrementar('db_circuit_rejected_total', servidor=self.nombre)
+                    return False
+                self._estado = self.SEMIABIERTO
+                self._prueba_desde = None
+            if self._prueba_desde is not None and ahora - self._prueba_desde < self.tiempo_abierto:
+                RegistroMetricas.incrementar('db_circuit_rejected_total', servidor=self.nombre)
+                return False
+            self._prueba_desde = ahora
+            logger.info('🔌 Circuito de %s semiabierto: probando la conexión', self.nombre)
+            return True
+
+    def registrar_exito(self) -> None:
+        """Una operación con el servidor terminó bien: cierra el circuito"""
+        if not self.umbral:
+            return
+        with self._lock:
+            self._fallos = 0
+            self._prueba_desde = None
+            if self._estado == self.CERRADO:
+                return
+            self._estado = self.CERRADO
+        RegistroMetricas.fijar('db_circuit_open', 0, servidor=self.nombre)
+        logger.info('✅ Circuito de %s cerrado: el servidor responde', self.nombre)
+
+    def registrar_fallo(self, error: Optional[BaseException] = None) -> None:
+        """Una conexión con el servidor falló o se rompió"""
+        if not self.umbral:
+            return
+        with self._lock:
+            self._fallos += 1
+            self._prueba_desde = None
+            if self._estado != self.SEMIABIERTO and self._fallos < self.umbral:
+                return
+            reabierto = self._estado == self.ABIERTO
+            self._estado = self.ABIERTO
+            self._abierto_desde = self._reloj()
+        RegistroMetricas.fijar('db_circuit_open', 1, servidor=self.nombre)
+        if not reabierto:
+            logger.error('🚫 Circuito de %s abierto tras %s fallos: se falla de inmediato durante %.0f s (%s)',
+                         self.nombre, self._fallos, self.tiempo_abierto, error)
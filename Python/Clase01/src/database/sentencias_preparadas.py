@@ -0,0 +1,104 @@
+"""
+Sentencias Preparadas por Conexión
+==================================
+
+Permite que cada conexión del pool haga PREPARE de las sentencias fijas
+del DAO la primera vez que las usa y luego solo EXECUTE, evitando que
+el servidor vuelva a analizar y planificar la consulta en cada llamada.
+
+El conjunto de sentencias preparadas vive en la propia conexión
+(ConexionPreparada), así que una conexión reciclada por el pool empieza
+vacía y vuelve a preparar lo que necesite.
+"""
+
+import re
+import sys
+import os
+from typing import Any, Optional, Sequence, Set
+
+from psycopg2 import errors
+from psycopg2.extensions import connection, cursor
+
+# Agregar config al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.database_config import DatabaseConfig
+
+
+class ConexionPreparada(connection):
+    """
+    Conexión psycopg2 que recuerda qué sentencias tiene preparadas
+
+    Se usa como connection_factory al crear el pool.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sentencias_preparadas: Set[str] = set()
+
+
+class SentenciasPreparadas:
+    """
+    Ejecución de sentencias mediante PREPARE/EXECUTE
+
+    Si el modo está desactivado o la conexión no es ConexionPreparada,
+    ejecutar() se comporta como cursor.execute().
+    """
+
+    activo: bool = DatabaseConfig.PREPARED_STATEMENTS
+
+    _PLACEHOLDER = re.compile(r'%s')
+
+    @classmethod
+    def activar(cls) -> None:
+        """Activa el uso de sentencias preparadas"""
+        cls.activo = True
+
+    @classmethod
+    def desactivar(cls) -> None:
+        """Desactiva el uso de sentencias preparadas"""
+        cls.activo = False
+
+    @classmethod
+    def ejecutar(cls, cur: cursor, nombre: str, sql: str,
+                 params: Optional[Sequence[Any]] = None) -> None:
+        """
+        Ejecuta `sql` preparándola en la conexión si hace falta
+
+        Args:
+            cur: Cursor sobre el que ejecutar
+            nombre: Nombre de la sentencia preparada (identificador SQL)
+            sql: Sentencia con parámetros %s
+            params: Parámetros posicionales
+        """
+        preparadas = getattr(cur.connection, 'sentencias_preparadas', None)
+        if not cls.activo or preparadas is None:
+            cur.execute(sql, params)
+            return
+
+        if nombre not in preparadas:
+            cur.execute(f'PREPARE {nombre} AS {cls.convertir_placeholders(sql)}')
+            preparadas.add(nombre)
+
+        argumentos = params or ()
+        marcadores = ', '.join(['%s'] * len(argumentos))
+        try:
+            cur.execute(f'EXECUTE {nombre} ({marcadores})' if argumentos else f'EXECUTE {nombre}',
+                        argumentos or None)
+        except errors.InvalidSqlStatementName:
+            # El servidor perdió la sentencia (p.ej. DISCARD ALL): volver a preparar la próxima vez
+            preparadas.discard(nombre)
+            raise
+
+    @classmethod
+    def convertir_placeholders(cls, sql: str) -> str:
+        """
+        Convierte los parámetros %s de psycopg2 a $1, $2, ... de PREPARE
+
+        Args:
+            sql: Sentencia con parámetros %s
+
+        Returns:
+            Sentencia con parámetros numerados
+        """
+        contador = iter(range(1, sql.count('%s') + 1))
+        return cls._PLACEHOLDER.sub(lambda _: f'${next(contador)}', sql)
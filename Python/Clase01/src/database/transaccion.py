@@ -0,0 +1,213 @@
+"""
+Unidad de Trabajo (Transacción entre llamadas al DAO)
+=====================================================
+
+Permite agrupar varias llamadas al DAO en una sola transacción:
+
+    with Transaccion() as tx:
+        usuario = UsuarioDao.seleccionar_por_id(1)
+        UsuarioDao.actualizar(usuario)
+        total = UsuarioDao.contar_usuarios()
+    if tx.confirmada: ...
+
+Mientras el bloque está activo, la conexión queda asociada al hilo o a
+la tarea asyncio actual (contextvars) y cada CursorDelPool la reutiliza
+sin pedir otra al pool ni hacer commit. Al salir se hace un único
+commit; si alguna operación falló (aunque el DAO haya capturado la
+excepción) se hace rollback de todo.
+
+TransaccionAsync es la contraparte para AsyncUsuarioDao ('async with').
+"""
+
+import time
+from contextvars import ContextVar, Token
+from typing import Callable, List, Optional
+
+from psycopg2.extensions import connection
+from src.utils.logger_base import LoggerBase
+from src.utils.metricas import RegistroMetricas
+from .conexion import Conexion
+from .conexion_async import ConexionAsync, esperar_conexion
+from .replicas import registrar_escritura
+
+logger = LoggerBase.get_logger('database')
+
+_transaccion_actual: ContextVar[Optional['Transaccion']] = ContextVar('transaccion_actual', default=None)
+_transaccion_async_actual: ContextVar[Optional['TransaccionAsync']] = ContextVar(
+    'transaccion_async_actual', default=None
+)
+
+
+class _UnidadDeTrabajo:
+    """Estado común de Transaccion y TransaccionAsync"""
+
+    def __init__(self):
+        self.conexion: Optional[connection] = None
+        self.fallida = False
+        self.confirmada = False
+        self.escritura = False
+        self._externa: Optional['_UnidadDeTrabajo'] = None
+        self._token: Optional[Token] = None
+        self._al_confirmar: List[Callable[[], None]] = []
+
+    def marcar_fallida(self) -> None:
+        """Fuerza rollback al terminar (lo usa CursorDelPool ante un error)"""
+        self.fallida = True
+
+    def marcar_escritura(self) -> None:
+        """Indica que un cursor de escritura se ejecutó dentro de la transacción"""
+        self.escritura = True
+
+    def al_confirmar(self, accion: Callable[[], None]) -> None:
+        """
+        Registra una acción a ejecutar después del commit
+
+        Args:
+            accion: Función sin argumentos (p.ej. invalidar el cache)
+        """
+        self._al_confirmar.append(accion)
+
+    def _ejecutar_al_confirmar(self) -> None:
+        for accion in self._al_confirmar:
+            try:
+                accion()
+            except Exception as e:
+                logger.error('❌ Error en acción posterior al commit: %s', e)
+        self._al_confirmar.clear()
+
+
+class Transaccion(_UnidadDeTrabajo):
+    """
+    Context manager que comparte una conexión entre varias llamadas al DAO
+
+    Un Transaccion dentro de otro se une a la transacción externa.
+    """
+
+    @classmethod
+    def actual(cls) -> Optional['Transaccion']:
+        """Transacción activa en el hilo/tarea actual o None"""
+        return _transaccion_actual.get()
+
+    def __enter__(self) -> 'Transaccion':
+        externa = _transaccion_actual.get()
+        if externa is not None:
+            self._externa = externa
+            return externa
+
+        self.conexion = Conexion.obtenerConexion()
+        if self.conexion is None:
+            # Sin conexión las operaciones del bloque fallan en lugar de ejecutarse sueltas
+            logger.error('❌ No se pudo obtener conexión para la transacción')
+            self.fallida = True
+        self._token = _transaccion_actual.set(self)
+        logger.debug('🔄 Transacción iniciada')
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if self._externa is not None:
+            if exc_type is not None:
+                self._externa.marcar_fallida()
+            return False
+
+        try:
+            if self.conexion is not None:
+                if exc_type is not None or self.fallida:
+                    self.conexion.rollback()
+                    RegistroMetricas.incrementar('db_rollbacks_total', motivo='transaccion')
+                    logger.warning('🔄 Rollback de la transacción: una operación falló')
+                else:
+                    with RegistroMetricas.medir('db_commit_duration_seconds'):
+                        self.conexion.commit()
+                    RegistroMetricas.incrementar('db_commits_total')
+                    self.confirmada = True
+                    # Una transacción de solo lecturas no fija el primario
+                    if self.escritura:
+                        registrar_escritura()
+                    logger.debug('✅ Transacción confirmada')
+        except Exception as e:
+            logger.error('❌ Error al cerrar la transacción: %s', e)
+            try:
+                self.conexion.rollback()
+            except Exception:
+                logger.error('❌ Error crítico: no se pudo hacer rollback de la transacción')
+        finally:
+            _transaccion_actual.reset(self._token)
+            if self.conexion is not None:
+                Conexion.liberarConexion(self.conexion)
+                self.conexion = None
+
+        if self.confirmada:
+            self._ejecutar_al_confirmar()
+        return False
+
+
+class TransaccionAsync(_UnidadDeTrabajo):
+    """
+    Contraparte asyncio de Transaccion para AsyncUsuarioDao
+
+    Las conexiones asíncronas trabajan en autocommit: la transacción se
+    abre con BEGIN y se cierra con COMMIT/ROLLBACK explícitos.
+    """
+
+    @classmethod
+    def actual(cls) -> Optional['TransaccionAsync']:
+        """Transacción asíncrona activa en la tarea actual o None"""
+        return _transaccion_async_actual.get()
+
+    async def __aenter__(self) -> 'TransaccionAsync':
+        externa = _transaccion_async_actual.get()
+        if externa is not None:
+            self._externa = externa
+            return externa
+
+        self.conexion = await ConexionAsync.obtenerConexion()
+        if self.conexion is None:
+            logger.error('❌ No se pudo obtener conexión para la transacción asíncrona')
+            self.fallida = True
+        else:
+            try:
+                await self._ejecutar('BEGIN')
+            except Exception:
+                await ConexionAsync.liberarConexion(self.conexion, close=True)
+                self.conexion = None
+                raise
+        self._token = _transaccion_async_actual.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if self._externa is not None:
+            if exc_type is not None:
+                self._externa.marcar_fallida()
+            return False
+
+        cerrar = False
+        try:
+            if self.conexion is not None:
+                if exc_type is not None or self.fallida:
+                    await self._ejecutar('ROLLBACK')
+                    RegistroMetricas.incrementar('db_rollbacks_total', motivo='transaccion')
+                    logger.warning('🔄 Rollback de la transacción asíncrona: una operación falló')
+                else:
+                    inicio = time.perf_counter()
+                    await self._ejecutar('COMMIT')
+                    RegistroMetricas.observar('db_commit_duration_seconds', time.perf_counter() - inicio)
+                    RegistroMetricas.incrementar('db_commits_total')
+                    self.confirmada = True
+        except Exception as e:
+            # La conexión queda en estado desconocido: no se devuelve al pool
+            logger.error('❌ Error al cerrar la transacción asíncrona: %s', e)
+            cerrar = True
+        finally:
+            _transaccion_async_actual.reset(self._token)
+            if self.conexion is not None:
+                await ConexionAsync.liberarConexion(self.conexion, close=cerrar)
+                self.conexion = None
+
+        if self.confirmada:
+            self._ejecutar_al_confirmar()
+        return False
+
+    async def _ejecutar(self, sql: str) -> None:
+        with self.conexion.cursor() as cursor:
+            cursor.execute(sql)
+            await esperar_conexion(self.conexion)
@@ -4,6 +4,9 @@ Modelo Usuario
 
 Clase que representa la entidad Usuario del sistema
 Implementa el patrón de propiedades para getters/setters
+
+Usa __slots__ (sin __dict__ por instancia) para que materializar muchas
+filas ocupe menos memoria.
 """
 
 from typing import Optional
@@ -19,6 +22,8 @@ class Usuario:
         email (str): Email del usuario (equivale a _TPY_0 del UML)
     """
     
+    __slots__ = ('_id_usuario', '_username', '_password', '_email')
+    
     def __init__(self, id_usuario: Optional[int] = None, 
                  username: Optional[str] = None, 
                  password: Optional[str] = None, 
@@ -6,8 +6,9 @@ Interfaz de usuario para el sistema de gestión de usuarios
 Implementa las 5 opciones según diagrama UML con manejo de excepciones
 """
 
+import itertools
 import sys
-from typing import Optional
+from typing import Iterable, Optional
 from colorama import init, Fore, Style
 
 from src.dao.usuario_dao import UsuarioDao
@@ -128,18 +129,19 @@ class MenuAppUsuario:
             print(f"\n{Fore.CYAN}📋 === LISTA DE USUARIOS ==={Style.RESET_ALL}")
             self.logger.debug("Iniciando listado de usuarios")
             
-            usuarios = self.usuario_dao.seleccionar()
+            # Recorrer con cursor del servidor para no cargar toda la tabla en memoria
+            usuarios = self.usuario_dao.seleccionar_stream()
+            primero = next(usuarios, None)
             
-            if not usuarios:
+            if primero is None:
                 print(f"{Fore.YELLOW}⚠️  No hay usuarios registrados en el sistema{Style.RESET_ALL}")
                 self.logger.info("No se encontraron usuarios para listar")
                 return
             
             # Mostrar tabla de usuarios
-            self._mostrar_tabla_usuarios(usuarios)
+            total = self._mostrar_tabla_usuarios(itertools.chain([primero], usuarios))
             
             # Mostrar estadísticas
-            total = len(usuarios)
             print(f"\n{Fore.GREEN}📊 Total de usuarios: {total}{Style.RESET_ALL}")
             self.logger.info(f"Listado completado: {total} usuarios mostrados")
             
@@ -287,13 +289,16 @@ class MenuAppUsuario:
     
     # === MÉTODOS AUXILIARES ===
     
-    def _mostrar_tabla_usuarios(self, usuarios: list) -> None:
-        """Muestra usuarios en formato tabla"""
+    def _mostrar_tabla_usuarios(self, usuarios: Iterable[Usuario]) -> int:
+        """Muestra usuarios en formato tabla y retorna cuántos se mostraron"""
         print(f"\n{Fore.GREEN}{'ID':<5} {'USERNAME':<20} {'EMAIL':<35}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}{'─'*5} {'─'*20} {'─'*35}{Style.RESET_ALL}")
         
+        total = 0
         for usuario in usuarios:
             print(f"{usuario.id_usuario:<5} {usuario.username:<20} {usuario.email:<35}")
+            total += 1
+        return total
     
     def _solicitar_datos_usuario(self) -> Optional[dict]:
         """Solicita y valida datos para nuevo usuario"""
@@ -6,5 +6,6 @@ Exporta las clases utilitarias del sistema
 """
 
 from .logger_base import LoggerBase
+from .cache_lru import CacheLRU
 
-__all__ = ['LoggerBase']
+__all__ = ['LoggerBase', 'CacheLRU']
@@ -0,0 +1,126 @@
+"""
+Cache LRU con Expiración
+========================
+
+Cache en memoria del proceso con política LRU, tiempo de vida (TTL)
+por entrada y contadores de aciertos/fallos. Thread-safe.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CacheLRU:
+    """
+    Cache LRU con TTL y tamaño máximo
+
+    - Al superar max_size se descarta la entrada usada hace más tiempo
+    - Las entradas con más de ttl segundos se consideran ausentes
+    - Los valores None no se almacenan (None significa "no encontrado")
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0,
+                 reloj: Callable[[], float] = time.monotonic):
+        """
+        Constructor del cache
+
+        Args:
+            max_size: Máximo de entradas almacenadas
+            ttl: Segundos de vida de cada entrada
+            reloj: Función de tiempo (inyectable para tests)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._reloj = reloj
+        self._datos: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._aciertos = 0
+        self._fallos = 0
+        self._expirados = 0
+        self._desalojados = 0
+        self._invalidaciones = 0
+
+    def obtener(self, clave: Hashable) -> Optional[Any]:
+        """
+        Obtiene un valor del cache
+
+        Args:
+            clave: Clave a buscar
+
+        Returns:
+            Valor almacenado o None si no existe o expiró
+        """
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                self._fallos += 1
+                return None
+
+            expira, valor = entrada
+            if self._reloj() >= expira:
+                del self._datos[clave]
+                self._expirados += 1
+                self._fallos += 1
+                return None
+
+            self._datos.move_to_end(clave)
+            self._aciertos += 1
+            return valor
+
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """
+        Guarda un valor en el cache
+
+        Args:
+            clave: Clave de la entrada
+            valor: Valor a almacenar (None se ignora)
+        """
+        if valor is None or self.max_size <= 0:
+            return
+
+        with self._lock:
+            self._datos[clave] = (self._reloj() + self.ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_size:
+                self._datos.popitem(last=False)
+                self._desalojados += 1
+
+    def invalidar(self, *claves: Hashable) -> None:
+        """Elimina las claves indicadas del cache"""
+        with self._lock:
+            for clave in claves:
+                if self._datos.pop(clave, None) is not None:
+                    self._invalidaciones += 1
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas (los contadores se conservan)"""
+        with self._lock:
+            self._invalidaciones += len(self._datos)
+            self._datos.clear()
+
+    def estadisticas(self) -> Dict[str, Any]:
+        """
+        Obtiene los contadores del cache
+
+        Returns:
+            dict: aciertos, fallos, tasa de aciertos, tamaño y desalojos
+        """
+        with self._lock:
+            consultas = self._aciertos + self._fallos
+            return {
+                'aciertos': self._aciertos,
+                'fallos': self._fallos,
+                'tasa_aciertos': self._aciertos / consultas if consultas else 0.0,
+                'expirados': self._expirados,
+                'desalojados': self._desalojados,
+                'invalidaciones': self._invalidaciones,
+                'tamano': len(self._datos),
+                'max_size': self.max_size,
+                'ttl': self.ttl
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._datos)
@@ -0,0 +1,268 @@
+"""
+Hash de Contraseñas
+===================
+
+Las contraseñas se guardan como hash de un KDF de la biblioteca estándar
+(scrypt o PBKDF2-HMAC-SHA256) con sal aleatoria por usuario. El texto
+guardado incluye el algoritmo y sus parámetros, así un cambio de costo
+no invalida los hashes existentes:
+
+    scrypt$n=16384,r=8,p=1$<sal>$<hash>
+    pbkdf2_sha256$i=600000$<sal>$<hash>
+
+(sal y hash en base64 url-safe sin relleno)
+
+Los parámetros se leen del valor guardado: para que un hash con costo
+desmedido (n=2^30, millones de iteraciones) no se convierta en un DoS de
+memoria o CPU en cada login, _derivar() rechaza los que superan los topes.
+
+Cada hash cuesta decenas de milisegundos de CPU: se calcula en un pool de
+hilos. hashlib libera el GIL durante scrypt/PBKDF2, así que los hashes
+de varios hilos (altas masivas, logins concurrentes) corren en paralelo
+en distintos núcleos sin bloquear al intérprete.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import re
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Agregar config al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.seguridad_config import SeguridadConfig
+from src.utils.logger_base import LoggerBase
+
+logger = LoggerBase.get_logger('seguridad')
+
+ALGORITMOS = ('scrypt', 'pbkdf2_sha256')
+
+_BYTES_SAL = 16
+_BYTES_HASH = 32
+
+# Topes de costo aceptados (al configurar y al verificar un hash guardado)
+_MAXIMA_MEMORIA_SCRYPT = 256 * 1024 * 1024
+_MAXIMO_SCRYPT_P = 16
+_MAXIMAS_ITERACIONES_PBKDF2 = 2_000_000
+
+_FORMATO = re.compile(
+    r'^(?P<algoritmo>scrypt|pbkdf2_sha256)'
+    r'\$(?P<parametros>[a-z]=\d+(?:,[a-z]=\d+)*)'
+    r'\$(?P<sal>[A-Za-z0-9_-]+)'
+    r'\$(?P<hash>[A-Za-z0-9_-]+)$'
+)
+
+
+def _b64(datos: bytes) -> str:
+    return base64.urlsafe_b64encode(datos).rstrip(b'=').decode('ascii')
+
+
+def _desde_b64(texto: str) -> bytes:
+    return base64.urlsafe_b64decode(texto + '=' * (-len(texto) % 4))
+
+
+def _memoria_scrypt(n: int, r: int, p: int) -> int:
+    """Bytes que necesita scrypt: 128·r·(N + p + 2)"""
+    return 128 * r * (n + p + 2)
+
+
+def _validar_parametros(algoritmo: str, parametros: Dict[str, int]) -> None:
+    """
+    Verifica que los parámetros estén completos y dentro de los topes
+
+    Raises:
+        ValueError: Si falta alguno o el costo supera los topes
+    """
+    try:
+        if algoritmo == 'scrypt':
+            n, r, p = parametros['n'], parametros['r'], parametros['p']
+            if min(n, r, p) < 1 or p > _MAXIMO_SCRYPT_P or _memoria_scrypt(n, r, p) > _MAXIMA_MEMORIA_SCRYPT:
+                raise ValueError(f'parámetros de scrypt fuera de los topes: n={n}, r={r}, p={p}')
+        elif not 1 <= parametros['i'] <= _MAXIMAS_ITERACIONES_PBKDF2:
+            raise ValueError(f"iteraciones de PBKDF2 fuera de los topes: {parametros['i']}")
+    except KeyError as e:
+        raise ValueError(f'falta el parámetro {e} de {algoritmo}') from None
+
+
+def _derivar(algoritmo: str, parametros: Dict[str, int], password: bytes, sal: bytes) -> bytes:
+    """
+    Calcula el KDF (libera el GIL mientras corre)
+
+    Raises:
+        ValueError: Si los parámetros superan los topes de costo
+    """
+    _validar_parametros(algoritmo, parametros)
+    if algoritmo == 'scrypt':
+        n, r, p = parametros['n'], parametros['r'], parametros['p']
+        # Memoria que necesita scrypt, con margen (acotada por _validar_parametros)
+        return hashlib.scrypt(password, salt=sal, n=n, r=r, p=p,
+                              maxmem=2 * _memoria_scrypt(n, r, p), dklen=_BYTES_HASH)
+    return hashlib.pbkdf2_hmac('sha256', password, sal, parametros['i'], dklen=_BYTES_HASH)
+
+
+def _separar(almacenado: str) -> Optional[Tuple[str, Dict[str, int], bytes, bytes]]:
+    """(algoritmo, parámetros, sal, hash) o None si no tiene el formato"""
+    coincidencia = _FORMATO.match(almacenado or '')
+    if coincidencia is None:
+        return None
+    parametros = {clave: int(valor) for clave, valor in
+                  (par.split('=') for par in coincidencia.group('parametros').split(','))}
+    return (coincidencia.group('algoritmo'), parametros,
+            _desde_b64(coincidencia.group('sal')), _desde_b64(coincidencia.group('hash')))
+
+
+class Contrasenas:
+    """
+    Hash y verificación de contraseñas en un pool de hilos
+
+    hashear()/verificar() esperan el resultado; enviar_hash() y
+    enviar_verificacion() retornan un Future (en asyncio se espera con
+    asyncio.wrap_future) y hashear_lote() reparte una lista entre los hilos.
+    """
+
+    # hashlib.scrypt requiere OpenSSL 1.1+: sin él se usa PBKDF2
+    algoritmo: str = (SeguridadConfig.PASSWORD_ALGORITHM
+                      if hasattr(hashlib, 'scrypt') else 'pbkdf2_sha256')
+    parametros: Dict[str, Dict[str, int]] = {
+        'scrypt': {'n': SeguridadConfig.SCRYPT_N, 'r': SeguridadConfig.SCRYPT_R, 'p': SeguridadConfig.SCRYPT_P},
+        'pbkdf2_sha256': {'i': SeguridadConfig.PBKDF2_ITERATIONS},
+    }
+    trabajadores: int = SeguridadConfig.HASH_WORKERS or os.cpu_count() or 1
+
+    _ejecutor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.Lock()
+    _hash_ficticio: Optional[str] = None
+
+    @classmethod
+    def configurar(cls, algoritmo: Optional[str] = None, trabajadores: Optional[int] = None,
+                   **parametros: int) -> None:
+        """
+        Cambia el algoritmo, sus parámetros o el tamaño del pool
+
+        Args:
+            algoritmo: 'scrypt' o 'pbkdf2_sha256'
+            trabajadores: Hilos del pool (se recrea el pool)
+            **parametros: n, r, p para scrypt o i para PBKDF2
+
+        Raises:
+            ValueError: Si el algoritmo es desconocido o el costo supera los topes
+        """
+        if algoritmo is not None and algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo desconocido: {algoritmo!r} (use {', '.join(ALGORITMOS)})")
+        algoritmo = algoritmo or cls.algoritmo
+        if parametros:
+            nuevos = {**cls.parametros[algoritmo], **parametros}
+            _validar_parametros(algoritmo, nuevos)
+            cls.parametros = {**cls.parametros, algoritmo: nuevos}
+        cls.algoritmo = algoritmo
+        if trabajadores is not None:
+            cls.cerrar()
+            cls.trabajadores = max(trabajadores, 1)
+        cls._hash_ficticio = None
+
+    @classmethod
+    def ejecutor(cls) -> ThreadPoolExecutor:
+        """Pool de hilos del KDF, creado la primera vez que se usa"""
+        if cls._ejecutor is None:
+            with cls._lock:
+                if cls._ejecutor is None:
+                    cls._ejecutor = ThreadPoolExecutor(max_workers=cls.trabajadores, thread_name_prefix='kdf')
+                    logger.debug('🔐 Pool de hash de contraseñas: %s hilos, %s', cls.trabajadores, cls.algoritmo)
+        return cls._ejecutor
+
+    @classmethod
+    def cerrar(cls) -> None:
+        """Detiene el pool (se vuelve a crear si se necesita)"""
+        with cls._lock:
+            ejecutor, cls._ejecutor = cls._ejecutor, None
+        if ejecutor is not None:
+            ejecutor.shutdown(wait=True)
+
+    # === API ===
+
+    @classmethod
+    def es_hash(cls, valor: Optional[str]) -> bool:
+        """True si el valor ya es un hash con formato reconocido (no texto plano)"""
+        return _separar(valor) is not None
+
+    @classmethod
+    def hashear(cls, password: str) -> str:
+        """Hash de la contraseña con sal nueva, calculado en el pool"""
+        return cls.enviar_hash(password).result()
+
+    @classmethod
+    def verificar(cls, password: str, almacenado: str) -> bool:
+        """True si la contraseña corresponde al valor almacenado, verificado en el pool"""
+        return cls.enviar_verificacion(password, almacenado).result()
+
+    @classmethod
+    def hashear_lote(cls, passwords: Iterable[str]) -> List[str]:
+        """Hashes de varias contraseñas repartidos entre los hilos del pool"""
+        return list(cls.ejecutor().map(cls.calcular_hash, passwords))
+
+    @classmethod
+    def enviar_hash(cls, password: str) -> 'Future[str]':
+        """Encola el hash en el pool y retorna su Future"""
+        return cls.ejecutor().submit(cls.calcular_hash, password)
+
+    @classmethod
+    def enviar_verificacion(cls, password: str, almacenado: str) -> 'Future[bool]':
+        """Encola la verificación en el pool y retorna su Future"""
+        return cls.ejecutor().submit(cls.comparar, password, almacenado)
+
+    @classmethod
+    def necesita_rehash(cls, almacenado: str) -> bool:
+        """
+        True si el valor está en texto plano o con otro algoritmo/costo
+
+        Se usa al autenticar para actualizar el hash con la contraseña en mano.
+        """
+        partes = _separar(almacenado)
+        return partes is None or partes[0] != cls.algoritmo or partes[1] != cls.parametros[cls.algoritmo]
+
+    # === CÁLCULO (en el hilo que llama) ===
+
+    @classmethod
+    def calcular_hash(cls, password: str) -> str:
+        """Calcula el hash en el hilo actual (los métodos de la API usan el pool)"""
+        algoritmo = cls.algoritmo
+        parametros = cls.parametros[algoritmo]
+        sal = os.urandom(_BYTES_SAL)
+        derivado = _derivar(algoritmo, parametros, password.encode('utf-8'), sal)
+        texto_parametros = ','.join(f'{clave}={valor}' for clave, valor in parametros.items())
+        return f'{algoritmo}${texto_parametros}${_b64(sal)}${_b64(derivado)}'
+
+    @classmethod
+    def comparar(cls, password: str, almacenado: Optional[str]) -> bool:
+        """
+        Verifica en el hilo actual, en tiempo constante respecto del hash
+
+        Un valor sin formato de hash se trata como contraseña heredada en
+        texto plano (filas anteriores a este módulo).
+        """
+        password_bytes = password.encode('utf-8')
+        partes = _separar(almacenado)
+        if partes is None:
+            if almacenado is None:
+                # Usuario inexistente: se gasta lo mismo que en uno real
+                cls.comparar(password, cls._obtener_hash_ficticio())
+                return False
+            return hmac.compare_digest(password_bytes, almacenado.encode('utf-8'))
+
+        algoritmo, parametros, sal, esperado = partes
+        try:
+            derivado = _derivar(algoritmo, parametros, password_bytes, sal)
+        except (KeyError, ValueError) as e:
+            logger.error('❌ Hash de contraseña con parámetros inválidos: %s', e)
+            return False
+        return hmac.compare_digest(derivado, esperado)
+
+    @classmethod
+    def _obtener_hash_ficticio(cls) -> str:
+        if cls._hash_ficticio is None:
+            cls._hash_ficticio = cls.calcular_hash(_b64(os.urandom(_BYTES_SAL)))
+        return cls._hash_ficticio
@@ -0,0 +1,86 @@
+"""
+Formato de Log Estructurado (JSON)
+==================================
+
+Emite un objeto JSON por línea para que los logs se puedan ingerir sin
+expresiones regulares. Además de timestamp, nivel, logger, función y
+mensaje, incluye los campos de evento que el DAO agrega con `extra`:
+operation, duration_ms y rows.
+
+Usa orjson si está instalado; si no, un JSONEncoder reutilizado de la
+biblioteca estándar.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # Dependencia opcional
+    orjson = None
+
+
+# Atributos de evento que se copian del LogRecord al JSON si están presentes
+CAMPOS_EVENTO = ('operation', 'duration_ms', 'rows')
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def serializar(datos: Dict[str, Any]) -> str:
+    """
+    Serializa un diccionario a una línea JSON compacta
+
+    Args:
+        datos: Valores a serializar (los no serializables se convierten con str)
+
+    Returns:
+        str: JSON sin saltos de línea
+    """
+    if orjson is not None:
+        return orjson.dumps(datos, default=str).decode('utf-8')
+    return _encoder.encode(datos)
+
+
+def evento(operacion: str, inicio: Optional[float] = None, filas: Optional[int] = None) -> dict:
+    """
+    Construye los campos de evento para pasar como `extra` a un logger
+
+    Args:
+        operacion: Nombre de la operación del DAO (p.ej. 'insertar')
+        inicio: Valor de time.perf_counter() al comenzar la operación
+        filas: Filas leídas o afectadas
+
+    Returns:
+        dict: operation, y duration_ms / rows si se indicaron
+    """
+    campos: Dict[str, Any] = {'operation': operacion}
+    if inicio is not None:
+        campos['duration_ms'] = round((time.perf_counter() - inicio) * 1000, 3)
+    if filas is not None:
+        campos['rows'] = filas
+    return campos
+
+
+class FormateadorJSON(logging.Formatter):
+    """Formatter que produce un objeto JSON por registro"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        datos: Dict[str, Any] = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'funcName': record.funcName,
+            'message': record.getMessage(),
+        }
+        for campo in CAMPOS_EVENTO:
+            valor = getattr(record, campo, None)
+            if valor is not None:
+                datos[campo] = valor
+        if record.exc_info:
+            datos['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            datos['exception'] = record.exc_text
+        return serializar(datos)
@@ -6,11 +6,20 @@ Configuración centralizada del sistema de logging
 Según diagrama UML con configuracion_logging()
 """
 
+import atexit
 import logging
 import sys
 import os
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
+
+# Agregar config al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.logging_config import LoggingConfig
+from src.utils.logging_async import (ColaLogsHandler, ListenerLogs,
+                                     crear_logging_async, detener_logging_async)
+from src.utils.rotacion_logs import ArchivoLogRotativo, TareasRotacion
+from src.utils.formato_json import FormateadorJSON
 
 class LoggerBase:
     """
@@ -22,6 +31,12 @@ class LoggerBase:
     
     _instance: Optional['LoggerBase'] = None
     _logger: Optional[logging.Logger] = None
+
+    # Loggers hijos que emiten un registro DEBUG por consulta/conexión
+    _LOGGERS_CONSULTAS = ('usuario_app.dao', 'usuario_app.database')
+
+    # Modo asíncrono: por logger, su handler de cola y el listener con los handlers reales
+    _colas: List[Tuple[logging.Logger, ColaLogsHandler, ListenerLogs]] = []
     
     def __new__(cls) -> 'LoggerBase':
         """Implementa patrón Singleton"""
@@ -57,7 +72,8 @@ class LoggerBase:
         try:
             # Crear logger principal
             logger = logging.getLogger('usuario_app')
-            logger.setLevel(logging.DEBUG)
+            logger.setLevel(LoggingConfig.LEVEL)
+            self.configurar_debug_consultas(LoggingConfig.DAO_DEBUG)
             
             # Evitar duplicar handlers si ya están configurados
             if logger.handlers:
@@ -71,17 +87,11 @@ class LoggerBase:
             
             # 2. Handler para archivo de logs generales (DEBUG y superior)
             log_dir = self._crear_directorio_logs()
-            file_handler = logging.FileHandler(
-                os.path.join(log_dir, 'usuario_app.log'), 
-                encoding='utf-8'
-            )
+            file_handler = self._crear_archivo_rotativo(os.path.join(log_dir, 'usuario_app.log'))
             file_handler.setLevel(logging.DEBUG)
             
             # 3. Handler para archivo de errores (ERROR y superior)
-            error_handler = logging.FileHandler(
-                os.path.join(log_dir, 'errores.log'),
-                encoding='utf-8'
-            )
+            error_handler = self._crear_archivo_rotativo(os.path.join(log_dir, 'errores.log'))
             error_handler.setLevel(logging.ERROR)
             
             # === CONFIGURACIÓN DE FORMATOS ===
@@ -97,24 +107,40 @@ class LoggerBase:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             
-            # Formato para errores (máximo detalle)
+            # Formato para errores (máximo detalle); para salida estructurada
+            # usar LOG_FORMAT=json, que escapa el mensaje correctamente
             error_format = logging.Formatter(
-                '%(asctime)s | %(name)s | ERROR | %(funcName)s:%(lineno)d | %(message)s\n'
+                '%(asctime)s | %(name)s | %(levelname)s | %(funcName)s:%(lineno)d | %(message)s\n'
                 'Detalles: %(pathname)s\n'
-                '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "message": "%(message)s"}\n'
                 + '-' * 80,
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             
+            # Formato estructurado: un objeto JSON por línea en ambos archivos
+            if LoggingConfig.FORMAT == 'json':
+                file_format = error_format = FormateadorJSON()
+            
             # === APLICAR FORMATOS ===
             console_handler.setFormatter(console_format)
             file_handler.setFormatter(file_format)
             error_handler.setFormatter(error_format)
             
+            # 4. Archivo dedicado de consultas lentas (no se propaga a los demás)
+            lentas_handler = self._crear_archivo_rotativo(os.path.join(log_dir, 'consultas_lentas.log'))
+            lentas_handler.setFormatter(file_format)
+            logger_lentas = logging.getLogger('usuario_app.consultas_lentas')
+            logger_lentas.propagate = False
+            
             # === AGREGAR HANDLERS AL LOGGER ===
-            logger.addHandler(console_handler)
-            logger.addHandler(file_handler)
-            logger.addHandler(error_handler)
+            handlers = [console_handler, file_handler, error_handler]
+            if LoggingConfig.ASYNC:
+                self._activar_cola(logger, handlers)
+                # Cola propia: el hilo que ejecutó la consulta tampoco escribe en disco
+                self._activar_cola(logger_lentas, [lentas_handler])
+            else:
+                for handler in handlers:
+                    logger.addHandler(handler)
+                logger_lentas.addHandler(lentas_handler)
             
             # === LOG INICIAL ===
             logger.info('=' * 60)
@@ -125,6 +151,14 @@ class LoggerBase:
             logger.info('   • Consola: INFO y superior')
             logger.info('   • Archivo general: DEBUG y superior') 
             logger.info('   • Archivo errores: ERROR y superior')
+            logger.info('   • Archivo consultas lentas: consultas_lentas.log')
+            logger.info('   • Formato de archivos: %s', LoggingConfig.FORMAT)
+            logger.info('   • Rotación: cada %s MB y %s, conservando %s archivos / %s días',
+                        LoggingConfig.MAX_MB, LoggingConfig.ROTATION_WHEN,
+                        LoggingConfig.BACKUP_COUNT, LoggingConfig.RETENTION_DAYS)
+            if LoggingConfig.ASYNC:
+                logger.info('   • Escritura asíncrona: cola de %s registros, política %s',
+                            LoggingConfig.QUEUE_SIZE, LoggingConfig.QUEUE_POLICY)
             logger.info('=' * 60)
             
             return logger
@@ -143,6 +177,62 @@ class LoggerBase:
             
             return fallback_logger
     
+    def _crear_archivo_rotativo(self, ruta: str) -> ArchivoLogRotativo:
+        """
+        Crea un handler de archivo con la rotación configurada en LoggingConfig
+
+        Args:
+            ruta: Ruta del archivo de log
+
+        Returns:
+            Handler que rota por tamaño y tiempo
+        """
+        return ArchivoLogRotativo(
+            ruta,
+            max_bytes=int(LoggingConfig.MAX_MB * 1024 * 1024),
+            when=LoggingConfig.ROTATION_WHEN,
+            retencion_archivos=LoggingConfig.BACKUP_COUNT,
+            retencion_dias=LoggingConfig.RETENTION_DAYS,
+            comprimir=LoggingConfig.COMPRESS,
+        )
+
+    def _activar_cola(self, logger: logging.Logger, handlers: List[logging.Handler]) -> None:
+        """
+        Conecta el logger a una cola atendida por un hilo de fondo
+
+        Args:
+            logger: Logger a conectar (el principal o el de consultas lentas)
+            handlers: Handlers reales que escriben en consola y archivos
+        """
+        handler_cola, listener = crear_logging_async(
+            handlers, LoggingConfig.QUEUE_SIZE, LoggingConfig.QUEUE_POLICY
+        )
+        if not LoggerBase._colas:
+            # Si la aplicación termina sin log_shutdown_info(), vaciar igual las colas
+            atexit.register(LoggerBase.detener_cola)
+        LoggerBase._colas.append((logger, handler_cola, listener))
+        logger.addHandler(handler_cola)
+
+    @classmethod
+    def detener_cola(cls) -> None:
+        """
+        Vacía las colas de logs y vuelve a escritura síncrona
+
+        Los registros posteriores se escriben directamente con los
+        handlers reales, así no se pierden mensajes emitidos al cerrar.
+        """
+        colas, cls._colas = cls._colas, []
+        for logger, handler_cola, listener in colas:
+            if handler_cola.descartados:
+                logging.getLogger('usuario_app').warning(
+                    '⚠️  Registros de log descartados por cola llena (%s): %s',
+                    logger.name, handler_cola.descartados)
+
+            detener_logging_async(listener)
+            logger.removeHandler(handler_cola)
+            for handler in listener.handlers:
+                logger.addHandler(handler)
+
     def _crear_directorio_logs(self) -> str:
         """
         Crea el directorio de logs si no existe
@@ -167,21 +257,38 @@ class LoggerBase:
             os.makedirs(fallback_dir, exist_ok=True)
             return fallback_dir
     
+    @classmethod
+    def configurar_debug_consultas(cls, activo: bool) -> None:
+        """
+        Activa o desactiva los registros DEBUG del DAO, cursores y pool
+
+        Con el modo desactivado, logger.debug() en esos módulos descarta
+        el registro con una sola comparación de nivel, sin formatear nada.
+
+        Args:
+            activo: True para emitir DEBUG por consulta, False para INFO
+        """
+        nivel = logging.NOTSET if activo else logging.INFO
+        for nombre in cls._LOGGERS_CONSULTAS:
+            logging.getLogger(nombre).setLevel(nivel)
+
     @classmethod
     def get_logger(cls, name: Optional[str] = None) -> logging.Logger:
         """
         Método estático para obtener un logger
         
+        No configura handlers ni crea archivos: se puede llamar al importar
+        un módulo sin costo. Los handlers se configuran una sola vez con
+        LoggerBase() desde el punto de entrada (app.py, scripts); hasta
+        entonces solo WARNING y superior llegan a stderr.
+        
         Args:
             name: Nombre específico del logger (opcional)
             
         Returns:
-            Logger configurado
+            Logger 'usuario_app' o su hijo 'usuario_app.<name>'
         """
-        if name:
-            return logging.getLogger(f'usuario_app.{name}')
-        else:
-            return cls().logger
+        return logging.getLogger(f'usuario_app.{name}' if name else 'usuario_app')
     
     def log_startup_info(self) -> None:
         """Registra información de inicio de la aplicación"""
@@ -200,6 +307,9 @@ class LoggerBase:
             self.logger.info('🔒 CERRANDO APLICACIÓN')
             self.logger.info(f'📅 Sesión finalizada: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
             self.logger.info('=' * 60)
+            self.detener_cola()
+            # Terminar compresiones de archivos rotados antes de salir
+            TareasRotacion.esperar()
         except Exception as e:
             print(f"Error registrando cierre: {e}")
     
@@ -0,0 +1,102 @@
+"""
+Logging Asíncrono con Cola
+==========================
+
+Desacopla la escritura de logs del hilo que atiende la operación:
+los registros se encolan en memoria y un hilo de fondo los entrega a
+los handlers reales (consola y archivos).
+
+La cola es acotada. Cuando se llena, la política decide:
+  - 'drop':  se descarta el registro (el hilo nunca espera al disco);
+             WARNING y superiores siempre se encolan esperando lugar
+  - 'block': el hilo espera hasta que haya lugar en la cola
+"""
+
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+POLITICA_DESCARTAR = 'drop'
+POLITICA_BLOQUEAR = 'block'
+
+
+class ColaLogsHandler(QueueHandler):
+    """
+    QueueHandler con cola acotada y política de desborde
+
+    Cuenta los registros descartados para poder informarlos al cerrar.
+    """
+
+    def __init__(self, cola: queue.Queue, politica: str = POLITICA_DESCARTAR):
+        super().__init__(cola)
+        if politica not in (POLITICA_DESCARTAR, POLITICA_BLOQUEAR):
+            raise ValueError(f"Política de cola inválida: {politica!r}")
+        self.politica = politica
+        self._descartados = 0
+        self._lock_descartados = threading.Lock()
+
+    @property
+    def descartados(self) -> int:
+        """Registros perdidos por cola llena"""
+        return self._descartados
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Encola el registro aplicando la política de desborde"""
+        if self.politica == POLITICA_BLOQUEAR or record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock_descartados:
+                self._descartados += 1
+
+
+class ListenerLogs(QueueListener):
+    """
+    QueueListener que espera lugar en la cola para la señal de fin
+
+    El QueueListener estándar usa put_nowait() para detenerse, lo que
+    falla si la cola acotada está llena en ese momento.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+def crear_logging_async(handlers: list, tamano_cola: int,
+                        politica: str = POLITICA_DESCARTAR) -> tuple:
+    """
+    Crea el handler de cola y el listener que atiende a `handlers`
+
+    Args:
+        handlers: Handlers reales que escribirán los registros
+        tamano_cola: Máximo de registros pendientes (0 = sin límite)
+        politica: 'drop' o 'block' cuando la cola está llena
+
+    Returns:
+        tuple: (ColaLogsHandler, ListenerLogs) con el listener ya iniciado
+    """
+    cola: queue.Queue = queue.Queue(maxsize=tamano_cola)
+    handler = ColaLogsHandler(cola, politica)
+    listener = ListenerLogs(cola, *handlers, respect_handler_level=True)
+    listener.start()
+    return handler, listener
+
+
+def detener_logging_async(listener: Optional[ListenerLogs]) -> None:
+    """
+    Vacía la cola y detiene el hilo de fondo
+
+    Args:
+        listener: Listener a detener (None no hace nada)
+    """
+    if listener is None or listener._thread is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
@@ -0,0 +1,333 @@
+"""
+Registro de Métricas en Proceso
+===============================
+
+Histogramas de latencia, contadores y medidores para las operaciones de base de
+datos: tiempo por sentencia del DAO (etiquetada con el nombre de la
+constante, p.ej. '_SELECCIONAR_POR_ID'), espera del pool, commit,
+rollback, liberación de conexiones y errores.
+
+Las métricas se consultan con RegistroMetricas.instantanea() o en
+formato de texto de Prometheus con RegistroMetricas.exponer(), que
+ServidorMetricas publica por HTTP en /metrics para un scraper local.
+"""
+
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+# Agregar config al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.database_config import DatabaseConfig
+from src.utils.logger_base import LoggerBase
+
+logger = LoggerBase.get_logger('metricas')
+
+
+# Límites superiores en segundos: de 0.5 ms a 10 s
+LIMITES_LATENCIA: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+Etiquetas = Tuple[Tuple[str, str], ...]
+
+
+class Histograma:
+    """
+    Histograma de buckets fijos (acumulables al exponer)
+
+    Args:
+        limites: Límites superiores de cada bucket, en orden creciente
+    """
+
+    def __init__(self, limites: Sequence[float] = LIMITES_LATENCIA):
+        self.limites = tuple(limites)
+        self.conteos = [0] * (len(self.limites) + 1)  # el último es +Inf
+        self.suma = 0.0
+        self.total = 0
+
+    def observar(self, valor: float) -> None:
+        """Registra un valor (no es thread-safe por sí solo)"""
+        self.conteos[bisect_left(self.limites, valor)] += 1
+        self.suma += valor
+        self.total += 1
+
+    def percentil(self, p: float) -> Optional[float]:
+        """
+        Estima el percentil `p` (0-100) interpolando dentro del bucket
+
+        Returns:
+            Valor estimado o None si no hay observaciones
+        """
+        if self.total == 0:
+            return None
+        objetivo = self.total * p / 100
+        acumulado = 0
+        for indice, conteo in enumerate(self.conteos):
+            if conteo and acumulado + conteo >= objetivo:
+                if indice == len(self.limites):
+                    return self.limites[-1]
+                inferior = self.limites[indice - 1] if indice else 0.0
+                fraccion = (objetivo - acumulado) / conteo
+                return inferior + (self.limites[indice] - inferior) * fraccion
+            acumulado += conteo
+        return self.limites[-1]
+
+    def a_dict(self) -> dict:
+        """Resumen del histograma"""
+        return {
+            'total': self.total,
+            'suma': self.suma,
+            'promedio': self.suma / self.total if self.total else None,
+            'p50': self.percentil(50),
+            'p99': self.percentil(99),
+        }
+
+
+class RegistroMetricas:
+    """
+    Registro único de métricas del proceso
+
+    Todas las operaciones son thread-safe. Con el registro desactivado
+    (DB_METRICS_ENABLED=false) observar() e incrementar() no hacen nada.
+    """
+
+    activo: bool = DatabaseConfig.METRICS_ENABLED
+
+    _lock = threading.Lock()
+    _histogramas: Dict[Tuple[str, Etiquetas], Histograma] = {}
+    _contadores: Dict[Tuple[str, Etiquetas], float] = {}
+    _medidores: Dict[Tuple[str, Etiquetas], float] = {}
+
+    @classmethod
+    def activar(cls) -> None:
+        """Activa el registro de métricas"""
+        cls.activo = True
+
+    @classmethod
+    def desactivar(cls) -> None:
+        """Desactiva el registro de métricas"""
+        cls.activo = False
+
+    @classmethod
+    def observar(cls, nombre: str, valor: float, **etiquetas: str) -> None:
+        """
+        Registra un valor en el histograma `nombre`
+
+        Args:
+            nombre: Nombre de la métrica (p.ej. 'db_query_duration_seconds')
+            valor: Valor observado (segundos para latencias)
+            **etiquetas: Etiquetas de la serie (p.ej. statement='_CONTAR')
+        """
+        if not cls.activo:
+            return
+        clave = (nombre, tuple(sorted(etiquetas.items())))
+        with cls._lock:
+            histograma = cls._histogramas.get(clave)
+            if histograma is None:
+                histograma = cls._histogramas[clave] = Histograma()
+            histograma.observar(valor)
+
+    @classmethod
+    def incrementar(cls, nombre: str, cantidad: float = 1, **etiquetas: str) -> None:
+        """
+        Suma `cantidad` al contador `nombre`
+
+        Args:
+            nombre: Nombre de la métrica (p.ej. 'db_commits_total')
+            cantidad: Incremento
+            **etiquetas: Etiquetas de la serie
+        """
+        if not cls.activo:
+            return
+        clave = (nombre, tuple(sorted(etiquetas.items())))
+        with cls._lock:
+            cls._contadores[clave] = cls._contadores.get(clave, 0) + cantidad
+
+    @classmethod
+    def fijar(cls, nombre: str, valor: float, **etiquetas: str) -> None:
+        """
+        Fija el valor actual del medidor `nombre` (p.ej. conexiones en uso)
+
+        Args:
+            nombre: Nombre de la métrica
+            valor: Valor actual
+            **etiquetas: Etiquetas de la serie
+        """
+        if not cls.activo:
+            return
+        clave = (nombre, tuple(sorted(etiquetas.items())))
+        with cls._lock:
+            cls._medidores[clave] = valor
+
+    @classmethod
+    @contextmanager
+    def medir(cls, nombre: str, **etiquetas: str) -> Iterator[None]:
+        """
+        Mide la duración del bloque y la registra en el histograma `nombre`
+
+        Si el bloque lanza una excepción, además incrementa
+        '<nombre sin _duration_seconds>_errors_total' con las mismas etiquetas.
+        """
+        inicio = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            cls.incrementar(cls._nombre_errores(nombre), **etiquetas)
+            raise
+        finally:
+            cls.observar(nombre, time.perf_counter() - inicio, **etiquetas)
+
+    @classmethod
+    def histograma(cls, nombre: str, **etiquetas: str) -> Optional[Histograma]:
+        """Retorna el histograma de una serie o None si no tiene observaciones"""
+        with cls._lock:
+            return cls._histogramas.get((nombre, tuple(sorted(etiquetas.items()))))
+
+    @classmethod
+    def contador(cls, nombre: str, **etiquetas: str) -> float:
+        """Retorna el valor de un contador (0 si no existe)"""
+        with cls._lock:
+            return cls._contadores.get((nombre, tuple(sorted(etiquetas.items()))), 0)
+
+    @classmethod
+    def medidor(cls, nombre: str, **etiquetas: str) -> Optional[float]:
+        """Retorna el valor de un medidor (None si nunca se fijó)"""
+        with cls._lock:
+            return cls._medidores.get((nombre, tuple(sorted(etiquetas.items()))))
+
+    @classmethod
+    def instantanea(cls) -> dict:
+        """
+        Copia legible de todas las métricas
+
+        Returns:
+            dict: {'histogramas': {...}, 'contadores': {...}, 'medidores': {...}}
+            con claves 'nombre{etiquetas}'
+        """
+        with cls._lock:
+            return {
+                'histogramas': {cls._serie(nombre, etiquetas): histograma.a_dict()
+                                for (nombre, etiquetas), histograma in cls._histogramas.items()},
+                'contadores': {cls._serie(nombre, etiquetas): valor
+                               for (nombre, etiquetas), valor in cls._contadores.items()},
+                'medidores': {cls._serie(nombre, etiquetas): valor
+                              for (nombre, etiquetas), valor in cls._medidores.items()},
+            }
+
+    @classmethod
+    def exponer(cls) -> str:
+        """
+        Métricas en formato de texto de Prometheus (versión 0.0.4)
+
+        Returns:
+            str: Una línea por serie/bucket
+        """
+        lineas = []
+        with cls._lock:
+            for tipo, series in (('counter', cls._contadores), ('gauge', cls._medidores)):
+                for nombre in sorted({nombre for nombre, _ in series}):
+                    lineas.append(f'# TYPE {nombre} {tipo}')
+                    for (serie, etiquetas), valor in sorted(series.items()):
+                        if serie == nombre:
+                            lineas.append(f'{cls._serie(nombre, etiquetas)} {valor}')
+
+            for nombre in sorted({nombre for nombre, _ in cls._histogramas}):
+                lineas.append(f'# TYPE {nombre} histogram')
+                for (serie, etiquetas), histograma in sorted(cls._histogramas.items()):
+                    if serie != nombre:
+                        continue
+                    acumulado = 0
+                    for limite, conteo in zip(histograma.limites + (float('inf'),), histograma.conteos):
+                        acumulado += conteo
+                        le = '+Inf' if limite == float('inf') else repr(limite)
+                        lineas.append(f'{cls._serie(nombre + "_bucket", etiquetas + (("le", le),))} {acumulado}')
+                    lineas.append(f'{cls._serie(nombre + "_sum", etiquetas)} {histograma.suma}')
+                    lineas.append(f'{cls._serie(nombre + "_count", etiquetas)} {histograma.total}')
+        return '\n'.join(lineas) + '\n'
+
+    @classmethod
+    def reiniciar(cls) -> None:
+        """Elimina todas las métricas registradas"""
+        with cls._lock:
+            cls._histogramas.clear()
+            cls._contadores.clear()
+            cls._medidores.clear()
+
+    @staticmethod
+    def _nombre_errores(nombre: str) -> str:
+        base = nombre[:-len('_duration_seconds')] if nombre.endswith('_duration_seconds') else nombre
+        return f'{base}_errors_total'
+
+    @staticmethod
+    def _serie(nombre: str, etiquetas: Etiquetas) -> str:
+        if not etiquetas:
+            return nombre
+        texto = ','.join(
+            '{}="{}"'.format(clave, str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for clave, valor in etiquetas
+        )
+        return f'{nombre}{{{texto}}}'
+
+
+class _ManejadorMetricas(BaseHTTPRequestHandler):
+    """Responde GET /metrics con RegistroMetricas.exponer()"""
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        cuerpo = RegistroMetricas.exponer().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, format, *args):
+        # Sin salida por consola en cada scrape
+        pass
+
+
+class ServidorMetricas:
+    """Servidor HTTP en segundo plano que expone /metrics"""
+
+    _servidor: Optional[ThreadingHTTPServer] = None
+
+    @classmethod
+    def iniciar(cls, puerto: int = DatabaseConfig.METRICS_PORT,
+                host: str = DatabaseConfig.METRICS_HOST) -> Optional[Tuple[str, int]]:
+        """
+        Inicia el servidor si no está corriendo
+
+        Args:
+            puerto: Puerto TCP (0 elige uno libre)
+            host: Interfaz donde escuchar (por defecto solo local)
+
+        Returns:
+            (host, puerto) donde escucha o None si no se pudo iniciar
+        """
+        if cls._servidor is None:
+            try:
+                cls._servidor = ThreadingHTTPServer((host, puerto), _ManejadorMetricas)
+            except OSError as e:
+                logger.error('❌ No se pudo iniciar el servidor de métricas: %s', e)
+                return None
+            cls._servidor.daemon_threads = True
+            threading.Thread(target=cls._servidor.serve_forever, name='servidor-metricas',
+                             daemon=True).start()
+            logger.info('📈 Métricas disponibles en http://%s:%s/metrics', *cls._servidor.server_address[:2])
+        return cls._servidor.server_address[:2]
+
+    @classmethod
+    def detener(cls) -> None:
+        """Detiene el servidor si está corriendo"""
+        if cls._servidor is not None:
+            cls._servidor.shutdown()
+            cls._servidor.server_close()
+            cls._servidor = None
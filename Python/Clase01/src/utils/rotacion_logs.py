@@ -0,0 +1,162 @@
+"""
+Rotación de Archivos de Log
+===========================
+
+Handler de archivo que rota por tamaño y por tiempo (por defecto cada
+medianoche). El archivo rotado solo se renombra en el hilo que escribe;
+la compresión gzip y la limpieza por retención se hacen en un hilo de
+fondo para no frenar a quien está registrando.
+
+Los archivos rotados quedan como:
+    usuario_app.log.2025-08-01.gz
+    usuario_app.log.2025-08-01.1.gz   (segunda rotación por tamaño del día)
+"""
+
+import gzip
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from logging.handlers import TimedRotatingFileHandler
+from typing import Callable, Optional
+
+
+class TareasRotacion:
+    """
+    Hilo de fondo único que ejecuta compresiones y limpiezas de logs
+
+    Se inicia con la primera tarea encolada.
+    """
+
+    _cola: 'queue.Queue[Callable[[], None]]' = queue.Queue()
+    _hilo: Optional[threading.Thread] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def encolar(cls, tarea: Callable[[], None]) -> None:
+        """
+        Agrega una tarea para el hilo de fondo
+
+        Args:
+            tarea: Función sin argumentos a ejecutar
+        """
+        with cls._lock:
+            if cls._hilo is None or not cls._hilo.is_alive():
+                cls._hilo = threading.Thread(target=cls._trabajar, name='rotacion-logs', daemon=True)
+                cls._hilo.start()
+        cls._cola.put(tarea)
+
+    @classmethod
+    def esperar(cls, timeout: float = 10.0) -> bool:
+        """
+        Espera a que terminen las tareas pendientes
+
+        Args:
+            timeout: Segundos máximos de espera
+
+        Returns:
+            bool: True si no quedan tareas pendientes
+        """
+        limite = time.monotonic() + timeout
+        while cls._cola.unfinished_tasks and time.monotonic() < limite:
+            time.sleep(0.01)
+        return cls._cola.unfinished_tasks == 0
+
+    @classmethod
+    def _trabajar(cls) -> None:
+        while True:
+            tarea = cls._cola.get()
+            try:
+                tarea()
+            except Exception as e:
+                # No se puede usar el logging aquí: podría volver a rotar
+                print(f"⚠️  Error en tarea de rotación de logs: {e}", file=sys.stderr)
+            finally:
+                cls._cola.task_done()
+
+
+class ArchivoLogRotativo(TimedRotatingFileHandler):
+    """
+    Handler de archivo con rotación por tamaño y tiempo, compresión y retención
+
+    Args:
+        filename: Ruta del archivo de log activo
+        max_bytes: Tamaño que dispara la rotación (0 = sin límite)
+        when: Intervalo de rotación por tiempo ('midnight', 'H', 'D', ...)
+        retencion_archivos: Máximo de archivos rotados a conservar (0 = sin límite)
+        retencion_dias: Días máximos de antigüedad de un archivo rotado (0 = sin límite)
+        comprimir: True para comprimir con gzip cada archivo rotado
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, when: str = 'midnight',
+                 retencion_archivos: int = 0, retencion_dias: int = 0,
+                 comprimir: bool = True, encoding: str = 'utf-8'):
+        # backupCount=0: la retención la aplica este handler en el hilo de fondo
+        super().__init__(filename, when=when, backupCount=0, encoding=encoding)
+        self.max_bytes = max_bytes
+        self.retencion_archivos = retencion_archivos
+        self.retencion_dias = retencion_dias
+        self.comprimir = comprimir
+        self.namer = self._nombre_unico
+        self.rotator = self._rotar
+
+    def shouldRollover(self, record) -> bool:
+        """Rota al cambiar de período o al superar max_bytes"""
+        if super().shouldRollover(record):
+            return True
+        if self.max_bytes > 0 and self.stream is not None:
+            # Sin formatear el registro: se tolera superar el límite por una línea
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def _nombre_unico(self, nombre: str) -> str:
+        """Agrega .1, .2, ... si ya existe una rotación con ese nombre"""
+        candidato, numero = nombre, 1
+        while os.path.exists(candidato) or os.path.exists(candidato + '.gz'):
+            candidato = f'{nombre}.{numero}'
+            numero += 1
+        return candidato
+
+    def _rotar(self, origen: str, destino: str) -> None:
+        """Renombra el archivo activo y delega el resto al hilo de fondo"""
+        if not os.path.exists(origen):
+            return
+        os.rename(origen, destino)
+        if self.comprimir:
+            TareasRotacion.encolar(lambda: self._comprimir(destino))
+        TareasRotacion.encolar(self._aplicar_retencion)
+
+    @staticmethod
+    def _comprimir(ruta: str) -> None:
+        """Comprime `ruta` a `ruta.gz` y elimina el original"""
+        destino = ruta + '.gz'
+        try:
+            with open(ruta, 'rb') as entrada, gzip.open(destino, 'wb') as salida:
+                shutil.copyfileobj(entrada, salida)
+        except Exception:
+            if os.path.exists(destino):
+                os.remove(destino)
+            raise
+        os.remove(ruta)
+
+    def _archivos_rotados(self) -> list:
+        """Archivos rotados de este log, del más nuevo al más viejo"""
+        directorio, base = os.path.split(self.baseFilename)
+        prefijo = base + '.'
+        rutas = [os.path.join(directorio, nombre) for nombre in os.listdir(directorio)
+                 if nombre.startswith(prefijo)]
+        return sorted(rutas, key=os.path.getmtime, reverse=True)
+
+    def _aplicar_retencion(self) -> None:
+        """Elimina los archivos rotados que exceden la cantidad o la antigüedad"""
+        if not self.retencion_archivos and not self.retencion_dias:
+            return
+
+        limite_edad = time.time() - self.retencion_dias * 86400
+        for posicion, ruta in enumerate(self._archivos_rotados()):
+            sobra = self.retencion_archivos and posicion >= self.retencion_archivos
+            vieja = self.retencion_dias and os.path.getmtime(ruta) < limite_edad
+            if sobra or vieja:
+                os.remove(ruta)
@@ -0,0 +1,109 @@
+"""
+Tests para AsyncUsuarioDao
+==========================
+
+Valida que el DAO asíncrono mantiene los contratos de UsuarioDao
+"""
+
+import asyncio
+import unittest
+import sys
+import os
+import time
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.models.usuario import Usuario
+from src.dao.async_usuario_dao import AsyncUsuarioDao
+from psycopg2 import pool
+from src.database.conexion_async import ConexionAsync, PoolConexionesAsync
+
+
+class TestAsyncUsuarioDao(unittest.TestCase):
+    """Tests del DAO asíncrono"""
+
+    def tearDown(self):
+        """Cerrar el pool asíncrono después de cada test"""
+        asyncio.run(ConexionAsync.cerrarConexiones())
+
+    def test_metodos_async_existen(self):
+        """Test: AsyncUsuarioDao expone corrutinas con los mismos nombres"""
+        for metodo in ['seleccionar', 'seleccionar_por_id', 'seleccionar_por_ids', 'insertar',
+                       'actualizar', 'eliminar', 'contar_usuarios']:
+            self.assertTrue(asyncio.iscoroutinefunction(getattr(AsyncUsuarioDao, metodo)))
+
+    def test_usuario_invalido_no_consulta(self):
+        """Test: insertar()/actualizar() rechazan usuarios inválidos con 0"""
+        async def ejecutar():
+            return (await AsyncUsuarioDao.insertar(Usuario(None, "", "x", "x@x.com")),
+                    await AsyncUsuarioDao.actualizar(Usuario(None, "a", "x", "x@x.com")))
+
+        self.assertEqual(asyncio.run(ejecutar()), (0, 0))
+
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_crud_y_consultas_concurrentes(self):
+        """Test: CRUD asíncrono y cien lecturas concurrentes sobre el pool"""
+        timestamp = str(int(time.time() * 1000000))
+        usuario = Usuario(None, f"test_async_{timestamp}", "async123",
+                          f"test_async_{timestamp}@test.com")
+
+        async def ejecutar():
+            self.assertEqual(await AsyncUsuarioDao.insertar(usuario), 1)
+            try:
+                resultados = await asyncio.gather(
+                    *(AsyncUsuarioDao.seleccionar_por_id(usuario.id_usuario) for _ in range(100))
+                )
+                for encontrado in resultados:
+                    self.assertEqual(encontrado, usuario)
+
+                usuario.email = f"updated_async_{timestamp}@test.com"
+                self.assertEqual(await AsyncUsuarioDao.actualizar(usuario), 1)
+                self.assertIsInstance(await AsyncUsuarioDao.seleccionar(), list)
+            finally:
+                self.assertEqual(await AsyncUsuarioDao.eliminar(usuario), 1)
+            self.assertIsNone(await AsyncUsuarioDao.seleccionar_por_id(usuario.id_usuario))
+
+        asyncio.run(ejecutar())
+
+
+class PoolConexionLenta(PoolConexionesAsync):
+    """Pool cuya primera conexión tarda más que el timeout de obtener()"""
+
+    def __init__(self):
+        super().__init__(0, 1, timeout=0.05)
+        self.aperturas = 0
+
+    async def _nueva_conexion(self):
+        self.aperturas += 1
+        if self.aperturas == 1:
+            await asyncio.sleep(10)
+        return ConexionFalsa()
+
+
+class ConexionFalsa:
+    closed = 0
+
+    def close(self):
+        self.closed = 1
+
+
+class TestPoolConexionesAsync(unittest.TestCase):
+    """Tests del pool asíncrono sin base de datos"""
+
+    def test_timeout_libera_el_hueco(self):
+        """Test: Si obtener() agota el tiempo abriendo una conexión el hueco se libera"""
+        async def ejecutar():
+            pool_async = PoolConexionLenta()
+            with self.assertRaises(pool.PoolError):
+                await pool_async.obtener()
+            self.assertEqual(pool_async._total, 0)
+            conexion = await pool_async.obtener()
+            await pool_async.liberar(conexion)
+            return pool_async
+
+        self.assertEqual(asyncio.run(ejecutar()).aperturas, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
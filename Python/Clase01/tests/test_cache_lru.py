@@ -0,0 +1,84 @@
+"""
+Tests unitarios para CacheLRU
+=============================
+
+Valida política LRU, expiración por TTL, invalidación y contadores
+"""
+
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.cache_lru import CacheLRU
+
+
+class RelojFalso:
+    """Reloj controlable para simular el paso del tiempo"""
+
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self) -> float:
+        return self.ahora
+
+
+class TestCacheLRU(unittest.TestCase):
+    """Tests unitarios del cache LRU con TTL"""
+
+    def setUp(self):
+        self.reloj = RelojFalso()
+        self.cache = CacheLRU(max_size=2, ttl=10, reloj=self.reloj)
+
+    def test_guardar_y_obtener(self):
+        """Test: Un valor guardado se obtiene y cuenta como acierto"""
+        self.cache.guardar('a', 1)
+        self.assertEqual(self.cache.obtener('a'), 1)
+        self.assertIsNone(self.cache.obtener('b'))
+
+        stats = self.cache.estadisticas()
+        self.assertEqual(stats['aciertos'], 1)
+        self.assertEqual(stats['fallos'], 1)
+        self.assertEqual(stats['tasa_aciertos'], 0.5)
+
+    def test_desaloja_menos_usado(self):
+        """Test: Al superar max_size se descarta la entrada menos usada"""
+        self.cache.guardar('a', 1)
+        self.cache.guardar('b', 2)
+        self.cache.obtener('a')
+        self.cache.guardar('c', 3)
+
+        self.assertEqual(self.cache.obtener('a'), 1)
+        self.assertIsNone(self.cache.obtener('b'))
+        self.assertEqual(self.cache.estadisticas()['desalojados'], 1)
+
+    def test_expiracion_ttl(self):
+        """Test: Las entradas expiran tras ttl segundos"""
+        self.cache.guardar('a', 1)
+        self.reloj.ahora = 9.9
+        self.assertEqual(self.cache.obtener('a'), 1)
+        self.reloj.ahora = 10.0
+        self.assertIsNone(self.cache.obtener('a'))
+        self.assertEqual(self.cache.estadisticas()['expirados'], 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_invalidar_y_limpiar(self):
+        """Test: invalidar() y limpiar() eliminan entradas"""
+        self.cache.guardar('a', 1)
+        self.cache.guardar('b', 2)
+        self.cache.invalidar('a', 'inexistente')
+        self.assertIsNone(self.cache.obtener('a'))
+        self.cache.limpiar()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.estadisticas()['invalidaciones'], 2)
+
+    def test_none_no_se_almacena(self):
+        """Test: None no se guarda (significa 'no encontrado')"""
+        self.cache.guardar('a', None)
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
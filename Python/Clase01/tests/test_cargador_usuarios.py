@@ -0,0 +1,136 @@
+"""
+Tests para CargadorUsuarios
+===========================
+
+Valida que las búsquedas por ID del mismo ciclo del event loop se
+agrupan en un solo lote (sin base de datos: el lote es una corrutina falsa)
+"""
+
+import asyncio
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from psycopg2 import OperationalError
+from src.models.usuario import Usuario
+from src.dao.cargador_usuarios import CargadorUsuarios
+from src.database.conexion_async import ConexionAsync
+
+
+class CargaFalsa:
+    """Registra cada lote pedido y retorna usuarios para los IDs pares"""
+
+    def __init__(self, error: Exception = None):
+        self.lotes = []
+        self.error = error
+
+    async def __call__(self, ids):
+        self.lotes.append(sorted(ids))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return {i: Usuario(i, f'usuario_{i}', 'x', f'u{i}@test.com') for i in ids if i % 2 == 0}
+
+
+class TestCargadorUsuarios(unittest.TestCase):
+    """Tests del agrupamiento por lotes"""
+
+    def test_mismo_ciclo_una_consulta(self):
+        """Test: cargar() concurrentes del mismo ciclo se resuelven con un lote"""
+        carga = CargaFalsa()
+
+        async def ejecutar():
+            cargador = CargadorUsuarios(carga)
+            return await asyncio.gather(*(cargador.cargar(i) for i in [4, 2, 3, 2]))
+
+        usuarios = asyncio.run(ejecutar())
+
+        self.assertEqual(carga.lotes, [[2, 3, 4]])
+        self.assertEqual([u.id_usuario if u else None for u in usuarios], [4, 2, None, 2])
+
+    def test_ciclos_distintos_y_memoria(self):
+        """Test: un ciclo posterior lanza otro lote solo con los IDs nuevos"""
+        carga = CargaFalsa()
+
+        async def ejecutar():
+            cargador = CargadorUsuarios(carga)
+            await cargador.cargar(2)
+            varios = await cargador.cargar_varios([2, 4, 5])
+            cargador.limpiar(2)
+            await cargador.cargar(2)
+            return varios
+
+        varios = asyncio.run(ejecutar())
+
+        self.assertEqual(carga.lotes, [[2], [4, 5], [2]])
+        self.assertEqual(sorted(varios), [2, 4])
+
+    def test_sin_memoria(self):
+        """Test: memorizar=False vuelve a consultar en cada ciclo"""
+        carga = CargaFalsa()
+
+        async def ejecutar():
+            cargador = CargadorUsuarios(carga, memorizar=False)
+            await cargador.cargar(2)
+            await cargador.cargar(2)
+
+        asyncio.run(ejecutar())
+        self.assertEqual(carga.lotes, [[2], [2]])
+
+    def test_error_no_queda_memorizado(self):
+        """Test: un lote que falla propaga el error y el siguiente cargar() reintenta"""
+        carga = CargaFalsa(error=RuntimeError('sin conexión'))
+
+        async def ejecutar():
+            cargador = CargadorUsuarios(carga)
+            with self.assertRaises(RuntimeError):
+                await cargador.cargar(2)
+            carga.error = None
+            return await cargador.cargar(2)
+
+        usuario = asyncio.run(ejecutar())
+        self.assertEqual(usuario.id_usuario, 2)
+        self.assertEqual(carga.lotes, [[2], [2]])
+
+    def test_cancelar_un_llamador(self):
+        """Test: cancelar un cargar() no afecta a otro que espera el mismo ID"""
+        carga = CargaFalsa()
+
+        async def ejecutar():
+            cargador = CargadorUsuarios(carga)
+            primero = asyncio.ensure_future(cargador.cargar(2))
+            segundo = asyncio.ensure_future(cargador.cargar(2))
+            await asyncio.sleep(0)
+            primero.cancel()
+            return await segundo
+
+        self.assertEqual(asyncio.run(ejecutar()).id_usuario, 2)
+
+    def test_dao_por_defecto_no_memoriza_fallos(self):
+        """Test: Con el DAO por defecto un fallo de la BD llega al llamador y no queda como 'no existe'"""
+        original = ConexionAsync.__dict__['obtenerConexion']
+        pedidos = []
+
+        async def sin_conexion():
+            pedidos.append(1)
+            return None
+
+        async def ejecutar():
+            cargador = CargadorUsuarios()
+            for _ in range(2):
+                with self.assertRaises(OperationalError):
+                    await cargador.cargar(1)
+
+        ConexionAsync.obtenerConexion = sin_conexion
+        try:
+            asyncio.run(ejecutar())
+        finally:
+            ConexionAsync.obtenerConexion = original
+        self.assertEqual(len(pedidos), 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,152 @@
+"""
+Tests unitarios para ConsultasLentas
+====================================
+
+Valida el ocultamiento de parámetros sensibles y el registro de
+sentencias que superan el umbral (sin capturar plan: no requiere BD)
+"""
+
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database.consultas_lentas import ConsultasLentas, redactar_parametros, OCULTO
+from src.dao.usuario_dao import UsuarioDao
+from src.database.conexion import Conexion
+
+
+class TestRedactarParametros(unittest.TestCase):
+    """Tests del ocultamiento de parámetros"""
+
+    def test_insertar(self):
+        """Test: En INSERT se oculta la columna password por posición"""
+        params = redactar_parametros(UsuarioDao._INSERTAR, ('ana', 'secreta', 'ana@test.com'))
+        self.assertEqual(params, ('ana', OCULTO, 'ana@test.com'))
+
+    def test_actualizar(self):
+        """Test: En UPDATE se oculta el valor asignado a password"""
+        params = redactar_parametros(UsuarioDao._ACTUALIZAR, ('ana', 'anterior', 'secreta', 'ana@test.com', 7))
+        self.assertEqual(params, ('ana', OCULTO, OCULTO, 'ana@test.com', 7))
+
+    def test_lote(self):
+        """Test: En lotes se oculta la password de cada fila"""
+        filas = [('ana', 's1', 'a@test.com'), ('luis', 's2', 'l@test.com')]
+        params = redactar_parametros(UsuarioDao._UPSERT_LOTE, filas)
+        self.assertEqual([fila[1] for fila in params], [OCULTO, OCULTO])
+        self.assertEqual(params[1][0], 'luis')
+
+    def test_sin_datos_sensibles(self):
+        """Test: Las sentencias sin columnas sensibles no se modifican"""
+        self.assertEqual(redactar_parametros(UsuarioDao._ELIMINAR, (3,)), (3,))
+        self.assertEqual(redactar_parametros(UsuarioDao._SELECCIONAR_POR_ID, (3,)), (3,))
+        self.assertIsNone(redactar_parametros(UsuarioDao._CONTAR, None))
+
+    def test_columna_desconocida_con_password(self):
+        """Test: Un parámetro sin columna asociada se oculta si la sentencia usa password"""
+        sql = "SELECT id FROM usuario WHERE password IN (%s)"
+        self.assertEqual(redactar_parametros(sql, ('secreta',)), (OCULTO,))
+
+
+class TestConsultasLentas(unittest.TestCase):
+    """Tests del registro de consultas lentas"""
+
+    def setUp(self):
+        self.umbral, self.explicar = ConsultasLentas.umbral, ConsultasLentas.explicar
+        ConsultasLentas.configurar(umbral_ms=100, explicar=False)
+
+    def tearDown(self):
+        ConsultasLentas.umbral, ConsultasLentas.explicar = self.umbral, self.explicar
+
+    def test_bajo_umbral_no_registra(self):
+        """Test: Una sentencia rápida no escribe nada"""
+        with self.assertNoLogs('usuario_app.consultas_lentas'):
+            ConsultasLentas.verificar('_CONTAR', UsuarioDao._CONTAR, None, 0.05)
+            ConsultasLentas.esperar()
+
+    def test_sobre_umbral_registra_sin_password(self):
+        """Test: Una sentencia lenta se escribe con duración y password oculta"""
+        with self.assertLogs('usuario_app.consultas_lentas', level='WARNING') as registros:
+            ConsultasLentas.verificar('_INSERTAR', UsuarioDao._INSERTAR,
+                                      ('ana', 'secreta', 'ana@test.com'), 0.25)
+            self.assertTrue(ConsultasLentas.esperar())
+
+        mensaje = registros.output[0]
+        self.assertIn('_INSERTAR tardó 250.0 ms', mensaje)
+        self.assertIn(OCULTO, mensaje)
+        self.assertNotIn('secreta', mensaje)
+
+    def test_umbral_cero_desactiva(self):
+        """Test: Con umbral 0 no se registra ninguna sentencia"""
+        ConsultasLentas.configurar(umbral_ms=0)
+        with self.assertNoLogs('usuario_app.consultas_lentas'):
+            ConsultasLentas.verificar('_SELECCIONAR', UsuarioDao._SELECCIONAR, None, 10)
+            ConsultasLentas.esperar()
+
+
+class CursorPlan:
+    def __init__(self, ejecutadas):
+        self.ejecutadas = ejecutadas
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.ejecutadas.append(sql)
+
+    def fetchall(self):
+        return [('Seq Scan on usuario',)]
+
+
+class ConexionPlan:
+    def __init__(self, origen):
+        self.origen = origen
+        self.ejecutadas = []
+
+    def cursor(self):
+        return CursorPlan(self.ejecutadas)
+
+    def rollback(self):
+        pass
+
+
+class TestCapturaPlan(unittest.TestCase):
+    """Tests de ConsultasLentas._capturar_plan() con conexiones falsas"""
+
+    def setUp(self):
+        self.metodos = {nombre: Conexion.__dict__[nombre] for nombre in
+                        ('obtenerConexion', 'obtenerConexionLectura', 'liberarConexion')}
+        self.conexiones = []
+
+        def obtener(origen):
+            def obtener_conexion():
+                self.conexiones.append(ConexionPlan(origen))
+                return self.conexiones[-1]
+            return obtener_conexion
+
+        Conexion.obtenerConexion = obtener('primario')
+        Conexion.obtenerConexionLectura = obtener('lectura')
+        Conexion.liberarConexion = lambda conexion: None
+
+    def tearDown(self):
+        for nombre, metodo in self.metodos.items():
+            setattr(Conexion, nombre, metodo)
+
+    def test_explain_sin_analyze(self):
+        """Test: El plan se obtiene sin volver a ejecutar la consulta, y los SELECT en una conexión de lectura"""
+        self.assertEqual(ConsultasLentas._capturar_plan(UsuarioDao._SELECCIONAR, None), 'Seq Scan on usuario')
+        ConsultasLentas._capturar_plan(UsuarioDao._ELIMINAR, (1,))
+
+        self.assertEqual([conexion.origen for conexion in self.conexiones], ['lectura', 'primario'])
+        for conexion in self.conexiones:
+            self.assertTrue(conexion.ejecutadas[0].startswith('EXPLAIN '))
+            self.assertNotIn('ANALYZE', conexion.ejecutadas[0])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+"""
+Tests unitarios para Contrasenas
+================================
+
+Valida el formato, la verificación y el rehash de los hashes de
+contraseñas (con costos bajos para que los tests sean rápidos)
+"""
+
+import time
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.contrasenas import Contrasenas
+
+
+class TestContrasenas(unittest.TestCase):
+    """Tests de hash y verificación de contraseñas"""
+
+    def setUp(self):
+        self._algoritmo = Contrasenas.algoritmo
+        self._parametros = Contrasenas.parametros
+        Contrasenas.configurar('scrypt', n=1024, r=8, p=1)
+        Contrasenas.configurar('pbkdf2_sha256', i=1000)
+        Contrasenas.configurar('scrypt')
+
+    def tearDown(self):
+        Contrasenas.algoritmo = self._algoritmo
+        Contrasenas.parametros = self._parametros
+        Contrasenas.configurar()
+
+    def test_hashear_y_verificar(self):
+        """Test: el hash guarda algoritmo y parámetros y verifica la contraseña"""
+        for algoritmo, prefijo in (('scrypt', 'scrypt$n=1024,r=8,p=1$'), ('pbkdf2_sha256', 'pbkdf2_sha256$i=1000$')):
+            Contrasenas.configurar(algoritmo)
+            almacenado = Contrasenas.hashear('clave123')
+            self.assertTrue(almacenado.startswith(prefijo))
+            self.assertTrue(Contrasenas.es_hash(almacenado))
+            self.assertTrue(Contrasenas.verificar('clave123', almacenado))
+            self.assertFalse(Contrasenas.verificar('clave124', almacenado))
+
+    def test_sal_distinta_por_hash(self):
+        """Test: la misma contraseña produce hashes distintos"""
+        self.assertNotEqual(Contrasenas.hashear('clave123'), Contrasenas.hashear('clave123'))
+
+    def test_verifica_con_parametros_guardados(self):
+        """Test: un cambio de costo no invalida hashes anteriores, pero pide rehash"""
+        almacenado = Contrasenas.hashear('clave123')
+        Contrasenas.configurar(n=2048)
+
+        self.assertTrue(Contrasenas.verificar('clave123', almacenado))
+        self.assertTrue(Contrasenas.necesita_rehash(almacenado))
+        self.assertFalse(Contrasenas.necesita_rehash(Contrasenas.hashear('clave123')))
+
+    def test_texto_plano_heredado(self):
+        """Test: un valor sin formato de hash se compara como texto plano y pide rehash"""
+        self.assertFalse(Contrasenas.es_hash('admin123'))
+        self.assertTrue(Contrasenas.verificar('admin123', 'admin123'))
+        self.assertFalse(Contrasenas.verificar('admin124', 'admin123'))
+        self.assertTrue(Contrasenas.necesita_rehash('admin123'))
+
+    def test_rechaza_costos_desmedidos(self):
+        """Test: un hash guardado con costo fuera de los topes no se calcula"""
+        sal_y_hash = Contrasenas.hashear('clave123').split('$', 2)[2]
+        for parametros in ('scrypt$n=1073741824,r=8,p=1', 'scrypt$n=1024,r=8,p=1000',
+                           'pbkdf2_sha256$i=900000000', 'scrypt$n=1024'):
+            with self.subTest(parametros=parametros):
+                inicio = time.perf_counter()
+                self.assertFalse(Contrasenas.verificar('clave123', f'{parametros}${sal_y_hash}'))
+                self.assertLess(time.perf_counter() - inicio, 1.0)
+        with self.assertRaises(ValueError):
+            Contrasenas.configurar(n=2 ** 30)
+        with self.assertRaises(ValueError):
+            Contrasenas.configurar('pbkdf2_sha256', i=10 ** 9)
+
+    def test_usuario_inexistente(self):
+        """Test: sin valor almacenado la verificación falla"""
+        self.assertFalse(Contrasenas.verificar('clave123', None))
+
+    def test_hashear_lote(self):
+        """Test: hashear_lote() conserva el orden de entrada"""
+        passwords = [f'clave_{i}' for i in range(8)]
+        hashes = Contrasenas.hashear_lote(passwords)
+
+        self.assertEqual(len(hashes), len(passwords))
+        for password, almacenado in zip(passwords, hashes):
+            self.assertTrue(Contrasenas.verificar(password, almacenado))
+
+    def test_algoritmo_desconocido(self):
+        """Test: configurar() rechaza algoritmos desconocidos"""
+        with self.assertRaises(ValueError):
+            Contrasenas.configurar('md5')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
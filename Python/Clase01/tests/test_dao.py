@@ -15,6 +15,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.models.usuario import Usuario
 from src.dao.usuario_dao import UsuarioDao
+from src.utils.contrasenas import Contrasenas
 from src.database.conexion import Conexion
 
 class TestUsuarioDao(unittest.TestCase):
@@ -153,6 +154,28 @@ class TestUsuarioDao(unittest.TestCase):
         self.assertEqual(usuario_actualizado.username, f"updated_{timestamp}")
         self.assertEqual(usuario_actualizado.email, f"updated_{timestamp}@test.com")
     
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_actualizar_username_duplicado(self):
+        """Test: actualizar() a un username en uso retorna 0 sin modificar nada"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        timestamp = str(int(time.time() * 1000000))
+        usuario1 = Usuario(None, f"test_upd_dup1_{timestamp}", "pass1", f"upd_dup1_{timestamp}@test.com")
+        usuario2 = Usuario(None, f"test_upd_dup2_{timestamp}", "pass2", f"upd_dup2_{timestamp}@test.com")
+        self.usuarios_test.extend([usuario1, usuario2])
+        UsuarioDao.insertar(usuario1)
+        UsuarioDao.insertar(usuario2)
+        
+        # Mismo username que usuario1: lo rechaza la restricción UNIQUE
+        conflicto = Usuario(usuario2.id_usuario, usuario1.username, "pass2", usuario2.email)
+        self.assertEqual(UsuarioDao.actualizar(conflicto), 0)
+        self.assertEqual(UsuarioDao.seleccionar_por_id(usuario2.id_usuario).username, usuario2.username)
+        
+        # Conservar su propio username no es un conflicto
+        usuario2.password = "nueva"
+        self.assertEqual(UsuarioDao.actualizar(usuario2), 1)
+    
     @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
     def test_eliminar_usuario_existente(self):
         """Test: eliminar() según UML retorna 1 en éxito"""
@@ -258,6 +281,249 @@ class TestUsuarioDao(unittest.TestCase):
         
         self.assertEqual(count_despues, count_inicial + 1)
     
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_insertar_lote(self):
+        """Test: insertar_lote() retorna IDs en orden y omite duplicados"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        timestamp = str(int(time.time() * 1000000))
+        usuarios = [
+            Usuario(None, f"test_lote_{i}_{timestamp}", "lote123", f"lote_{i}_{timestamp}@test.com")
+            for i in range(5)
+        ]
+        duplicado = Usuario(None, usuarios[2].username, "otro", "otro@test.com")
+        self.usuarios_test.extend(usuarios)
+        
+        ids = UsuarioDao.insertar_lote(usuarios + [duplicado], tamano_lote=2)
+        
+        self.assertEqual(len(ids), 6)
+        self.assertIsNone(ids[5], "Username repetido debe omitirse")
+        for usuario, id_usuario in zip(usuarios, ids):
+            self.assertIsNotNone(id_usuario)
+            self.assertEqual(usuario.id_usuario, id_usuario)
+            self.assertEqual(UsuarioDao.seleccionar_por_id(id_usuario).username, usuario.username)
+    
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_upsert_lote(self):
+        """Test: upsert_lote() actualiza existentes y retorna sus IDs"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        timestamp = str(int(time.time() * 1000000))
+        existente = Usuario(None, f"test_upsert_{timestamp}", "viejo", f"viejo_{timestamp}@test.com")
+        nuevo = Usuario(None, f"test_upsert_n_{timestamp}", "nuevo", f"nuevo_{timestamp}@test.com")
+        self.usuarios_test.extend([existente, nuevo])
+        UsuarioDao.insertar(existente)
+        
+        cambio = Usuario(None, existente.username, "cambiado", f"cambiado_{timestamp}@test.com")
+        ids = UsuarioDao.upsert_lote([cambio, nuevo])
+        
+        self.assertEqual(ids[0], existente.id_usuario)
+        self.assertIsNotNone(ids[1])
+        self.assertEqual(UsuarioDao.seleccionar_por_id(ids[0]).email, f"cambiado_{timestamp}@test.com")
+    
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_seleccionar_stream_y_paginas(self):
+        """Test: stream y paginación keyset retornan lo mismo que seleccionar()"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        timestamp = str(int(time.time() * 1000000))
+        usuarios = [
+            Usuario(None, f"test_stream_{i}_{timestamp}", "stream123", f"stream_{i}_{timestamp}@test.com")
+            for i in range(3)
+        ]
+        self.usuarios_test.extend(usuarios)
+        UsuarioDao.insertar_lote(usuarios)
+        
+        ids_esperados = [u.id_usuario for u in UsuarioDao.seleccionar()]
+        
+        ids_stream = [u.id_usuario for u in UsuarioDao.seleccionar_stream(itersize=2)]
+        self.assertEqual(ids_stream, ids_esperados)
+        
+        ids_paginas = []
+        pagina = UsuarioDao.seleccionar_pagina(limit=2)
+        while pagina:
+            self.assertLessEqual(len(pagina), 2)
+            ids_paginas.extend(u.id_usuario for u in pagina)
+            pagina = UsuarioDao.seleccionar_pagina(after_id=pagina[-1].id_usuario, limit=2)
+        self.assertEqual(ids_paginas, ids_esperados)
+    
+    def test_stream_sin_bd_no_falla(self):
+        """Test: seleccionar_stream() es un iterador que no lanza excepciones"""
+        for usuario in UsuarioDao.seleccionar_stream():
+            self.assertIsInstance(usuario, Usuario)
+    
+    def test_lote_vacio_e_invalidos(self):
+        """Test: Lotes vacíos o inválidos no consultan la BD"""
+        self.assertEqual(UsuarioDao.insertar_lote([]), [])
+        self.assertEqual(UsuarioDao.upsert_lote([Usuario(None, "", "x", "x@x.com")]), [None])
+    
+    def test_cache_seleccionar_por_id(self):
+        """Test: seleccionar_por_id() sirve desde el cache una copia del usuario"""
+        UsuarioDao.configurar_cache(max_size=10, ttl=60)
+        try:
+            cacheado = Usuario(424242, "cacheado", "pass", "cacheado@test.com")
+            UsuarioDao._cache.guardar(('usuario', 424242), cacheado.to_dict())
+            
+            encontrado = UsuarioDao.seleccionar_por_id(424242)
+            self.assertEqual(encontrado.username, "cacheado")
+            self.assertIsNot(encontrado, UsuarioDao.seleccionar_por_id(424242))
+            self.assertEqual(UsuarioDao.estadisticas_cache()['aciertos'], 2)
+            
+            UsuarioDao._invalidar_cache(424242)
+            self.assertIsNone(UsuarioDao._obtener_de_cache(424242))
+        finally:
+            UsuarioDao.desactivar_cache()
+        
+        self.assertEqual(UsuarioDao.estadisticas_cache(), {'activo': False})
+    
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_cache_invalidado_al_escribir(self):
+        """Test: actualizar() y eliminar() invalidan el cache"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        UsuarioDao.configurar_cache(max_size=10, ttl=60)
+        try:
+            timestamp = str(int(time.time() * 1000000))
+            usuario = Usuario(None, f"test_cache_{timestamp}", "cache123", f"cache_{timestamp}@test.com")
+            self.usuarios_test.append(usuario)
+            UsuarioDao.insertar(usuario)
+            
+            UsuarioDao.seleccionar_por_id(usuario.id_usuario)
+            usuario.email = f"cache_nuevo_{timestamp}@test.com"
+            UsuarioDao.actualizar(usuario)
+            self.assertEqual(UsuarioDao.seleccionar_por_id(usuario.id_usuario).email, usuario.email)
+            
+            total = UsuarioDao.contar_usuarios()
+            UsuarioDao.eliminar(usuario)
+            self.assertIsNone(UsuarioDao.seleccionar_por_id(usuario.id_usuario))
+            self.assertEqual(UsuarioDao.contar_usuarios(), total - 1)
+        finally:
+            UsuarioDao.desactivar_cache()
+    
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_contar_usuarios_estrategias(self):
+        """Test: 'contador' coincide con COUNT(*) y 'estimado' no es negativo"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        total = UsuarioDao.contar_usuarios('exacto')
+        timestamp = str(int(time.time() * 1000000))
+        usuario = Usuario(None, f"test_conteo_{timestamp}", "conteo123", f"conteo_{timestamp}@test.com")
+        self.usuarios_test.append(usuario)
+        UsuarioDao.insertar(usuario)
+        
+        self.assertEqual(UsuarioDao.contar_usuarios('exacto'), total + 1)
+        self.assertEqual(UsuarioDao.contar_usuarios('contador'), total + 1)
+        self.assertGreaterEqual(UsuarioDao.contar_usuarios('estimado'), 0)
+        
+        UsuarioDao.eliminar(usuario)
+        self.assertEqual(UsuarioDao.contar_usuarios('contador'), total)
+    
+    def test_contar_usuarios_estrategia_desconocida(self):
+        """Test: Una estrategia de conteo inválida retorna 0 sin consultar la BD"""
+        self.assertEqual(UsuarioDao.contar_usuarios('aproximado'), 0)
+    
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_buscar(self):
+        """Test: buscar() por prefijo de username, por email sin mayúsculas y por ambos"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        timestamp = str(int(time.time() * 1000000))
+        usuarios = [
+            Usuario(None, f"test_buscar_{timestamp}_b", "pass1", f"buscar_b_{timestamp}@test.com"),
+            Usuario(None, f"test_buscar_{timestamp}_a", "pass2", f"Buscar_A_{timestamp}@test.com"),
+            Usuario(None, f"test_buscarx{timestamp}", "pass3", f"buscar_x_{timestamp}@test.com"),
+        ]
+        for usuario in usuarios:
+            self.usuarios_test.append(usuario)
+            UsuarioDao.insertar(usuario)
+        
+        # '_' del prefijo es literal: no encuentra 'test_buscarx...'
+        encontrados = UsuarioDao.buscar(username_prefix=f"test_buscar_{timestamp}_")
+        self.assertEqual([u.username for u in encontrados], [usuarios[1].username, usuarios[0].username])
+        self.assertEqual(len(UsuarioDao.buscar(username_prefix=f"test_buscar_{timestamp}_", limit=1)), 1)
+        
+        por_email = UsuarioDao.buscar(email=f"buscar_a_{timestamp}@TEST.com")
+        self.assertEqual([u.id_usuario for u in por_email], [usuarios[1].id_usuario])
+        self.assertEqual(UsuarioDao.buscar(username_prefix="otro_", email=usuarios[1].email), [])
+    
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_autenticar_guarda_hash(self):
+        """Test: insertar() guarda un hash y autenticar() lo verifica"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        timestamp = str(int(time.time() * 1000000))
+        usuario = Usuario(None, f"test_auth_{timestamp}", "clave123", f"test_auth_{timestamp}@test.com")
+        self.usuarios_test.append(usuario)
+        
+        self.assertEqual(UsuarioDao.insertar(usuario), 1)
+        guardado = UsuarioDao.seleccionar_por_id(usuario.id_usuario)
+        self.assertNotEqual(guardado.password, "clave123")
+        self.assertTrue(guardado.password.startswith(("scrypt$", "pbkdf2_sha256$")))
+        
+        self.assertIsNotNone(UsuarioDao.autenticar(usuario.username, "clave123"))
+        self.assertIsNone(UsuarioDao.autenticar(usuario.username, "otra"))
+        self.assertIsNone(UsuarioDao.autenticar(f"no_existe_{timestamp}", "clave123"))
+    
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_seleccionar_por_ids(self):
+        """Test: seleccionar_por_ids() retorna un dict por ID con bloques pequeños"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        timestamp = str(int(time.time() * 1000000))
+        usuarios = [Usuario(None, f"test_ids_{i}_{timestamp}", "ids123", f"test_ids_{i}_{timestamp}@test.com")
+                    for i in range(5)]
+        self.usuarios_test.extend(usuarios)
+        UsuarioDao.insertar_lote(usuarios)
+        
+        ids = [u.id_usuario for u in usuarios]
+        encontrados = UsuarioDao.seleccionar_por_ids(ids + ids[:2] + [-1], tamano_lote=2)
+        
+        self.assertEqual(sorted(encontrados), sorted(ids))
+        for usuario in usuarios:
+            self.assertEqual(encontrados[usuario.id_usuario].username, usuario.username)
+    
+    def test_seleccionar_por_ids_vacio(self):
+        """Test: seleccionar_por_ids() sin IDs no consulta y retorna dict vacío"""
+        self.assertEqual(UsuarioDao.seleccionar_por_ids([]), {})
+    
+    @unittest.skipUnless(os.getenv('TEST_DB', False), "Requiere base de datos")
+    def test_actualizar_no_acepta_hashes_ajenos(self):
+        """Test: actualizar() conserva la contraseña guardada y hashea cualquier otro valor"""
+        if not self.db_disponible:
+            self.skipTest("Base de datos no disponible")
+        
+        timestamp = str(int(time.time() * 1000000))
+        usuario = Usuario(None, f"test_rehash_{timestamp}", "clave123", f"test_rehash_{timestamp}@test.com")
+        self.usuarios_test.append(usuario)
+        self.assertEqual(UsuarioDao.insertar(usuario), 1)
+        
+        # Sin cambios: se envía el hash leído y la contraseña sigue valiendo
+        guardado = UsuarioDao.seleccionar_por_id(usuario.id_usuario)
+        guardado.email = f"test_rehash_2_{timestamp}@test.com"
+        self.assertEqual(UsuarioDao.actualizar(guardado), 1)
+        self.assertIsNotNone(UsuarioDao.autenticar(usuario.username, "clave123"))
+        
+        # Un hash con formato válido que no es el guardado se trata como texto plano
+        ajeno = Contrasenas.hashear("otra")
+        guardado.password = ajeno
+        self.assertEqual(UsuarioDao.actualizar(guardado), 1)
+        self.assertNotEqual(guardado.password, ajeno)
+        self.assertIsNotNone(UsuarioDao.autenticar(usuario.username, ajeno))
+        self.assertIsNone(UsuarioDao.autenticar(usuario.username, "otra"))
+    
+    def test_buscar_sin_criterios(self):
+        """Test: buscar() sin criterios retorna lista vacía y escapa comodines del prefijo"""
+        self.assertEqual(UsuarioDao.buscar(), [])
+        self.assertEqual(UsuarioDao._patron_prefijo('a_b%'), 'a\\_b\\%%')
+    
     def test_manejo_excepciones_sin_bd(self):
         """Test: Métodos manejan ausencia de BD sin fallar"""
         # Simular que no hay BD disponible - los métodos deben retornar valores por defecto
@@ -275,6 +541,7 @@ class TestUsuarioDao(unittest.TestCase):
         count = UsuarioDao.contar_usuarios()
         self.assertEqual(count, 0)
 
+
 if __name__ == "__main__":
     print("🧪 TESTS DE INTEGRACIÓN - USUARIO DAO")
     print("=" * 45)
@@ -0,0 +1,45 @@
+"""
+Tests unitarios para scripts/exportar_usuarios.py
+=================================================
+
+Valida la sentencia COPY (sin password por defecto) y el conteo de filas
+a medida que COPY escribe bloques (no requiere base de datos)
+"""
+
+import io
+import unittest
+import sys
+import os
+
+# Agregar scripts al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from exportar_usuarios import COLUMNAS, DestinoConProgreso, Progreso, sentencia_copy
+
+
+class TestExportarUsuarios(unittest.TestCase):
+    """Tests de la exportación con COPY"""
+
+    def test_password_excluida_por_defecto(self):
+        """Test: Las columnas por defecto no incluyen password"""
+        sql = sentencia_copy(COLUMNAS)
+        self.assertNotIn('password', sql)
+        self.assertTrue(sql.startswith('COPY (SELECT id_usuario, username, email FROM usuario'))
+        self.assertIn('TO STDOUT WITH (FORMAT csv, HEADER true)', sql)
+
+    def test_conteo_por_bloques(self):
+        """Test: Se cuentan filas sin el encabezado aunque los bloques corten filas"""
+        archivo = io.BytesIO()
+        progreso = Progreso(cada=1000)
+        destino = DestinoConProgreso(archivo, progreso)
+        contenido = b'id_usuario,username,email\n1,ana,a@test.com\n2,luis,l@test.com\n'
+        for inicio in range(0, len(contenido), 7):
+            destino.write(contenido[inicio:inicio + 7])
+
+        self.assertEqual(archivo.getvalue(), contenido)
+        self.assertEqual(progreso.filas, 2)
+        self.assertEqual(progreso.bytes, len(contenido))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,82 @@
+"""
+Tests unitarios para FormateadorJSON
+====================================
+
+Valida que cada registro produzca una línea JSON válida con los campos
+de evento del DAO
+"""
+
+import json
+import logging
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils import formato_json
+from src.utils.formato_json import FormateadorJSON, evento
+
+
+def _registro(mensaje: str, args=None, nivel: int = logging.INFO, extra=None, exc_info=None):
+    registro = logging.LogRecord('usuario_app.dao', nivel, __file__, 10, mensaje, args, exc_info,
+                                 func='insertar')
+    for clave, valor in (extra or {}).items():
+        setattr(registro, clave, valor)
+    return registro
+
+
+class TestFormatoJSON(unittest.TestCase):
+    """Tests del formato estructurado"""
+
+    def setUp(self):
+        self.formateador = FormateadorJSON()
+
+    def test_campos_basicos_y_evento(self):
+        """Test: Se incluyen timestamp, nivel, función, mensaje y campos de evento"""
+        extra = {'operation': 'insertar', 'duration_ms': 1.5, 'rows': 1}
+        datos = json.loads(self.formateador.format(_registro('ID: %s', (7,), extra=extra)))
+
+        self.assertEqual(datos['level'], 'INFO')
+        self.assertEqual(datos['funcName'], 'insertar')
+        self.assertEqual(datos['message'], 'ID: 7')
+        self.assertEqual(datos['operation'], 'insertar')
+        self.assertEqual(datos['rows'], 1)
+        self.assertIn('timestamp', datos)
+
+    def test_mensaje_con_caracteres_especiales(self):
+        """Test: Comillas, saltos de línea y emojis quedan escapados en una sola línea"""
+        linea = self.formateador.format(_registro('❌ "usuario"\nsegunda línea'))
+        self.assertNotIn('\n', linea)
+        self.assertEqual(json.loads(linea)['message'], '❌ "usuario"\nsegunda línea')
+
+    def test_excepcion(self):
+        """Test: La traza de la excepción se incluye como campo"""
+        try:
+            raise ValueError('fallo')
+        except ValueError:
+            registro = _registro('error', nivel=logging.ERROR, exc_info=sys.exc_info())
+        datos = json.loads(self.formateador.format(registro))
+        self.assertIn('ValueError: fallo', datos['exception'])
+
+    def test_serializador_estandar(self):
+        """Test: Sin orjson se usa el JSONEncoder de la biblioteca estándar"""
+        original = formato_json.orjson
+        formato_json.orjson = None
+        try:
+            linea = formato_json.serializar({'a': 'ñ', 'b': object})
+        finally:
+            formato_json.orjson = original
+        self.assertEqual(json.loads(linea)['a'], 'ñ')
+
+    def test_evento(self):
+        """Test: evento() solo incluye los campos indicados"""
+        self.assertEqual(evento('contar'), {'operation': 'contar'})
+        campos = evento('seleccionar', inicio=0.0, filas=3)
+        self.assertEqual(campos['rows'], 3)
+        self.assertGreaterEqual(campos['duration_ms'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,134 @@
+"""
+Tests unitarios para el logging asíncrono
+=========================================
+
+Valida la política de cola llena y el vaciado al detener el listener, y
+que importar los módulos no configure handlers ni inicie el hilo de la cola
+"""
+
+import logging
+import queue
+import subprocess
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.logging_async import (ColaLogsHandler, crear_logging_async,
+                                     detener_logging_async)
+
+
+class HandlerMemoria(logging.Handler):
+    """Handler que guarda los mensajes recibidos"""
+
+    def __init__(self):
+        super().__init__()
+        self.mensajes = []
+
+    def emit(self, record):
+        self.mensajes.append(record.getMessage())
+
+
+def _registro(mensaje: str, nivel: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord('test', nivel, __file__, 1, mensaje, None, None)
+
+
+class TestLoggingAsync(unittest.TestCase):
+    """Tests de la cola de logs"""
+
+    def test_politica_drop_descarta_y_cuenta(self):
+        """Test: Con la cola llena, 'drop' descarta INFO y los cuenta"""
+        handler = ColaLogsHandler(queue.Queue(maxsize=2), 'drop')
+        for i in range(5):
+            handler.handle(_registro(f'mensaje {i}'))
+
+        self.assertEqual(handler.queue.qsize(), 2)
+        self.assertEqual(handler.descartados, 3)
+
+    def test_politica_invalida(self):
+        """Test: Una política desconocida se rechaza"""
+        with self.assertRaises(ValueError):
+            ColaLogsHandler(queue.Queue(), 'ignorar')
+
+    def test_detener_vacia_la_cola(self):
+        """Test: Al detener, todos los registros encolados llegan al handler real"""
+        memoria = HandlerMemoria()
+        handler, listener = crear_logging_async([memoria], tamano_cola=10, politica='block')
+        for i in range(50):
+            handler.handle(_registro(f'mensaje {i}'))
+        detener_logging_async(listener)
+
+        self.assertEqual(memoria.mensajes, [f'mensaje {i}' for i in range(50)])
+        self.assertEqual(handler.descartados, 0)
+
+    def test_respeta_nivel_del_handler(self):
+        """Test: El listener respeta el nivel de cada handler real"""
+        memoria = HandlerMemoria()
+        memoria.setLevel(logging.ERROR)
+        handler, listener = crear_logging_async([memoria], tamano_cola=10)
+        handler.handle(_registro('info'))
+        handler.handle(_registro('error', logging.ERROR))
+        detener_logging_async(listener)
+
+        self.assertEqual(memoria.mensajes, ['error'])
+
+    def test_detener_dos_veces(self):
+        """Test: Detener un listener ya detenido no falla"""
+        _, listener = crear_logging_async([HandlerMemoria()], tamano_cola=1)
+        detener_logging_async(listener)
+        detener_logging_async(listener)
+        detener_logging_async(None)
+
+
+class TestConfiguracionPerezosa(unittest.TestCase):
+    """Tests de LoggerBase.get_logger() al importar"""
+
+    def test_importar_no_configura_logging(self):
+        """Test: Importar los DAO no crea handlers ni inicia hilos de logging"""
+        codigo = (
+            "import logging, threading\n"
+            "from src.dao.usuario_dao import UsuarioDao\n"
+            "from src.dao.async_usuario_dao import AsyncUsuarioDao\n"
+            "from src.utils.logger_base import LoggerBase\n"
+            "print(LoggerBase._instance is None, logging.getLogger('usuario_app').handlers,\n"
+            "      [hilo.name for hilo in threading.enumerate() if 'log' in hilo.name.lower()])\n"
+        )
+        raiz = os.path.join(os.path.dirname(__file__), '..')
+        salida = subprocess.run([sys.executable, '-c', codigo], cwd=raiz, capture_output=True,
+                                text=True, timeout=60, env={**os.environ, 'LOG_ASYNC': 'true'})
+        self.assertEqual(salida.stdout.strip(), 'True [] []', salida.stderr)
+
+    def test_dao_async_usa_loggers_hijos(self):
+        """Test: El DAO y el cursor asíncronos registran en usuario_app.dao/.database"""
+        from src.dao import async_usuario_dao
+        from src.database import conexion_async, cursor_async
+        self.assertEqual(async_usuario_dao.logger.name, 'usuario_app.dao')
+        self.assertEqual(cursor_async.logger.name, 'usuario_app.database')
+        self.assertEqual(conexion_async.logger.name, 'usuario_app.database')
+
+
+class TestLoggerBaseAsync(unittest.TestCase):
+    """Tests de LoggerBase con LOG_ASYNC=true"""
+
+    def test_consultas_lentas_por_la_cola(self):
+        """Test: El logger de consultas lentas también escribe a través de una cola"""
+        codigo = (
+            "import logging\n"
+            "from src.utils.logger_base import LoggerBase\n"
+            "LoggerBase().logger\n"
+            "lentas = logging.getLogger('usuario_app.consultas_lentas')\n"
+            "print([type(h).__name__ for h in lentas.handlers])\n"
+            "LoggerBase.detener_cola()\n"
+            "print([type(h).__name__ for h in lentas.handlers])\n"
+        )
+        raiz = os.path.join(os.path.dirname(__file__), '..')
+        salida = subprocess.run([sys.executable, '-c', codigo], cwd=raiz, capture_output=True,
+                                text=True, timeout=60, env={**os.environ, 'LOG_ASYNC': 'true'})
+        lineas = salida.stdout.strip().splitlines()
+        self.assertEqual(lineas[-2:], ["['ColaLogsHandler']", "['ArchivoLogRotativo']"], salida.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
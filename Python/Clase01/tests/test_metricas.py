@@ -0,0 +1,96 @@
+"""
+Tests unitarios para RegistroMetricas
+=====================================
+
+Valida histogramas, contadores, la exposición en texto y el servidor
+HTTP de métricas (no requiere base de datos)
+"""
+
+import unittest
+import urllib.request
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.metricas import Histograma, RegistroMetricas, ServidorMetricas
+
+
+class TestMetricas(unittest.TestCase):
+    """Tests del registro de métricas"""
+
+    def setUp(self):
+        self.activo_original = RegistroMetricas.activo
+        RegistroMetricas.activar()
+        RegistroMetricas.reiniciar()
+
+    def tearDown(self):
+        RegistroMetricas.reiniciar()
+        RegistroMetricas.activo = self.activo_original
+
+    def test_histograma_percentiles(self):
+        """Test: Los percentiles se estiman dentro del bucket correcto"""
+        histograma = Histograma(limites=(0.01, 0.1, 1.0))
+        for _ in range(98):
+            histograma.observar(0.005)
+        histograma.observar(0.5)
+        histograma.observar(0.5)
+
+        self.assertLessEqual(histograma.percentil(50), 0.01)
+        self.assertGreater(histograma.percentil(99), 0.1)
+        self.assertEqual(histograma.total, 100)
+        self.assertIsNone(Histograma().percentil(50))
+
+    def test_medir_por_sentencia_y_errores(self):
+        """Test: medir() registra la duración y cuenta los errores por etiqueta"""
+        with RegistroMetricas.medir('db_query_duration_seconds', statement='_CONTAR'):
+            pass
+        with self.assertRaises(RuntimeError):
+            with RegistroMetricas.medir('db_query_duration_seconds', statement='_CONTAR'):
+                raise RuntimeError('fallo')
+
+        histograma = RegistroMetricas.histograma('db_query_duration_seconds', statement='_CONTAR')
+        self.assertEqual(histograma.total, 2)
+        self.assertEqual(RegistroMetricas.contador('db_query_errors_total', statement='_CONTAR'), 1)
+        self.assertIsNone(RegistroMetricas.histograma('db_query_duration_seconds', statement='_ELIMINAR'))
+
+    def test_desactivado_no_registra(self):
+        """Test: Con el registro desactivado no se guarda nada"""
+        RegistroMetricas.desactivar()
+        RegistroMetricas.incrementar('db_commits_total')
+        RegistroMetricas.observar('db_pool_wait_seconds', 0.1)
+        RegistroMetricas.fijar('db_pool_connections_in_use', 2)
+        self.assertEqual(RegistroMetricas.instantanea(), {'histogramas': {}, 'contadores': {}, 'medidores': {}})
+
+    def test_exponer_formato_texto(self):
+        """Test: La exposición incluye TYPE, buckets acumulados, _sum y _count"""
+        RegistroMetricas.incrementar('db_rollbacks_total', motivo='excepcion')
+        RegistroMetricas.fijar('db_pool_connections_in_use', 2)
+        RegistroMetricas.observar('db_pool_wait_seconds', 0.002)
+        RegistroMetricas.observar('db_pool_wait_seconds', 20)
+        texto = RegistroMetricas.exponer()
+
+        self.assertIn('# TYPE db_rollbacks_total counter', texto)
+        self.assertIn('db_rollbacks_total{motivo="excepcion"} 1', texto)
+        self.assertIn('# TYPE db_pool_connections_in_use gauge', texto)
+        self.assertIn('db_pool_connections_in_use 2', texto)
+        self.assertIn('# TYPE db_pool_wait_seconds histogram', texto)
+        self.assertIn('db_pool_wait_seconds_bucket{le="0.0025"} 1', texto)
+        self.assertIn('db_pool_wait_seconds_bucket{le="+Inf"} 2', texto)
+        self.assertIn('db_pool_wait_seconds_count 2', texto)
+
+    def test_servidor_http(self):
+        """Test: GET /metrics responde con la exposición en texto"""
+        RegistroMetricas.incrementar('db_commits_total', 3)
+        direccion = ServidorMetricas.iniciar(puerto=0, host='127.0.0.1')
+        self.addCleanup(ServidorMetricas.detener)
+        self.assertIsNotNone(direccion)
+
+        with urllib.request.urlopen(f'http://{direccion[0]}:{direccion[1]}/metrics', timeout=5) as respuesta:
+            cuerpo = respuesta.read().decode('utf-8')
+        self.assertIn('db_commits_total 3', cuerpo)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
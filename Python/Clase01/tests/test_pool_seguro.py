@@ -0,0 +1,297 @@
+"""
+Tests unitarios para PoolConexionesSeguro
+=========================================
+
+Valida espera bloqueante, timeout, validación y reciclado de conexiones
+usando conexiones falsas (no requiere base de datos)
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from psycopg2 import pool
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+from src.database.conexion import Conexion
+from src.database.pool_seguro import PoolConexionesSeguro
+
+
+class _InfoFalsa:
+    def __init__(self):
+        self.transaction_status = TRANSACTION_STATUS_IDLE
+
+
+class _CursorFalso:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, sql, params=None):
+        if self._conn.rota:
+            raise Exception('conexión rota')
+
+
+class ConexionFalsa:
+    """Conexión mínima con la interfaz que usa el pool"""
+
+    def __init__(self):
+        self.closed = 0
+        self.rota = False
+        self.rollbacks = 0
+        self.info = _InfoFalsa()
+
+    def cursor(self):
+        return _CursorFalso(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def crear_pool(**kwargs) -> PoolConexionesSeguro:
+    """Crea un pool que abre ConexionFalsa en lugar de conectar a PostgreSQL"""
+    parametros = {'minconn': 1, 'maxconn': 2, 'timeout': 1.0, 'conectar': ConexionFalsa}
+    parametros.update(kwargs)
+    return PoolConexionesSeguro(**parametros)
+
+
+class TestPoolConexionesSeguro(unittest.TestCase):
+    """Tests unitarios del pool thread-safe"""
+
+    def test_abre_conexiones_minimas(self):
+        """Test: El pool abre minconn conexiones al crearse"""
+        p = crear_pool(minconn=2, maxconn=3)
+        self.assertEqual(p.total, 2)
+        self.assertEqual(p.ociosas, 2)
+
+    def test_reutiliza_conexion_devuelta(self):
+        """Test: Una conexión devuelta se reutiliza"""
+        p = crear_pool()
+        conn = p.getconn()
+        p.putconn(conn)
+        self.assertIs(p.getconn(), conn)
+
+    def test_timeout_si_pool_agotado(self):
+        """Test: getconn() falla con PoolError tras el timeout"""
+        p = crear_pool(maxconn=1, timeout=0.05)
+        p.getconn()
+        inicio = time.monotonic()
+        with self.assertRaises(pool.PoolError):
+            p.getconn()
+        self.assertGreaterEqual(time.monotonic() - inicio, 0.05)
+
+    def test_espera_hasta_que_se_libere(self):
+        """Test: getconn() bloquea hasta que otro hilo devuelve la conexión"""
+        p = crear_pool(maxconn=1, timeout=2.0)
+        conn = p.getconn()
+        obtenidas = []
+
+        hilo = threading.Thread(target=lambda: obtenidas.append(p.getconn()))
+        hilo.start()
+        time.sleep(0.05)
+        self.assertEqual(obtenidas, [])
+
+        p.putconn(conn)
+        hilo.join(1.0)
+        self.assertEqual(obtenidas, [conn])
+
+    def test_descarta_conexion_rota(self):
+        """Test: Una conexión ociosa que falla SELECT 1 se reemplaza"""
+        p = crear_pool(idle_check=0)
+        conn = p.getconn()
+        p.putconn(conn)
+        conn.rota = True
+
+        nueva = p.getconn()
+        self.assertIsNot(nueva, conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(p.total, 1)
+
+    def test_recicla_conexion_expirada(self):
+        """Test: Las conexiones que superan max_lifetime se cierran"""
+        p = crear_pool(max_lifetime=0.01)
+        conn = p.getconn()
+        time.sleep(0.02)
+        p.putconn(conn)
+
+        self.assertTrue(conn.closed)
+        self.assertEqual(p.total, 0)
+        self.assertIsNot(p.getconn(), conn)
+
+    def test_estadisticas(self):
+        """Test: estadisticas() refleja uso, creaciones, agotamientos y timeouts"""
+        p = crear_pool(minconn=1, maxconn=2, timeout=0.02)
+        primera = p.getconn()
+        p.getconn()
+        with self.assertRaises(pool.PoolError):
+            p.getconn()
+        p.putconn(primera)
+
+        stats = p.estadisticas()
+        self.assertEqual(stats['en_uso'], 1)
+        self.assertEqual(stats['ociosas'], 1)
+        self.assertEqual(stats['total'], 2)
+        self.assertEqual(stats['creadas_total'], 2)
+        self.assertEqual(stats['checkouts'], 2)
+        self.assertEqual(stats['veces_agotado'], 1)
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertIsNotNone(stats['espera_p99_ms'])
+        self.assertLessEqual(stats['edad_conexiones_s']['min'], stats['edad_conexiones_s']['max'])
+
+    def test_rollback_de_transaccion_abierta(self):
+        """Test: putconn() hace rollback si la conexión quedó en transacción"""
+        p = crear_pool()
+        conn = p.getconn()
+        conn.info.transaction_status = TRANSACTION_STATUS_INTRANS
+        p.putconn(conn)
+        self.assertEqual(conn.rollbacks, 1)
+        self.assertFalse(conn.closed)
+
+    def test_putconn_close(self):
+        """Test: putconn(close=True) cierra la conexión y libera el hueco"""
+        p = crear_pool(maxconn=1)
+        conn = p.getconn()
+        p.putconn(conn, close=True)
+        self.assertTrue(conn.closed)
+        self.assertEqual(p.total, 0)
+
+    def test_putconn_conexion_ajena(self):
+        """Test: Devolver una conexión ajena lanza PoolError"""
+        p = crear_pool()
+        with self.assertRaises(pool.PoolError):
+            p.putconn(ConexionFalsa())
+
+    def test_closeall(self):
+        """Test: closeall() cierra todo y rechaza nuevos checkouts"""
+        p = crear_pool(minconn=2)
+        conn = p.getconn()
+        p.closeall()
+        self.assertTrue(conn.closed)
+        with self.assertRaises(pool.PoolError):
+            p.getconn()
+
+    def test_concurrencia_no_supera_maximo(self):
+        """Test: Con muchos hilos nunca hay más de maxconn conexiones en uso"""
+        p = crear_pool(maxconn=3, timeout=5.0)
+        maximo = []
+        lock = threading.Lock()
+
+        def trabajar():
+            conn = p.getconn()
+            with lock:
+                maximo.append(p.en_uso)
+            time.sleep(0.005)
+            p.putconn(conn)
+
+        hilos = [threading.Thread(target=trabajar) for _ in range(20)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        self.assertLessEqual(max(maximo), 3)
+        self.assertLessEqual(p.total, 3)
+
+
+class TestCalentamientoPool(unittest.TestCase):
+    """Tests de la apertura en paralelo de conexiones (calentar)"""
+
+    def conectar_lento(self, espera=0.05, fallos=0):
+        """Conectar que tarda `espera` s (como un handshake) y falla las primeras `fallos` veces"""
+        lock = threading.Lock()
+        intentos = []
+        self.concurrentes = self.maximo_concurrentes = 0
+
+        def conectar(**kwargs):
+            with lock:
+                intentos.append(1)
+                fallar = len(intentos) <= fallos
+                self.concurrentes += 1
+                self.maximo_concurrentes = max(self.maximo_concurrentes, self.concurrentes)
+            time.sleep(espera)
+            with lock:
+                self.concurrentes -= 1
+            if fallar:
+                raise Exception('servidor no disponible')
+            return ConexionFalsa()
+        return conectar
+
+    def test_conexiones_iniciales_en_paralelo(self):
+        """Test: Las minconn conexiones iniciales se abren a la vez"""
+        p = crear_pool(minconn=4, maxconn=4, conectar=self.conectar_lento())
+        self.assertEqual(p.ociosas, 4)
+        self.assertEqual(self.maximo_concurrentes, 4)
+
+    def test_un_hilo_abre_de_a_una(self):
+        """Test: Con hilos_apertura=1 se conserva la apertura secuencial"""
+        crear_pool(minconn=3, maxconn=3, hilos_apertura=1, conectar=self.conectar_lento(0.01))
+        self.assertEqual(self.maximo_concurrentes, 1)
+
+    def test_calentar_hasta_la_cantidad(self):
+        """Test: calentar() abre solo las que faltan, sin superar maxconn"""
+        p = crear_pool(minconn=1, maxconn=5, conectar=self.conectar_lento(0.01))
+        self.assertEqual(p.calentar(3), 2)
+        self.assertEqual(p.calentar(3), 0)
+        self.assertEqual(p.calentar(10), 2)
+        self.assertEqual(p.total, 5)
+        self.assertEqual(p.ociosas, 5)
+
+    def test_calentar_con_fallos(self):
+        """Test: Si una apertura falla se lanza el error y las demás quedan en el pool"""
+        p = crear_pool(minconn=0, maxconn=4, conectar=self.conectar_lento(0.01, fallos=1))
+        with self.assertRaises(Exception):
+            p.calentar(4)
+        self.assertEqual(p.total, 3)
+        self.assertEqual(p.ociosas, 3)
+
+    def test_fallo_al_crear_cierra_las_abiertas(self):
+        """Test: Si falla una conexión inicial el constructor lanza el error sin dejar conexiones"""
+        with self.assertRaises(Exception):
+            crear_pool(minconn=3, maxconn=3, conectar=self.conectar_lento(0.01, fallos=1))
+
+
+class TestArranquePool(unittest.TestCase):
+    """Tests de Conexion.iniciar_pool() en modo eager y lazy"""
+
+    def setUp(self):
+        self.original = (Conexion._Pool_Pool, Conexion._ARRANQUE, Conexion._CALENTAR, Conexion._REPLICAS)
+        Conexion._REPLICAS = []
+
+    def tearDown(self):
+        Conexion._Pool_Pool, Conexion._ARRANQUE, Conexion._CALENTAR, Conexion._REPLICAS = self.original
+
+    def test_lazy_no_crea_el_pool(self):
+        """Test: En modo lazy no se crea el pool ni se abre ninguna conexión"""
+        Conexion._Pool_Pool = None
+        self.assertEqual(Conexion.iniciar_pool('lazy'), 'lazy')
+        self.assertIsNone(Conexion._Pool_Pool)
+
+    def test_eager_calienta_el_pool(self):
+        """Test: En modo eager se abren DB_POOL_WARMUP conexiones y se informa el modo"""
+        Conexion._Pool_Pool = crear_pool(minconn=0, maxconn=4)
+        Conexion._CALENTAR = 3
+        self.assertEqual(Conexion.iniciar_pool('eager'), 'eager')
+        self.assertEqual(Conexion._Pool_Pool.ociosas, 3)
+
+    def test_modo_desconocido(self):
+        """Test: Un modo desconocido se trata como eager"""
+        Conexion._Pool_Pool = crear_pool(minconn=0, maxconn=2)
+        self.assertEqual(Conexion.iniciar_pool('rapido'), 'eager')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,201 @@
+"""
+Tests unitarios para el enrutamiento a réplicas
+===============================================
+
+Valida la elección de réplica (round_robin / menos_ocupada), el respaldo
+en el primario y la lectura de lo propio tras escribir, con pools falsos.
+La prueba con dos instancias locales de PostgreSQL requiere TEST_DB y
+DB_REPLICA_HOSTS (p.ej. DB_REPLICA_HOSTS=localhost:5433)
+"""
+
+import os
+import sys
+import unittest
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from psycopg2 import pool
+from src.database import replicas
+from src.database.conexion import Conexion
+from src.database.resiliencia import Disyuntor
+from src.database.cursor_del_pool import CursorDelPool
+from src.database.replicas import SelectorReplicas, parsear_hosts
+from src.database.transaccion import Transaccion
+
+
+class CursorFalso:
+    def execute(self, sql, params=None):
+        pass
+
+    def close(self):
+        pass
+
+
+class ConexionFalsa:
+    closed = 0
+    autocommit = False
+
+    def __init__(self, origen):
+        self.origen = origen
+
+    def cursor(self, name=None):
+        return CursorFalso()
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class PoolFalso:
+    def __init__(self, nombre, disponible=True):
+        self.nombre = nombre
+        self.disponible = disponible
+        self.en_uso = 0
+        self._used = {}
+
+    def getconn(self):
+        if not self.disponible:
+            raise pool.PoolError('sin conexiones')
+        self.en_uso += 1
+        return ConexionFalsa(self.nombre)
+
+    def putconn(self, conexion, close=False):
+        assert conexion.origen == self.nombre, 'conexión devuelta a otro pool'
+        self.en_uso -= 1
+
+    def closeall(self):
+        pass
+
+
+class TestSelectorReplicas(unittest.TestCase):
+    """Tests de la elección de réplica"""
+
+    def test_parsear_hosts(self):
+        """Test: Los hosts sin puerto usan el puerto por defecto"""
+        self.assertEqual(parsear_hosts('r1:5433, r2 ,', '5432'), [('r1', '5433'), ('r2', '5432')])
+        self.assertEqual(parsear_hosts('', '5432'), [])
+
+    def test_round_robin(self):
+        """Test: round_robin rota la réplica elegida"""
+        selector = SelectorReplicas(['a', 'b', 'c'], 'round_robin')
+        primeros = [selector.candidatos()[0] for _ in range(4)]
+        self.assertEqual(primeros, ['a', 'b', 'c', 'a'])
+        self.assertEqual(sorted(selector.candidatos()), ['a', 'b', 'c'])
+
+    def test_menos_ocupada(self):
+        """Test: menos_ocupada elige la réplica con menos conexiones en uso"""
+        uso = {'a': 3, 'b': 1, 'c': 2}
+        selector = SelectorReplicas(['a', 'b', 'c'], 'menos_ocupada', uso.get)
+        self.assertEqual(selector.candidatos(), ['b', 'c', 'a'])
+
+    def test_estrategia_desconocida(self):
+        """Test: Una estrategia inválida se rechaza al configurar"""
+        with self.assertRaises(ValueError):
+            SelectorReplicas([], 'aleatoria')
+
+
+class TestEnrutamientoLecturas(unittest.TestCase):
+    """Tests de Conexion.obtenerConexionLectura() con pools falsos"""
+
+    def setUp(self):
+        self.original = (Conexion._Pool_Pool, Conexion._REPLICAS, Conexion._selector_replicas,
+                         Conexion._LEER_LO_PROPIO, Conexion._disyuntor)
+        # Circuito cerrado: otros tests sin BD pudieron abrir el del primario
+        Conexion._disyuntor = Disyuntor('primario')
+        self.primario = PoolFalso('primario')
+        self.replica1 = PoolFalso('replica1')
+        self.replica2 = PoolFalso('replica2')
+        Conexion._Pool_Pool = self.primario
+        Conexion._REPLICAS = [('replica1', '5433'), ('replica2', '5434')]
+        Conexion._selector_replicas = SelectorReplicas([self.replica1, self.replica2], 'round_robin')
+        Conexion._LEER_LO_PROPIO = 5
+        replicas._ultima_escritura.set(0.0)
+
+    def tearDown(self):
+        (Conexion._Pool_Pool, Conexion._REPLICAS, Conexion._selector_replicas,
+         Conexion._LEER_LO_PROPIO, Conexion._disyuntor) = self.original
+        Conexion._origen_replica.clear()
+        replicas._ultima_escritura.set(0.0)
+
+    def origen_lectura(self):
+        """Nombre del pool que entregó la conexión de una lectura"""
+        with CursorDelPool(lectura=True):
+            pools = list(Conexion._origen_replica.values())
+        return pools[0].nombre if pools else 'primario'
+
+    def test_lecturas_a_replicas_escrituras_al_primario(self):
+        """Test: Las lecturas rotan entre réplicas y las escrituras van al primario"""
+        self.assertEqual([self.origen_lectura() for _ in range(3)], ['replica1', 'replica2', 'replica1'])
+        self.assertEqual(Conexion._origen_replica, {})
+        self.assertEqual((self.replica1.en_uso, self.replica2.en_uso), (0, 0))
+
+        with CursorDelPool():
+            self.assertEqual(self.primario.en_uso, 1)
+        self.assertEqual(self.primario.en_uso, 0)
+
+    def test_leer_lo_propio(self):
+        """Test: Tras escribir, el mismo hilo lee del primario durante la ventana"""
+        with CursorDelPool():
+            pass
+        self.assertEqual(self.origen_lectura(), 'primario')
+
+        Conexion._LEER_LO_PROPIO = 0
+        self.assertEqual(self.origen_lectura(), 'replica1')
+
+    def test_lectura_no_cuenta_como_escritura(self):
+        """Test: Una lectura no activa la ventana de leer lo propio"""
+        self.origen_lectura()
+        self.assertEqual(self.origen_lectura(), 'replica2')
+
+    def test_respaldo_en_otra_replica_y_primario(self):
+        """Test: Si una réplica no entrega conexión se usa la siguiente y luego el primario"""
+        self.replica1.disponible = False
+        self.assertEqual(self.origen_lectura(), 'replica2')
+        self.replica2.disponible = False
+        self.assertEqual(self.origen_lectura(), 'primario')
+
+    def test_transaccion_usa_el_primario(self):
+        """Test: Dentro de una Transaccion las lecturas usan la conexión del primario"""
+        with Transaccion() as tx:
+            with CursorDelPool(lectura=True):
+                self.assertEqual(tx.conexion.origen, 'primario')
+                self.assertEqual(Conexion._origen_replica, {})
+        # Sin cursores de escritura la transacción no fija las lecturas al primario
+        self.assertEqual(self.origen_lectura(), 'replica1')
+
+        with Transaccion():
+            with CursorDelPool():
+                pass
+        self.assertEqual(self.origen_lectura(), 'primario')
+
+
+class TestReplicasReales(unittest.TestCase):
+    """Prueba con un primario y una réplica locales (dos instancias de PostgreSQL)"""
+
+    @unittest.skipUnless(os.getenv('TEST_DB', False) and os.getenv('DB_REPLICA_HOSTS'),
+                         "Requiere base de datos y DB_REPLICA_HOSTS")
+    def test_lectura_en_la_instancia_replica(self):
+        """Test: Las lecturas se ejecutan en el puerto de la réplica y las escrituras en el primario"""
+        replicas._ultima_escritura.set(0.0)
+        puerto_replica = Conexion._REPLICAS[0][1]
+
+        def puerto(lectura):
+            with CursorDelPool(lectura=lectura) as cursor:
+                if cursor is None:
+                    self.skipTest("Base de datos no disponible")
+                cursor.execute("SELECT current_setting('port')")
+                return cursor.fetchone()[0]
+
+        if len(Conexion._REPLICAS) == 1:
+            self.assertEqual(puerto(lectura=True), puerto_replica)
+        self.assertEqual(puerto(lectura=False), Conexion._DB_PORT)
+        # Recién escrito: la lectura vuelve al primario
+        if Conexion._LEER_LO_PROPIO > 0:
+            self.assertEqual(puerto(lectura=True), Conexion._DB_PORT)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
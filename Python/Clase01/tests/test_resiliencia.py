@@ -0,0 +1,283 @@
+"""
+Tests unitarios para Reintentos y Disyuntor
+===========================================
+
+Valida la clasificación de errores por SQLSTATE, los reintentos con
+espera, el ciclo del disyuntor (con un reloj falso) y el descarte de
+conexiones rotas al devolverlas al pool
+"""
+
+import os
+import sys
+import unittest
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from psycopg2 import DatabaseError, InterfaceError, OperationalError
+from src.dao.usuario_dao import UsuarioDao
+from src.database.conexion import Conexion
+from src.database.resiliencia import (Disyuntor, PoliticaReintentos,
+                                      es_conexion_rota, es_error_transitorio)
+from src.models.usuario import Usuario
+
+
+def error_con_codigo(clase, pgcode):
+    """Instancia de `clase` con el SQLSTATE indicado (pgcode es de solo lectura)"""
+    return type(clase.__name__, (clase,), {'pgcode': pgcode})('error simulado')
+
+
+class Reloj:
+    def __init__(self):
+        self.ahora = 100.0
+
+    def __call__(self):
+        return self.ahora
+
+
+class ConexionFalsa:
+    def __init__(self, closed=0):
+        self.closed = closed
+
+
+class PoolFalso:
+    def __init__(self):
+        self.devueltas = []
+
+    def putconn(self, conexion, close=False):
+        self.devueltas.append(close)
+
+
+class CursorFalso:
+    def __init__(self, conexion):
+        self.connection = conexion
+
+    def execute(self, sql, params=None):
+        pass
+
+    def fetchone(self):
+        return Usuario(7, 'ana', 'hash', 'ana@example.com')
+
+    def close(self):
+        pass
+
+
+class ConexionConCursor(ConexionFalsa):
+    autocommit = False
+
+    def cursor(self, name=None, cursor_factory=None):
+        return CursorFalso(self)
+
+
+class PoolReiniciando:
+    """Pool cuyo primer getconn() falla como un servidor que está reiniciando"""
+
+    def __init__(self, fallos=1):
+        self.fallos = fallos
+        self.intentos = 0
+
+    def getconn(self):
+        self.intentos += 1
+        if self.intentos <= self.fallos:
+            raise OperationalError('server closed the connection unexpectedly')
+        return ConexionConCursor()
+
+    def putconn(self, conexion, close=False):
+        pass
+
+
+class TestClasificacionErrores(unittest.TestCase):
+    """Tests de es_conexion_rota() y es_error_transitorio()"""
+
+    def test_conexion_rota(self):
+        """Test: Clase 08, apagado del servidor y errores del cliente rompen la conexión"""
+        self.assertTrue(es_conexion_rota(InterfaceError('connection already closed')))
+        self.assertTrue(es_conexion_rota(OperationalError('server closed the connection')))
+        self.assertTrue(es_conexion_rota(error_con_codigo(OperationalError, '08006')))
+        self.assertTrue(es_conexion_rota(error_con_codigo(OperationalError, '57P01')))
+
+    def test_errores_que_no_rompen_la_conexion(self):
+        """Test: Timeouts, deadlocks y errores de datos dejan la conexión usable"""
+        self.assertFalse(es_conexion_rota(error_con_codigo(OperationalError, '57014')))
+        self.assertFalse(es_conexion_rota(error_con_codigo(OperationalError, '40P01')))
+        self.assertFalse(es_conexion_rota(DatabaseError('otro error')))
+        self.assertFalse(es_conexion_rota(ValueError('no es de la BD')))
+
+    def test_errores_transitorios(self):
+        """Test: Serialización y deadlock se reintentan; un timeout no"""
+        self.assertTrue(es_error_transitorio(error_con_codigo(OperationalError, '40001')))
+        self.assertTrue(es_error_transitorio(error_con_codigo(OperationalError, '40P01')))
+        self.assertTrue(es_error_transitorio(error_con_codigo(OperationalError, '08003')))
+        self.assertFalse(es_error_transitorio(error_con_codigo(OperationalError, '57014')))
+        self.assertFalse(es_error_transitorio(ValueError('no es de la BD')))
+
+
+class TestPoliticaReintentos(unittest.TestCase):
+    """Tests de PoliticaReintentos.ejecutar()"""
+
+    def setUp(self):
+        self.esperas = []
+        self.politica = PoliticaReintentos(3, 0.1, 2.0, dormir=self.esperas.append)
+
+    def operacion_que_falla(self, fallos, error):
+        """Operación que lanza `error` las primeras `fallos` veces"""
+        llamadas = []
+
+        def operacion():
+            llamadas.append(1)
+            if len(llamadas) <= fallos:
+                raise error
+            return 'ok'
+        return operacion, llamadas
+
+    def test_reintenta_errores_transitorios(self):
+        """Test: Un error transitorio se reintenta con espera hasta tener éxito"""
+        operacion, llamadas = self.operacion_que_falla(2, OperationalError('conexión perdida'))
+        self.assertEqual(self.politica.ejecutar(operacion, 'test'), 'ok')
+        self.assertEqual(len(llamadas), 3)
+        self.assertEqual(len(self.esperas), 2)
+        self.assertTrue(0 <= self.esperas[0] <= 0.1)
+        self.assertTrue(0 <= self.esperas[1] <= 0.2)
+
+    def test_no_reintenta_otros_errores(self):
+        """Test: Un error no transitorio se propaga sin reintentar"""
+        operacion, llamadas = self.operacion_que_falla(1, error_con_codigo(OperationalError, '57014'))
+        with self.assertRaises(OperationalError):
+            self.politica.ejecutar(operacion, 'test')
+        self.assertEqual(len(llamadas), 1)
+        self.assertEqual(self.esperas, [])
+
+    def test_agota_los_intentos(self):
+        """Test: Tras `intentos` fallos se propaga el último error"""
+        operacion, llamadas = self.operacion_que_falla(10, OperationalError('conexión perdida'))
+        with self.assertRaises(OperationalError):
+            self.politica.ejecutar(operacion, 'test')
+        self.assertEqual(len(llamadas), 3)
+
+    def test_no_reintentable(self):
+        """Test: Con reintentable() False (p.ej. en una transacción) no se reintenta"""
+        operacion, llamadas = self.operacion_que_falla(1, OperationalError('conexión perdida'))
+        with self.assertRaises(OperationalError):
+            self.politica.ejecutar(operacion, 'test', reintentable=lambda: False)
+        self.assertEqual(len(llamadas), 1)
+
+    def test_espera_con_tope(self):
+        """Test: La espera crece exponencialmente pero no supera espera_maxima"""
+        for intento in range(1, 12):
+            self.assertLessEqual(self.politica.espera(intento), 2.0)
+
+
+class TestDisyuntor(unittest.TestCase):
+    """Tests del ciclo cerrado -> abierto -> semiabierto -> cerrado"""
+
+    def setUp(self):
+        self.reloj = Reloj()
+        self.disyuntor = Disyuntor('test', umbral=3, tiempo_abierto=10, reloj=self.reloj)
+
+    def abrir(self):
+        for _ in range(3):
+            self.disyuntor.registrar_fallo()
+
+    def test_se_abre_tras_umbral_fallos(self):
+        """Test: Se abre tras `umbral` fallos seguidos y rechaza conexiones"""
+        self.disyuntor.registrar_fallo()
+        self.disyuntor.registrar_fallo()
+        self.assertTrue(self.disyuntor.permitir())
+        self.disyuntor.registrar_fallo()
+        self.assertEqual(self.disyuntor.estado, Disyuntor.ABIERTO)
+        self.assertFalse(self.disyuntor.permitir())
+
+    def test_un_exito_reinicia_la_cuenta(self):
+        """Test: Los fallos deben ser seguidos para abrir el circuito"""
+        self.disyuntor.registrar_fallo()
+        self.disyuntor.registrar_fallo()
+        self.disyuntor.registrar_exito()
+        self.disyuntor.registrar_fallo()
+        self.assertEqual(self.disyuntor.estado, Disyuntor.CERRADO)
+
+    def test_semiabierto_deja_pasar_una_prueba(self):
+        """Test: Pasado tiempo_abierto pasa una sola prueba; su éxito cierra el circuito"""
+        self.abrir()
+        self.reloj.ahora += 10
+        self.assertEqual(self.disyuntor.estado, Disyuntor.SEMIABIERTO)
+        self.assertTrue(self.disyuntor.permitir())
+        self.assertFalse(self.disyuntor.permitir())
+        self.disyuntor.registrar_exito()
+        self.assertEqual(self.disyuntor.estado, Disyuntor.CERRADO)
+        self.assertTrue(self.disyuntor.permitir())
+
+    def test_prueba_fallida_reabre(self):
+        """Test: Si la prueba falla el circuito vuelve a abrirse por tiempo_abierto"""
+        self.abrir()
+        self.reloj.ahora += 10
+        self.assertTrue(self.disyuntor.permitir())
+        self.disyuntor.registrar_fallo()
+        self.assertEqual(self.disyuntor.estado, Disyuntor.ABIERTO)
+        self.reloj.ahora += 5
+        self.assertFalse(self.disyuntor.permitir())
+
+    def test_desactivado(self):
+        """Test: Con umbral 0 nunca se abre"""
+        disyuntor = Disyuntor('test', umbral=0, reloj=self.reloj)
+        for _ in range(100):
+            disyuntor.registrar_fallo()
+        self.assertTrue(disyuntor.permitir())
+
+
+class TestDescarteConexiones(unittest.TestCase):
+    """Tests de Conexion.liberarConexion() con conexiones rotas"""
+
+    def setUp(self):
+        self.original = (Conexion._Pool_Pool, Conexion._disyuntor)
+        self.pool = PoolFalso()
+        Conexion._Pool_Pool = self.pool
+        Conexion._disyuntor = Disyuntor('primario', umbral=2)
+
+    def tearDown(self):
+        Conexion._Pool_Pool, Conexion._disyuntor = self.original
+
+    def test_conexion_cerrada_se_descarta(self):
+        """Test: Una conexión cerrada se cierra en el pool y cuenta como fallo"""
+        Conexion.liberarConexion(ConexionFalsa(closed=2))
+        Conexion.liberarConexion(ConexionFalsa(), descartar=True)
+        self.assertEqual(self.pool.devueltas, [True, True])
+        self.assertEqual(Conexion._disyuntor.estado, Disyuntor.ABIERTO)
+
+    def test_conexion_sana_vuelve_al_pool(self):
+        """Test: Una conexión sana vuelve al pool y cierra el circuito"""
+        Conexion._disyuntor.registrar_fallo()
+        Conexion.liberarConexion(ConexionFalsa())
+        Conexion._disyuntor.registrar_fallo()
+        self.assertEqual(self.pool.devueltas, [False])
+        self.assertEqual(Conexion._disyuntor.estado, Disyuntor.CERRADO)
+
+
+class TestReintentoAlConectar(unittest.TestCase):
+    """Tests de reintentos cuando falla la apertura de la conexión"""
+
+    def setUp(self):
+        self.original = (Conexion._Pool_Pool, Conexion._disyuntor, Conexion._REPLICAS, UsuarioDao._reintentos)
+        Conexion._disyuntor = Disyuntor('primario')
+        Conexion._REPLICAS = []
+        UsuarioDao._reintentos = PoliticaReintentos(3, dormir=lambda segundos: None)
+
+    def tearDown(self):
+        (Conexion._Pool_Pool, Conexion._disyuntor, Conexion._REPLICAS, UsuarioDao._reintentos) = self.original
+
+    def test_reintenta_si_falla_getconn(self):
+        """Test: Si el primer getconn() falla con OperationalError el DAO reintenta"""
+        Conexion._Pool_Pool = PoolReiniciando(fallos=1)
+        usuario = UsuarioDao.seleccionar_por_id(7)
+        self.assertIsNotNone(usuario)
+        self.assertEqual(usuario.username, 'ana')
+        self.assertEqual(Conexion._Pool_Pool.intentos, 2)
+
+    def test_agota_reintentos_y_retorna_none(self):
+        """Test: Si el servidor no vuelve el DAO retorna su valor por defecto"""
+        Conexion._Pool_Pool = PoolReiniciando(fallos=10)
+        self.assertIsNone(UsuarioDao.seleccionar_por_id(7))
+        self.assertEqual(Conexion._Pool_Pool.intentos, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
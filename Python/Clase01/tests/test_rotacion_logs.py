@@ -0,0 +1,107 @@
+"""
+Tests unitarios para ArchivoLogRotativo
+=======================================
+
+Valida la rotación por tamaño, la compresión en segundo plano y la
+retención de archivos rotados (usa un directorio temporal)
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import sys
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.rotacion_logs import ArchivoLogRotativo, TareasRotacion
+
+
+class TestRotacionLogs(unittest.TestCase):
+    """Tests de rotación, compresión y retención"""
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        self.ruta = os.path.join(self.directorio, 'app.log')
+        self.handlers = []
+
+    def tearDown(self):
+        for handler in self.handlers:
+            handler.close()
+        TareasRotacion.esperar()
+        shutil.rmtree(self.directorio, ignore_errors=True)
+
+    def _crear_logger(self, **kwargs) -> logging.Logger:
+        handler = ArchivoLogRotativo(self.ruta, **kwargs)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self.handlers.append(handler)
+        logger = logging.getLogger(f'test_rotacion_{id(handler)}')
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+        return logger
+
+    def _rotados(self) -> list:
+        return sorted(nombre for nombre in os.listdir(self.directorio) if nombre != 'app.log')
+
+    def test_rotacion_por_tamano_comprime(self):
+        """Test: Al superar max_bytes se rota y el archivo queda en .gz"""
+        logger = self._crear_logger(max_bytes=100, comprimir=True)
+        for i in range(10):
+            logger.info('registro %02d %s', i, 'x' * 40)
+        self.assertTrue(TareasRotacion.esperar())
+
+        rotados = self._rotados()
+        self.assertGreater(len(rotados), 1)
+        self.assertTrue(all(nombre.endswith('.gz') for nombre in rotados))
+        # Los nombres del mismo día no se pisan
+        self.assertEqual(len(rotados), len(set(rotados)))
+
+        with gzip.open(os.path.join(self.directorio, rotados[0]), 'rt', encoding='utf-8') as archivo:
+            self.assertIn('registro', archivo.read())
+
+    def test_sin_perdida_de_registros(self):
+        """Test: Entre el archivo activo y los rotados están todos los registros"""
+        logger = self._crear_logger(max_bytes=200, comprimir=False)
+        for i in range(30):
+            logger.info('registro %02d', i)
+        TareasRotacion.esperar()
+
+        lineas = []
+        for nombre in self._rotados() + ['app.log']:
+            with open(os.path.join(self.directorio, nombre), encoding='utf-8') as archivo:
+                lineas.extend(archivo.read().split())
+        self.assertEqual(lineas.count('registro'), 30)
+
+    def test_retencion_por_cantidad(self):
+        """Test: Solo se conservan retencion_archivos archivos rotados"""
+        logger = self._crear_logger(max_bytes=50, retencion_archivos=2, comprimir=True)
+        for i in range(20):
+            logger.info('registro %02d %s', i, 'y' * 40)
+        TareasRotacion.esperar()
+
+        self.assertEqual(len(self._rotados()), 2)
+
+    def test_retencion_por_antiguedad(self):
+        """Test: Los archivos rotados más viejos que retencion_dias se eliminan"""
+        viejo = self.ruta + '.2000-01-01.gz'
+        with open(viejo, 'wb'):
+            pass
+        hace_un_anio = time.time() - 365 * 86400
+        os.utime(viejo, (hace_un_anio, hace_un_anio))
+
+        logger = self._crear_logger(max_bytes=10, retencion_dias=30, comprimir=False)
+        logger.info('primer registro del archivo')
+        logger.info('segundo')
+        TareasRotacion.esperar()
+
+        self.assertFalse(os.path.exists(viejo))
+        self.assertEqual(len(self._rotados()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,79 @@
+"""
+Tests unitarios para SentenciasPreparadas
+=========================================
+
+Valida la conversión de parámetros y el flujo PREPARE/EXECUTE por
+conexión usando un cursor falso (no requiere base de datos)
+"""
+
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database.sentencias_preparadas import SentenciasPreparadas
+from src.dao.usuario_dao import UsuarioDao
+
+
+class _ConexionFalsa:
+    def __init__(self):
+        self.sentencias_preparadas = set()
+
+
+class _CursorFalso:
+    def __init__(self, conexion):
+        self.connection = conexion
+        self.ejecutadas = []
+
+    def execute(self, sql, params=None):
+        self.ejecutadas.append((sql, params))
+
+
+class TestSentenciasPreparadas(unittest.TestCase):
+    """Tests del modo PREPARE/EXECUTE"""
+
+    def setUp(self):
+        self.activo_original = SentenciasPreparadas.activo
+        SentenciasPreparadas.activar()
+
+    def tearDown(self):
+        SentenciasPreparadas.activo = self.activo_original
+
+    def test_convertir_placeholders(self):
+        """Test: %s se numeran como $1, $2, ..."""
+        sql = SentenciasPreparadas.convertir_placeholders(UsuarioDao._ACTUALIZAR)
+        self.assertIn('username=$1, password=CASE WHEN password=$2 THEN password ELSE $3 END, email=$4', sql)
+        self.assertIn('id_usuario=$5', sql)
+        self.assertNotIn('%s', sql)
+
+    def test_prepara_una_vez_por_conexion(self):
+        """Test: La primera llamada hace PREPARE; las siguientes solo EXECUTE"""
+        cursor = _CursorFalso(_ConexionFalsa())
+        for id_usuario in (1, 2):
+            SentenciasPreparadas.ejecutar(cursor, 'por_id', UsuarioDao._SELECCIONAR_POR_ID, (id_usuario,))
+
+        sentencias = [sql for sql, _ in cursor.ejecutadas]
+        self.assertTrue(sentencias[0].startswith('PREPARE por_id AS'))
+        self.assertEqual(sentencias[1:], ['EXECUTE por_id (%s)', 'EXECUTE por_id (%s)'])
+        self.assertEqual(cursor.ejecutadas[2][1], (2,))
+
+    def test_conexion_nueva_vuelve_a_preparar(self):
+        """Test: Una conexión reciclada (nueva) prepara de nuevo"""
+        for _ in range(2):
+            cursor = _CursorFalso(_ConexionFalsa())
+            SentenciasPreparadas.ejecutar(cursor, 'contar', UsuarioDao._CONTAR)
+            self.assertEqual(cursor.ejecutadas[0][0], f'PREPARE contar AS {UsuarioDao._CONTAR}')
+            self.assertEqual(cursor.ejecutadas[1], ('EXECUTE contar', None))
+
+    def test_modo_desactivado_ejecuta_directo(self):
+        """Test: Con el modo desactivado se ejecuta la sentencia original"""
+        SentenciasPreparadas.desactivar()
+        cursor = _CursorFalso(_ConexionFalsa())
+        SentenciasPreparadas.ejecutar(cursor, 'eliminar', UsuarioDao._ELIMINAR, (5,))
+        self.assertEqual(cursor.ejecutadas, [(UsuarioDao._ELIMINAR, (5,))])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
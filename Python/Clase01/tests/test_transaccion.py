@@ -0,0 +1,303 @@
+"""
+Tests unitarios para Transaccion
+================================
+
+Valida que varias operaciones dentro de una Transaccion comparten una
+conexión con un único commit, el rollback ante errores y el aislamiento
+entre hilos (con un pool falso: no requiere base de datos)
+"""
+
+import threading
+import unittest
+import sys
+import os
+
+# Agregar src al path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from psycopg2 import errors
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from src.dao.usuario_dao import UsuarioDao
+from src.database.conexion import Conexion
+from src.database.resiliencia import Disyuntor
+from src.database.cursor_del_pool import CursorDelPool
+from src.database.replicas import _ultima_escritura, escritura_reciente
+from src.database.transaccion import Transaccion
+
+
+class CursorFalso:
+    def __init__(self):
+        self.ejecutadas = []
+
+    def execute(self, sql, params=None):
+        self.ejecutadas.append(sql)
+
+    def close(self):
+        pass
+
+
+class InfoFalsa:
+    transaction_status = TRANSACTION_STATUS_IDLE
+
+
+class ConexionFalsa:
+    closed = 0
+    info = InfoFalsa()
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+        self.autocommit = False
+        self.readonly = None
+        self.modos = []
+
+    def cursor(self, name=None):
+        # Modo de la sesión al crear cada cursor: (autocommit, readonly)
+        self.modos.append((self.autocommit, self.readonly))
+        return CursorFalso()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class PoolFalso:
+    def __init__(self):
+        self.entregadas = []
+        self.devueltas = 0
+
+    def getconn(self):
+        conexion = ConexionFalsa()
+        self.entregadas.append(conexion)
+        return conexion
+
+    def putconn(self, conexion, close=False):
+        self.devueltas += 1
+
+
+class TestTransaccion(unittest.TestCase):
+    """Tests de la unidad de trabajo"""
+
+    def setUp(self):
+        self.pool_original = (Conexion._Pool_Pool, Conexion._disyuntor)
+        self.pool = PoolFalso()
+        Conexion._Pool_Pool = self.pool
+        # Circuito cerrado: otros tests sin BD pudieron abrir el del primario
+        Conexion._disyuntor = Disyuntor('primario')
+
+    def tearDown(self):
+        Conexion._Pool_Pool, Conexion._disyuntor = self.pool_original
+
+    def test_una_conexion_y_un_commit(self):
+        """Test: Dos cursores dentro de la transacción usan una conexión y un commit"""
+        with Transaccion() as tx:
+            with CursorDelPool() as cursor:
+                cursor.execute('SELECT 1')
+            with CursorDelPool() as cursor:
+                cursor.execute('UPDATE usuario SET email = %s')
+            self.assertEqual(self.pool.devueltas, 0)
+
+        self.assertTrue(tx.confirmada)
+        self.assertEqual(len(self.pool.entregadas), 1)
+        self.assertEqual(self.pool.devueltas, 1)
+        self.assertEqual(self.pool.entregadas[0].commits, 1)
+        self.assertIsNone(Transaccion.actual())
+
+    def test_sin_transaccion_commit_por_cursor(self):
+        """Test: Fuera de una transacción cada cursor hace su propio commit"""
+        for _ in range(2):
+            with CursorDelPool() as cursor:
+                cursor.execute('SELECT 1')
+        self.assertEqual(len(self.pool.entregadas), 2)
+        self.assertEqual([c.commits for c in self.pool.entregadas], [1, 1])
+
+    def test_error_capturado_hace_rollback(self):
+        """Test: Un error dentro de un cursor hace rollback aunque se capture"""
+        with Transaccion() as tx:
+            with CursorDelPool() as cursor:
+                cursor.execute('INSERT INTO usuario VALUES (%s)')
+            try:
+                with CursorDelPool():
+                    raise ValueError('restricción violada')
+            except ValueError:
+                pass
+
+        conexion = self.pool.entregadas[0]
+        self.assertFalse(tx.confirmada)
+        self.assertEqual((conexion.commits, conexion.rollbacks), (0, 1))
+        self.assertEqual(self.pool.devueltas, 1)
+
+    def test_transaccion_anidada_se_une(self):
+        """Test: Una transacción anidada se une a la externa"""
+        with Transaccion() as externa:
+            with Transaccion() as interna:
+                self.assertIs(interna, externa)
+                with CursorDelPool() as cursor:
+                    cursor.execute('SELECT 1')
+            self.assertEqual(self.pool.entregadas[0].commits, 0)
+        self.assertEqual(self.pool.entregadas[0].commits, 1)
+        self.assertEqual(len(self.pool.entregadas), 1)
+
+    def test_otro_hilo_no_ve_la_transaccion(self):
+        """Test: La transacción es del hilo actual; otro hilo usa su propia conexión"""
+        vista = []
+
+        def trabajar():
+            vista.append(Transaccion.actual())
+            with CursorDelPool() as cursor:
+                cursor.execute('SELECT 1')
+
+        with Transaccion():
+            hilo = threading.Thread(target=trabajar)
+            hilo.start()
+            hilo.join()
+
+        self.assertEqual(vista, [None])
+        self.assertEqual(len(self.pool.entregadas), 2)
+        self.assertEqual([c.commits for c in self.pool.entregadas], [1, 1])
+
+    def test_al_confirmar_despues_del_commit(self):
+        """Test: Las acciones registradas se ejecutan solo si hubo commit"""
+        ejecutadas = []
+        with Transaccion() as tx:
+            tx.al_confirmar(lambda: ejecutadas.append(self.pool.entregadas[0].commits))
+            self.assertEqual(ejecutadas, [])
+        self.assertEqual(ejecutadas, [1])
+
+        with self.assertRaises(RuntimeError):
+            with Transaccion() as tx:
+                tx.al_confirmar(lambda: ejecutadas.append('no'))
+                raise RuntimeError('fallo')
+        self.assertEqual(ejecutadas, [1])
+
+    def test_solo_lecturas_no_registra_escritura(self):
+        """Test: Solo una transacción con cursores de escritura fija las lecturas al primario"""
+        token = _ultima_escritura.set(0.0)
+        try:
+            with Transaccion():
+                with CursorDelPool(lectura=True) as cursor:
+                    cursor.execute('SELECT 1')
+            self.assertFalse(escritura_reciente(60))
+
+            with Transaccion():
+                with CursorDelPool() as cursor:
+                    cursor.execute('UPDATE usuario SET email = %s')
+            self.assertTrue(escritura_reciente(60))
+        finally:
+            _ultima_escritura.reset(token)
+
+    def test_conteo_fallido_no_recurre_a_count(self):
+        """Test: Si el conteo 'contador' aborta la transacción no se ejecuta COUNT(*)"""
+        ejecutadas = []
+
+        class CursorSinConteo(CursorFalso):
+            connection = None
+
+            def execute(self, sql, params=None):
+                ejecutadas.append(sql)
+                if 'usuario_conteo' in sql:
+                    raise errors.UndefinedTable('no existe la relación usuario_conteo')
+
+        class ConexionSinConteo(ConexionFalsa):
+            def cursor(self, name=None):
+                return CursorSinConteo()
+
+        self.pool.getconn = ConexionSinConteo
+        with Transaccion() as tx:
+            self.assertEqual(UsuarioDao.contar_usuarios('contador'), 0)
+
+        self.assertFalse(tx.confirmada)
+        self.assertTrue(ejecutadas)
+        self.assertFalse(any('COUNT(*)' in sql for sql in ejecutadas))
+    def test_sin_tabla_contador_avisa_una_vez(self):
+        """Test: Sin usuario_conteo se usa COUNT(*) y el WARNING sale una sola vez"""
+        class CursorSinConteo(CursorFalso):
+            connection = None
+
+            def execute(self, sql, params=None):
+                super().execute(sql, params)
+                if 'usuario_conteo' in sql:
+                    raise errors.UndefinedTable('no existe la relación usuario_conteo')
+
+            def fetchone(self):
+                return (5,)
+
+        class ConexionSinConteo(ConexionFalsa):
+            def cursor(self, name=None):
+                return CursorSinConteo()
+
+        self.pool.getconn = ConexionSinConteo
+        UsuarioDao._conteos_no_disponibles.discard('contador')
+        with self.assertLogs('usuario_app.dao', 'WARNING') as avisos:
+            self.assertEqual(UsuarioDao.contar_usuarios('contador'), 5)
+            self.assertEqual(UsuarioDao.contar_usuarios('contador'), 5)
+        UsuarioDao._conteos_no_disponibles.discard('contador')
+
+        self.assertEqual(len([aviso for aviso in avisos.output if 'usuario_conteo' in aviso]), 1)
+
+
+class TestCursorSoloLectura(unittest.TestCase):
+    """Tests del modo de solo lectura de CursorDelPool"""
+
+    def setUp(self):
+        self.pool_original = (Conexion._Pool_Pool, Conexion._disyuntor)
+        self.replicas_original = Conexion._selector_replicas
+        self.pool = PoolFalso()
+        Conexion._Pool_Pool = self.pool
+        Conexion._disyuntor = Disyuntor('primario')
+        Conexion._selector_replicas = None
+
+    def tearDown(self):
+        Conexion._Pool_Pool, Conexion._disyuntor = self.pool_original
+        Conexion._selector_replicas = self.replicas_original
+
+    def test_lectura_sin_commit_en_autocommit(self):
+        """Test: Un cursor de lectura trabaja en autocommit y no hace commit"""
+        with CursorDelPool(lectura=True) as cursor:
+            cursor.execute('SELECT 1')
+        with CursorDelPool(solo_lectura=True) as cursor:
+            cursor.execute('SELECT 1')
+
+        for conexion in self.pool.entregadas:
+            self.assertEqual(conexion.modos, [(True, None)])
+            self.assertEqual((conexion.commits, conexion.rollbacks), (0, 0))
+            # Vuelve al pool en modo transaccional
+            self.assertFalse(conexion.autocommit)
+        self.assertEqual(self.pool.devueltas, 2)
+
+    def test_error_en_lectura_sin_rollback(self):
+        """Test: Un error en un cursor de lectura no necesita rollback"""
+        with self.assertRaises(ValueError):
+            with CursorDelPool(lectura=True):
+                raise ValueError('consulta inválida')
+
+        conexion = self.pool.entregadas[0]
+        self.assertEqual(conexion.rollbacks, 0)
+        self.assertFalse(conexion.autocommit)
+        self.assertEqual(self.pool.devueltas, 1)
+
+    def test_cursor_con_nombre_read_only(self):
+        """Test: Un cursor con nombre de lectura usa BEGIN READ ONLY y cierra con commit"""
+        with CursorDelPool(nombre='recorrido', lectura=True) as cursor:
+            cursor.execute('SELECT 1')
+
+        conexion = self.pool.entregadas[0]
+        self.assertEqual(conexion.modos, [(False, True)])
+        self.assertEqual(conexion.commits, 1)
+        self.assertIsNone(conexion.readonly)
+
+    def test_lectura_dentro_de_transaccion(self):
+        """Test: Dentro de una transacción la lectura usa su conexión sin cambiar el modo"""
+        with Transaccion():
+            with CursorDelPool(lectura=True) as cursor:
+                cursor.execute('SELECT 1')
+
+        conexion = self.pool.entregadas[0]
+        self.assertEqual(conexion.modos, [(False, None)])
+        self.assertEqual(conexion.commits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
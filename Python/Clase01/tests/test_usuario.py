@@ -165,6 +165,13 @@ class TestUsuarioUnitario(unittest.TestCase):
         # Verificar que se crean sin errores
         self.assertEqual(usuario_largo.username, username_largo)
         self.assertEqual(usuario_email_largo.email, email_largo)
+    
+    def test_slots_sin_dict(self):
+        """Test: Usuario usa __slots__ y no admite atributos fuera del modelo"""
+        usuario = Usuario(1, "admin", "admin123", "admin@test.com")
+        self.assertFalse(hasattr(usuario, '__dict__'))
+        with self.assertRaises(AttributeError):
+            usuario.telefono = "123"
 
 if __name__ == "__main__":
     print("🧪 TESTS UNITARIOS - CLASE USUARIO")